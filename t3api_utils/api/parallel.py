@@ -7,85 +7,287 @@ batching features.
 from __future__ import annotations
 
 import asyncio
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import (Any, Awaitable, Callable, Dict, List, Optional, TypeVar,
-                    Union, cast)
+from itertools import chain
+from typing import (Any, AsyncIterator, Awaitable, Callable, Dict, List,
+                    Optional, Tuple, TypeVar, Union, cast)
+
+try:  # uvloop is optional; its libuv-based loop dispatches I/O faster
+    import uvloop
+    _LOOP_FACTORY: Optional[Callable[[], asyncio.AbstractEventLoop]] = uvloop.new_event_loop
+except ImportError:  # pragma: no cover - depends on the environment
+    _LOOP_FACTORY = None
 
 from t3api_utils.api.client import T3APIClient
 from t3api_utils.api.interfaces import MetrcCollectionResponse
 from t3api_utils.api.operations import get_collection_async
+from t3api_utils.exceptions import PartialResultsError
+from t3api_utils.http.utils import T3HTTPError
 from t3api_utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 T = TypeVar("T")
+R = TypeVar("R")
+
+# Page-level retries after a 429 outlasts the HTTP layer's own retries
+_THROTTLE_RETRIES = 3
+# Back-off used when a 429 response carries no usable Retry-After header
+_DEFAULT_RETRY_AFTER = 1.0
+# Lowest refill rate a throttle may cut to, as a fraction of requests_per_second
+_MIN_RATE_FRACTION = 0.1
 PaginatedT = TypeVar("PaginatedT", bound=MetrcCollectionResponse)
 
 
 class RateLimiter:
-    """Simple rate limiter using a token-bucket-style algorithm.
+    """Token-bucket rate limiter shared by sync and async callers.
+
+    Tokens refill continuously at ``requests_per_second`` up to a capacity
+    of ``burst``, and each request consumes one. After an idle period up to
+    ``burst`` requests may go out back-to-back; beyond that, callers are
+    spaced at the steady rate. The bucket is updated under a
+    ``threading.Lock`` and callers sleep outside it, using ``time.sleep``
+    or ``asyncio.sleep`` depending on the acquisition method.
 
-    Enforces a minimum time interval between consecutive requests to avoid
-    overwhelming the API. The limiter tracks the timestamp of the last
-    request and sleeps for the remaining interval before allowing the next
-    one. Both synchronous (``time.sleep``) and asynchronous
-    (``asyncio.sleep``) acquisition methods are provided.
+    When the server pushes back, :meth:`notify_throttled` pauses the
+    bucket and halves the refill rate once per throttle window; once the
+    window has passed the rate recovers by 10 % per request back to
+    ``requests_per_second``.
 
     Attributes:
-        requests_per_second: Configured maximum throughput.
-        min_interval: Minimum seconds between consecutive requests,
-            derived as ``1.0 / requests_per_second``.
-        last_request_time: Epoch timestamp of the most recent request.
+        requests_per_second: Configured steady-state throughput.
+        burst: Bucket capacity, i.e. how many requests may be issued
+            without waiting after the bucket has refilled.
+        min_interval: Seconds needed to refill one token, derived as
+            ``1.0 / requests_per_second``.
+        tokens: Tokens currently available in the bucket.
+        last_refill: ``time.monotonic()`` timestamp of the last refill.
+        effective_rate: Current refill rate; below ``requests_per_second``
+            while recovering from a throttle.
+        throttle_until: ``time.monotonic()`` timestamp before which the
+            reduced rate is held.
     """
 
-    def __init__(self, requests_per_second: float = 10.0) -> None:
+    def __init__(self, requests_per_second: float = 10.0, burst: int = 1) -> None:
         """Initialize rate limiter.
 
         Args:
             requests_per_second: Maximum requests per second allowed.
                 A value of ``0`` or less disables rate limiting.
+            burst: Number of requests that may be issued back-to-back
+                before throttling starts. Defaults to ``1`` (no bursting).
         """
         self.requests_per_second = requests_per_second
+        self.burst = max(1, burst)
         self.min_interval = 1.0 / requests_per_second if requests_per_second > 0 else 0
-        self.last_request_time = 0.0
+        self.tokens = float(self.burst)
+        self.last_refill = time.monotonic()
+        self.effective_rate = requests_per_second
+        self.throttle_until = 0.0
+        self._lock = threading.Lock()
 
-    def acquire(self) -> None:
-        """Block synchronously until it's safe to make another request.
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned at ``effective_rate`` since the last refill.
 
-        Uses ``time.sleep`` to pause the calling thread when the elapsed
-        time since the last request is less than ``min_interval``.
+        Must be called with the lock held, and before ``effective_rate``
+        changes so the new rate is not applied retroactively.
+
+        Args:
+            now: Current ``time.monotonic()`` reading.
+        """
+        elapsed = now - self.last_refill
+        self.tokens = min(float(self.burst), self.tokens + elapsed * self.effective_rate)
+        self.last_refill = now
+
+    def _take_token(self) -> float:
+        """Refill the bucket, take one token, and return how long to wait for it.
+
+        When the bucket is empty the token is taken anyway, leaving a
+        negative balance that reserves the next refill for this caller.
+
+        Returns:
+            Seconds the caller must sleep before issuing its request;
+            ``0.0`` when a token was already available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now >= self.throttle_until and self.effective_rate < self.requests_per_second:
+                self.effective_rate = min(self.requests_per_second, self.effective_rate * 1.1)
+
+            self.tokens -= 1
+            return -self.tokens / self.effective_rate if self.tokens < 0 else 0.0
+
+    def set_rate(self, requests_per_second: float) -> None:
+        """Change the steady-state rate while keeping the bucket's state.
+
+        Tokens already earned are kept; any throttle reduction in progress
+        is capped at the new rate.
+
+        Args:
+            requests_per_second: New maximum requests per second. A value
+                of ``0`` or less disables rate limiting.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            throttled = self.effective_rate < self.requests_per_second
+            self.requests_per_second = requests_per_second
+            self.min_interval = 1.0 / requests_per_second if requests_per_second > 0 else 0
+            self.effective_rate = min(self.effective_rate, requests_per_second) if throttled else requests_per_second
+
+    def notify_throttled(self, retry_after: float) -> None:
+        """Back off after the server answered with HTTP 429.
+
+        The next token becomes available no sooner than ``retry_after``
+        seconds from now, and the refill rate is halved until then. A burst
+        of 429s inside one throttle window, as concurrent pages report the
+        same push-back, halves the rate once and only extends the window,
+        and the rate never drops below ``_MIN_RATE_FRACTION`` of
+        ``requests_per_second``.
+
+        Args:
+            retry_after: Seconds the server asked clients to wait.
         """
         if self.min_interval <= 0:
             return
 
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now >= self.throttle_until:
+                floor = min(self.effective_rate, self.requests_per_second * _MIN_RATE_FRACTION)
+                self.effective_rate = max(floor, self.effective_rate / 2)
+            self.throttle_until = max(self.throttle_until, now + retry_after)
+            self.tokens = min(self.tokens, -retry_after * self.effective_rate)
 
-        if time_since_last < self.min_interval:
-            sleep_time = self.min_interval - time_since_last
-            time.sleep(sleep_time)
+    def acquire(self) -> None:
+        """Block synchronously until a token is available.
 
-        self.last_request_time = time.time()
+        Uses ``time.sleep`` to pause the calling thread while the bucket
+        refills.
+        """
+        if self.min_interval <= 0:
+            return
+
+        sleep_time = self._take_token()
+        if sleep_time > 0:
+            time.sleep(sleep_time)
 
     async def acquire_async(self) -> None:
-        """Asynchronously wait until it's safe to make another request.
+        """Asynchronously wait until a token is available.
 
         Uses ``asyncio.sleep`` instead of ``time.sleep`` so that the
-        event loop remains unblocked while waiting for the rate-limit
-        interval to elapse.
+        event loop remains unblocked while the bucket refills.
         """
         if self.min_interval <= 0:
             return
 
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-
-        if time_since_last < self.min_interval:
-            sleep_time = self.min_interval - time_since_last
+        sleep_time = self._take_token()
+        if sleep_time > 0:
             await asyncio.sleep(sleep_time)
 
-        self.last_request_time = time.time()
+
+# Rate limiters shared across loads, keyed by (host, path)
+_LIMITERS: Dict[Tuple[str, str], RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def _shared_limiter(client: T3APIClient, path: str, rate_limit: float) -> RateLimiter:
+    """Return the process-wide limiter for ``path`` on the client's host.
+
+    Successive loads of the same endpoint draw from one token bucket, so a
+    second call does not start with a fresh burst allowance and exceed the
+    long-term rate. A different ``rate_limit`` retunes the existing bucket.
+
+    Args:
+        client: Client whose configured host scopes the limiter.
+        path: API endpoint path being loaded.
+        rate_limit: Requests per second for this endpoint.
+
+    Returns:
+        The shared ``RateLimiter`` for ``(host, path)``.
+    """
+    key = (client._config.host, path)
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = _LIMITERS[key] = RateLimiter(rate_limit)
+        elif limiter.requests_per_second != rate_limit:
+            limiter.set_rate(rate_limit)
+    return limiter
+
+
+def reset_limiters() -> None:
+    """Forget all shared per-endpoint rate limiters.
+
+    The next load of each endpoint starts from a full bucket again.
+    """
+    with _LIMITERS_LOCK:
+        _LIMITERS.clear()
+
+
+def _retry_after_seconds(error: T3HTTPError) -> float:
+    """Read the server's requested back-off from a 429 error.
+
+    Args:
+        error: The throttling error raised by the HTTP layer.
+
+    Returns:
+        The ``Retry-After`` header as seconds, or ``_DEFAULT_RETRY_AFTER``
+        when it is absent or not a number of seconds.
+    """
+    header = error.response.headers.get("Retry-After") if error.response is not None else None
+    try:
+        return max(0.0, float(header)) if header is not None else _DEFAULT_RETRY_AFTER
+    except ValueError:
+        return _DEFAULT_RETRY_AFTER
+
+
+def _run_with_client_copy(
+    client: T3APIClient,
+    load: Callable[[T3APIClient], Awaitable[R]],
+) -> R:
+    """Run an async loader to completion from synchronous code.
+
+    The loader receives a fresh ``T3APIClient`` carrying ``client``'s
+    config, retry policy, hooks, headers and token, so its connection
+    pool belongs to the event loop that runs it; the copy is closed
+    afterwards. With no loop running in this thread the loader runs
+    directly on a new loop, a uvloop one when uvloop is installed.
+    Otherwise it runs on a single helper thread with its own loop, since
+    the current loop cannot be blocked on.
+
+    Args:
+        client: Authenticated client whose settings are copied.
+        load: Coroutine function to run against the client copy.
+
+    Returns:
+        Whatever ``load`` returns.
+    """
+    async def run() -> R:
+        async with T3APIClient(
+            config=client._config,
+            retry_policy=client._retry_policy,
+            logging_hooks=client._logging_hooks,
+            headers=client._extra_headers,
+        ) as temp_client:
+            if client.access_token:
+                temp_client.set_access_token(client.access_token)
+            return await load(temp_client)
+
+    def run_to_completion() -> R:
+        with asyncio.Runner(loop_factory=_LOOP_FACTORY) as runner:
+            return runner.run(run())
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return run_to_completion()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run_to_completion).result()
 
 
 def parallel_load_paginated_sync(
@@ -98,7 +300,7 @@ def parallel_load_paginated_sync(
     """
     Load all pages of a paginated API endpoint in parallel (sync wrapper).
 
-    This is a wrapper around the async implementation using asyncio.
+    This is a wrapper that runs the async implementation on an event loop.
 
     Args:
         client: Authenticated T3APIClient instance
@@ -114,65 +316,39 @@ def parallel_load_paginated_sync(
         ValueError: If response is invalid
         AttributeError: If client is not authenticated
     """
-    # Create a temporary async client that uses the same config and auth
-    # but runs in its own event loop to avoid conflicts
-    import concurrent.futures
-
-    def run_in_thread() -> List[PaginatedT]:
-        # Create a new event loop for this thread
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            # Import here to avoid circular imports
-            from t3api_utils.api.client import T3APIClient as TempClient
-
-            # Create a new client with the same config and auth
-            temp_client = TempClient(
-                config=client._config,
-                retry_policy=client._retry_policy,
-                logging_hooks=client._logging_hooks,
-                headers=client._extra_headers,
-            )
-            if client.access_token:
-                temp_client.set_access_token(client.access_token)
-
-            return loop.run_until_complete(parallel_load_paginated_async(
-                client=temp_client,
-                path=path,
-                max_concurrent=max_workers,
-                rate_limit=rate_limit,
-                **method_kwargs,
-            ))
-        finally:
-            loop.close()
-
-    # Run in a separate thread with its own event loop
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(run_in_thread)
-        return future.result()
+    return _run_with_client_copy(client, lambda temp_client: parallel_load_paginated_async(
+        client=temp_client,
+        path=path,
+        max_concurrent=max_workers,
+        rate_limit=rate_limit,
+        **method_kwargs,
+    ))
 
 
-async def parallel_load_paginated_async(
+async def _iter_pages_async(
     client: T3APIClient,
     path: str,
-    max_concurrent: Optional[int] = 10,
-    rate_limit: Optional[float] = 10.0,
-    batch_size: Optional[int] = None,
+    max_concurrent: Optional[int],
+    rate_limit: Optional[float],
+    batch_size: Optional[int],
     **method_kwargs: Any,
-) -> List[PaginatedT]:
-    """
-    Load all pages of a paginated API endpoint in parallel using async client.
+) -> AsyncIterator[tuple[int, PaginatedT]]:
+    """Fetch every page of a collection, yielding each as soon as it arrives.
+
+    Page 1 is fetched first to learn the pagination; the remaining pages
+    are then scheduled together and yielded in completion order. Pages
+    still in flight are cancelled if the consumer stops iterating early.
 
     Args:
         client: Authenticated T3APIClient instance
         path: API endpoint path (e.g., "/v2/licenses", "/v2/packages/active")
         max_concurrent: Maximum number of concurrent requests
         rate_limit: Requests per second limit (None to disable)
-        batch_size: Process requests in batches of this size (None for no batching)
+        batch_size: Optional extra cap on the number of concurrent requests
         **method_kwargs: Arguments to pass to the API method
 
-    Returns:
-        List of paginated response objects, one per page
+    Yields:
+        ``(zero_based_index, response)`` tuples, one per page.
 
     Raises:
         ValueError: If response is invalid
@@ -183,14 +359,39 @@ async def parallel_load_paginated_async(
 
     logger.info(f"Starting parallel async load for {path}")
 
-    # Set up rate limiter
-    rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+    # Share the endpoint's rate limiter with earlier loads
+    rate_limiter = _shared_limiter(client, path, rate_limit) if rate_limit else None
 
-    # Fetch first page to determine pagination
-    if rate_limiter:
-        await rate_limiter.acquire_async()
+    async def fetch_throttled(page_number: int) -> PaginatedT:
+        """Fetch one page through the rate limiter, backing off on HTTP 429.
+
+        A 429 that survives the HTTP layer's own retries is reported to
+        the shared limiter, which slows every page down, and the page is
+        retried up to ``_THROTTLE_RETRIES`` times. Without a limiter the
+        error propagates unchanged.
+
+        Args:
+            page_number: 1-based page number to fetch.
+
+        Returns:
+            The page's collection response.
+        """
+        attempt = 0
+        while True:
+            if rate_limiter:
+                await rate_limiter.acquire_async()
+            try:
+                return cast(PaginatedT, await get_collection_async(client, path, page=page_number, **method_kwargs))
+            except T3HTTPError as e:
+                if rate_limiter is None or e.status_code != 429 or attempt >= _THROTTLE_RETRIES:
+                    raise
+                attempt += 1
+                retry_after = _retry_after_seconds(e)
+                logger.warning(f"Page {page_number} throttled; backing off {retry_after:.2f}s")
+                rate_limiter.notify_throttled(retry_after)
 
-    first_response = cast(PaginatedT, await get_collection_async(client, path, page=1, **method_kwargs))
+    # Fetch first page to determine pagination
+    first_response = await fetch_throttled(1)
 
     if 'total' not in first_response or 'pageSize' not in first_response:
         raise ValueError("Response must have 'total' and 'pageSize' fields")
@@ -201,79 +402,142 @@ async def parallel_load_paginated_async(
 
     logger.info(f"Total records: {total_records}, page size: {page_size}, pages: {num_pages}")
 
+    yield 0, first_response
+
     if num_pages <= 1:
-        return [first_response]
+        return
 
     async def fetch_page(page_number: int) -> tuple[int, PaginatedT]:
         """Fetch a single page from the paginated endpoint.
 
-        Respects the outer rate limiter (if configured) before issuing
-        the request.
-
         Args:
             page_number: 1-based page number to fetch.
 
         Returns:
             A tuple of ``(zero_based_index, response)`` where the index
-            is ``page_number - 1``, suitable for direct insertion into
-            the pre-allocated responses list.
+            is ``page_number - 1``.
         """
-        if rate_limiter:
-            await rate_limiter.acquire_async()
-
         logger.debug(f"Fetching page {page_number}")
-        response = cast(PaginatedT, await get_collection_async(client, path, page=page_number, **method_kwargs))
+        response = await fetch_throttled(page_number)
         return page_number - 1, response  # Convert to 0-based index
 
-    # Prepare responses list
-    responses: List[PaginatedT] = [None] * num_pages  # type: ignore
-    responses[0] = first_response
-
     remaining_pages = list(range(2, num_pages + 1))
 
+    # All remaining pages are scheduled at once; the semaphore alone bounds
+    # how many are in flight, so a slow page never holds back the next batch.
+    concurrency = max_concurrent or len(remaining_pages)
     if batch_size and batch_size > 0:
-        # Process in batches
-        logger.info(f"Processing {len(remaining_pages)} pages in batches of {batch_size}")
+        concurrency = min(concurrency, batch_size)
+    semaphore = asyncio.Semaphore(concurrency)
 
-        for i in range(0, len(remaining_pages), batch_size):
-            batch_pages = remaining_pages[i:i + batch_size]
-            logger.info(f"Processing batch {i // batch_size + 1}: pages {batch_pages[0]}-{batch_pages[-1]}")
+    async def fetch_with_semaphore(page_num: int) -> tuple[int, PaginatedT]:
+        async with semaphore:
+            return await fetch_page(page_num)
 
-            # Create semaphore for this batch
-            semaphore = asyncio.Semaphore(max_concurrent or len(batch_pages))
+    # Create all tasks
+    tasks = [asyncio.ensure_future(fetch_with_semaphore(page_num)) for page_num in remaining_pages]
 
-            async def fetch_with_semaphore(page_num: int) -> tuple[int, PaginatedT]:
-                async with semaphore:
-                    return await fetch_page(page_num)
+    try:
+        # Yield with progress tracking
+        for i, task in enumerate(asyncio.as_completed(tasks)):
+            page_index, response = await task
+            logger.info(f"Loaded page {page_index + 1} ({i + 1}/{len(remaining_pages)})")
+            yield page_index, response
+    finally:
+        for pending in tasks:
+            pending.cancel()
 
-            # Execute batch
-            batch_tasks = [fetch_with_semaphore(page_num) for page_num in batch_pages]
-            batch_results = await asyncio.gather(*batch_tasks)
+    logger.info("Finished parallel async load")
 
-            # Store results
-            for page_index, response in batch_results:
-                responses[page_index] = response
 
-            logger.info(f"Completed batch {i // batch_size + 1}")
-    else:
-        # Process all at once with concurrency limit
-        semaphore = asyncio.Semaphore(max_concurrent or len(remaining_pages))
+async def parallel_load_paginated_async(
+    client: T3APIClient,
+    path: str,
+    max_concurrent: Optional[int] = 10,
+    rate_limit: Optional[float] = 10.0,
+    batch_size: Optional[int] = None,
+    overall_timeout: Optional[float] = None,
+    **method_kwargs: Any,
+) -> List[PaginatedT]:
+    """
+    Load all pages of a paginated API endpoint in parallel using async client.
 
-        async def fetch_with_semaphore(page_num: int) -> tuple[int, PaginatedT]:
-            async with semaphore:
-                return await fetch_page(page_num)
+    Args:
+        client: Authenticated T3APIClient instance
+        path: API endpoint path (e.g., "/v2/licenses", "/v2/packages/active")
+        max_concurrent: Maximum number of concurrent requests
+        rate_limit: Requests per second limit (None to disable)
+        batch_size: Deprecated. Pages are no longer fetched in waves; a
+            positive value now only caps the number of concurrent requests.
+        overall_timeout: Seconds the whole load may take (None for no limit)
+        **method_kwargs: Arguments to pass to the API method
 
-        # Create all tasks
-        tasks = [fetch_with_semaphore(page_num) for page_num in remaining_pages]
+    Returns:
+        List of paginated response objects, one per page
 
-        # Execute with progress tracking
-        for i, task in enumerate(asyncio.as_completed(tasks)):
-            page_index, response = await task
+    Raises:
+        ValueError: If response is invalid
+        AttributeError: If client is not authenticated
+        PartialResultsError: If ``overall_timeout`` elapses; pages still in
+            flight are cancelled and the completed ones are attached.
+    """
+    pages: AsyncIterator[tuple[int, PaginatedT]] = _iter_pages_async(
+        client, path, max_concurrent, rate_limit, batch_size, **method_kwargs
+    )
+    responses: Dict[int, PaginatedT] = {}
+
+    async def collect() -> None:
+        async for page_index, response in pages:
             responses[page_index] = response
-            logger.info(f"Loaded page {page_index + 1} ({i + 1}/{len(remaining_pages)})")
 
-    logger.info("Finished parallel async load")
-    return [r for r in responses if r is not None]
+    try:
+        await asyncio.wait_for(collect(), overall_timeout)
+    except asyncio.TimeoutError:
+        partial = [responses[page_index] for page_index in sorted(responses)]
+        raise PartialResultsError(
+            f"Loading {path} exceeded {overall_timeout}s after {len(partial)} pages",
+            partial=partial,
+        ) from None
+
+    return [responses[page_index] for page_index in sorted(responses)]
+
+
+async def parallel_stream_paginated_async(
+    client: T3APIClient,
+    path: str,
+    max_concurrent: Optional[int] = 10,
+    rate_limit: Optional[float] = 10.0,
+    **method_kwargs: Any,
+) -> AsyncIterator[T]:
+    """
+    Stream the data items of a paginated endpoint as pages arrive (async).
+
+    Unlike :func:`load_all_data_async`, pages are never held together in
+    memory: each page's items are yielded as soon as it completes, so the
+    caller can start processing before the slowest page returns. Items
+    therefore come out in page *completion* order, not page order.
+
+    Args:
+        client: Authenticated T3APIClient instance
+        path: API endpoint path (e.g., "/v2/licenses", "/v2/packages/active")
+        max_concurrent: Maximum number of concurrent requests
+        rate_limit: Requests per second limit (None to disable)
+        **method_kwargs: Arguments to pass to the API method
+
+    Yields:
+        Data items from each page's ``data`` list.
+
+    Raises:
+        ValueError: If the first response is missing required pagination
+            fields (``total`` or ``pageSize``).
+        AttributeError: If the client is not authenticated.
+    """
+    pages: AsyncIterator[tuple[int, MetrcCollectionResponse]] = _iter_pages_async(
+        client, path, max_concurrent, rate_limit, None, **method_kwargs
+    )
+    async for _, response in pages:
+        for item in cast(List[T], response["data"]):
+            yield item
 
 
 def load_all_data_sync(
@@ -286,7 +550,7 @@ def load_all_data_sync(
     """
     Load all data from a paginated endpoint and flatten into a single list (sync).
 
-    This is a wrapper around the async implementation using asyncio.
+    This is a wrapper that runs the async implementation on an event loop.
 
     Args:
         client: Authenticated T3APIClient instance
@@ -303,42 +567,13 @@ def load_all_data_sync(
             fields (``total`` or ``pageSize``).
         AttributeError: If the client is not authenticated.
     """
-    # Create a temporary async client that uses the same config and auth
-    # but runs in its own event loop to avoid conflicts
-    import concurrent.futures
-
-    def run_in_thread() -> List[T]:
-        # Create a new event loop for this thread
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            # Import here to avoid circular imports
-            from t3api_utils.api.client import T3APIClient as TempClient
-
-            # Create a new client with the same config and auth
-            temp_client = TempClient(
-                config=client._config,
-                retry_policy=client._retry_policy,
-                logging_hooks=client._logging_hooks,
-                headers=client._extra_headers,
-            )
-            if client.access_token:
-                temp_client.set_access_token(client.access_token)
-
-            return loop.run_until_complete(load_all_data_async(
-                client=temp_client,
-                path=path,
-                max_concurrent=max_workers,
-                rate_limit=rate_limit,
-                **method_kwargs,
-            ))
-        finally:
-            loop.close()
-
-    # Run in a separate thread with its own event loop
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(run_in_thread)
-        return future.result()
+    return _run_with_client_copy(client, lambda temp_client: load_all_data_async(
+        client=temp_client,
+        path=path,
+        max_concurrent=max_workers,
+        rate_limit=rate_limit,
+        **method_kwargs,
+    ))
 
 
 async def load_all_data_async(
@@ -347,6 +582,7 @@ async def load_all_data_async(
     max_concurrent: Optional[int] = 10,
     rate_limit: Optional[float] = 10.0,
     batch_size: Optional[int] = None,
+    overall_timeout: Optional[float] = None,
     **method_kwargs: Any,
 ) -> List[T]:
     """
@@ -360,7 +596,9 @@ async def load_all_data_async(
         path: API endpoint path (e.g., "/v2/licenses", "/v2/packages/active")
         max_concurrent: Maximum number of concurrent requests
         rate_limit: Requests per second limit (None to disable)
-        batch_size: Process requests in batches of this size (None for no batching)
+        batch_size: Deprecated. Pages are no longer fetched in waves; a
+            positive value now only caps the number of concurrent requests.
+        overall_timeout: Seconds the whole load may take (None for no limit)
         **method_kwargs: Arguments to pass to the API method
 
     Returns:
@@ -370,6 +608,8 @@ async def load_all_data_async(
         ValueError: If the first response is missing required pagination
             fields (``total`` or ``pageSize``).
         AttributeError: If the client is not authenticated.
+        PartialResultsError: If ``overall_timeout`` elapses; its ``partial``
+            attribute holds the page responses loaded before the deadline.
     """
     responses: List[MetrcCollectionResponse] = await parallel_load_paginated_async(
         client=client,
@@ -377,15 +617,12 @@ async def load_all_data_async(
         max_concurrent=max_concurrent,
         rate_limit=rate_limit,
         batch_size=batch_size,
+        overall_timeout=overall_timeout,
         **method_kwargs,
     )
 
     # Extract all data items
-    all_data: List[T] = []
-    for response in responses:
-        all_data.extend(cast(List[T], response["data"]))
-
-    return all_data
+    return list(chain.from_iterable(cast(List[T], response["data"]) for response in responses))
 
 
 # Backwards compatibility - enhanced version of the original function
@@ -472,10 +709,15 @@ def parallel_load_collection_enhanced(
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         futures = [executor.submit(fetch_page, i) for i in range(1, num_pages)]
-        for count, future in enumerate(as_completed(futures), start=1):
-            page_number, response = future.result()
-            responses[page_number] = response
-            logger.info(f"Loaded page {page_number + 1} ({count}/{num_pages - 1})")
+        try:
+            for count, future in enumerate(as_completed(futures), start=1):
+                page_number, response = future.result()
+                responses[page_number] = response
+                logger.info(f"Loaded page {page_number + 1} ({count}/{num_pages - 1})")
+        except BaseException:
+            # Don't spend requests on pages whose results will be discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
     logger.info("Finished enhanced parallel loading")
     return [r for r in responses if r is not None]
\ No newline at end of file
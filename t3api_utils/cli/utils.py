@@ -6,12 +6,14 @@ prompting, and persisting Metrc credentials.
 """
 
 import os
+import re
+import tempfile
 from pathlib import Path
-from typing import Dict, Set, Any, Optional
+from typing import Dict, Mapping, Set, Any, Optional, Tuple
 
 import pyotp
 import typer
-from dotenv import load_dotenv, set_key
+from dotenv import dotenv_values, load_dotenv
 
 from t3api_utils.auth.interfaces import T3Credentials
 from t3api_utils.cli.consts import (
@@ -29,6 +31,9 @@ __all__ = ["DEFAULT_ENV_PATH", "ConfigManager", "config_manager", "generate_otp_
 
 logger = get_logger(__name__)
 
+# Start of a dotenv assignment line, capturing the key
+_ASSIGNMENT_RE = re.compile(r"\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_.-]*)\s*=")
+
 
 class ConfigManager:
     """
@@ -47,6 +52,26 @@ class ConfigManager:
         """
         self.config_path = config_path
         self._config_cache: Optional[Dict[str, Any]] = None
+        self._loaded_stamp: Optional[Tuple[int, int]] = None
+
+    def _load_env(self) -> None:
+        """Load the configuration file into ``os.environ`` if it changed.
+
+        The file is only re-parsed when its modification time or size
+        differs from the last load, so repeated ``get_config_value`` calls
+        cost a ``stat`` rather than a full dotenv parse. Writes through
+        ``set_key`` or ``_generate_config_file`` change the stamp and are
+        picked up on the next call.
+        """
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self._loaded_stamp:
+            load_dotenv(dotenv_path=self.config_path)
+            self._loaded_stamp = stamp
 
     def ensure_config_exists(self) -> None:
         """Ensure ``.t3.env`` exists and is complete, auto-generating if needed.
@@ -80,7 +105,7 @@ class ConfigManager:
         if not self._config_exists():
             return True
 
-        load_dotenv(dotenv_path=self.config_path)
+        self._load_env()
 
         # Check for any missing required keys
         required_keys = [
@@ -336,7 +361,7 @@ DEFAULT_FILE_FORMAT={default_file_format}
             The converted configuration value, or ``default`` if the key is
             absent or conversion fails.
         """
-        load_dotenv(dotenv_path=self.config_path)
+        self._load_env()
         value = os.getenv(key.value)
 
         if value is None:
@@ -447,20 +472,23 @@ def load_credentials_from_env() -> Dict[str, str]:
         ``"username"``, ``"jwt_token"``) to their string values.
         Keys with empty or missing values are omitted.
     """
-    load_dotenv(dotenv_path=DEFAULT_ENV_PATH)
+    # Process environment variables take precedence over the file, as with
+    # load_dotenv, but the file is read without mutating os.environ.
+    file_values = dotenv_values(DEFAULT_ENV_PATH) if os.path.exists(DEFAULT_ENV_PATH) else {}
+    env = {**file_values, **os.environ}
 
     creds = {}
 
     # Metrc credentials
-    hostname = (os.getenv(EnvKeys.METRC_HOSTNAME.value) or "").strip()
-    username = (os.getenv(EnvKeys.METRC_USERNAME.value) or "").strip()
-    password = (os.getenv(EnvKeys.METRC_PASSWORD.value) or "").strip()
-    email = (os.getenv(EnvKeys.METRC_EMAIL.value) or "").strip()
+    hostname = (env.get(EnvKeys.METRC_HOSTNAME.value) or "").strip()
+    username = (env.get(EnvKeys.METRC_USERNAME.value) or "").strip()
+    password = (env.get(EnvKeys.METRC_PASSWORD.value) or "").strip()
+    email = (env.get(EnvKeys.METRC_EMAIL.value) or "").strip()
 
     # Alternative authentication methods
-    jwt_token = (os.getenv(EnvKeys.JWT_TOKEN.value) or "").strip()
-    api_key = (os.getenv(EnvKeys.API_KEY.value) or "").strip()
-    api_state_code = (os.getenv(EnvKeys.API_STATE_CODE.value) or "").strip()
+    jwt_token = (env.get(EnvKeys.JWT_TOKEN.value) or "").strip()
+    api_key = (env.get(EnvKeys.API_KEY.value) or "").strip()
+    api_state_code = (env.get(EnvKeys.API_STATE_CODE.value) or "").strip()
 
     if hostname:
         creds["hostname"] = hostname
@@ -480,6 +508,53 @@ def load_credentials_from_env() -> Dict[str, str]:
     return creds
 
 
+def _set_keys(dotenv_path: str, values: Mapping[str, str]) -> None:
+    """Add or update several keys in a dotenv file with a single rewrite.
+
+    Lines assigning one of the given keys are replaced, every other line
+    is kept as written, and keys not yet in the file are appended. Values
+    are single-quoted with backslashes and quotes escaped, which
+    ``dotenv_values`` reads back unchanged. The new content goes to a
+    temporary file beside the target and is moved into place with
+    ``os.replace``, so a reader never sees a partial file and a missing
+    file is created. The result is readable by its owner only, as it
+    holds credentials.
+
+    Args:
+        dotenv_path: Path of the dotenv file to update.
+        values: Mapping of environment variable names to their new values.
+    """
+    def line_for(key: str, value: str) -> str:
+        escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+        return f"{key}='{escaped}'\n"
+
+    path = Path(dotenv_path)
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True) if path.exists() else []
+
+    replaced: Set[str] = set()
+    output = []
+    for line in lines:
+        match = _ASSIGNMENT_RE.match(line)
+        if match and match.group(1) in values:
+            output.append(line_for(match.group(1), values[match.group(1)]))
+            replaced.add(match.group(1))
+        else:
+            output.append(line)
+    appended = [key for key in values if key not in replaced]
+    if appended and output and not output[-1].endswith("\n"):
+        output[-1] += "\n"
+    output.extend(line_for(key, values[key]) for key in appended)
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f"{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as dest:
+            dest.writelines(output)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
 def offer_to_save_credentials(*, credentials: T3Credentials) -> None:
     """Offer to save credentials to the ``.t3.env`` file.
 
@@ -508,46 +583,29 @@ def offer_to_save_credentials(*, credentials: T3Credentials) -> None:
     if credentials["hostname"] in config_manager.get_email_whitelist():
         email_differs = credentials.get("email") != current_email
 
+    to_save = {
+        EnvKeys.METRC_HOSTNAME.value: credentials["hostname"],
+        EnvKeys.METRC_USERNAME.value: credentials["username"],
+        EnvKeys.METRC_PASSWORD.value: credentials["password"],
+    }
+    email_value = credentials.get("email")
+    if email_value:
+        to_save[EnvKeys.METRC_EMAIL.value] = email_value
+
     if not env_exists:
         if typer.confirm(
             f"No credentials file found. Save these values to {DEFAULT_ENV_PATH}?",
             default=True,
         ):
             logger.info("[green]Saving credentials to new environment file.[/green]")
-            set_key(
-                DEFAULT_ENV_PATH, EnvKeys.METRC_HOSTNAME.value, credentials["hostname"]
-            )
-            set_key(
-                DEFAULT_ENV_PATH, EnvKeys.METRC_USERNAME.value, credentials["username"]
-            )
-            set_key(
-                DEFAULT_ENV_PATH, EnvKeys.METRC_PASSWORD.value, credentials["password"]
-            )
-            email_value = credentials.get("email")
-            if email_value:
-                set_key(
-                    DEFAULT_ENV_PATH, EnvKeys.METRC_EMAIL.value, email_value
-                )
+            _set_keys(DEFAULT_ENV_PATH, to_save)
     elif hostname_differs or username_differs or password_differs or email_differs:
         if typer.confirm(
             f"Some credential values differ from those in {DEFAULT_ENV_PATH}. Update them?",
             default=True,
         ):
             logger.info("[cyan]Updating credentials in environment file.[/cyan]")
-            set_key(
-                DEFAULT_ENV_PATH, EnvKeys.METRC_HOSTNAME.value, credentials["hostname"]
-            )
-            set_key(
-                DEFAULT_ENV_PATH, EnvKeys.METRC_USERNAME.value, credentials["username"]
-            )
-            set_key(
-                DEFAULT_ENV_PATH, EnvKeys.METRC_PASSWORD.value, credentials["password"]
-            )
-            email_value = credentials.get("email")
-            if email_value:
-                set_key(
-                    DEFAULT_ENV_PATH, EnvKeys.METRC_EMAIL.value, email_value
-                )
+            _set_keys(DEFAULT_ENV_PATH, to_save)
 
 
 def offer_to_save_jwt_token(*, jwt_token: str) -> None:
@@ -571,14 +629,14 @@ def offer_to_save_jwt_token(*, jwt_token: str) -> None:
             default=True,
         ):
             logger.info("[green]Saving JWT token to new environment file.[/green]")
-            set_key(DEFAULT_ENV_PATH, EnvKeys.JWT_TOKEN.value, jwt_token)
+            _set_keys(DEFAULT_ENV_PATH, {EnvKeys.JWT_TOKEN.value: jwt_token})
     elif jwt_token != current_jwt:
         if typer.confirm(
             f"JWT token differs from the one in {DEFAULT_ENV_PATH}. Update it?",
             default=True,
         ):
             logger.info("[cyan]Updating JWT token in environment file.[/cyan]")
-            set_key(DEFAULT_ENV_PATH, EnvKeys.JWT_TOKEN.value, jwt_token)
+            _set_keys(DEFAULT_ENV_PATH, {EnvKeys.JWT_TOKEN.value: jwt_token})
 
 
 def offer_to_save_api_key(*, api_key: str, state_code: str) -> None:
@@ -604,16 +662,20 @@ def offer_to_save_api_key(*, api_key: str, state_code: str) -> None:
             default=True,
         ):
             logger.info("[green]Saving API key to new environment file.[/green]")
-            set_key(DEFAULT_ENV_PATH, EnvKeys.API_KEY.value, api_key)
-            set_key(DEFAULT_ENV_PATH, EnvKeys.API_STATE_CODE.value, state_code)
+            _set_keys(DEFAULT_ENV_PATH, {
+                EnvKeys.API_KEY.value: api_key,
+                EnvKeys.API_STATE_CODE.value: state_code,
+            })
     elif api_key != current_api_key or state_code != current_state_code:
         if typer.confirm(
             f"API key or state code differs from {DEFAULT_ENV_PATH}. Update them?",
             default=True,
         ):
             logger.info("[cyan]Updating API key in environment file.[/cyan]")
-            set_key(DEFAULT_ENV_PATH, EnvKeys.API_KEY.value, api_key)
-            set_key(DEFAULT_ENV_PATH, EnvKeys.API_STATE_CODE.value, state_code)
+            _set_keys(DEFAULT_ENV_PATH, {
+                EnvKeys.API_KEY.value: api_key,
+                EnvKeys.API_STATE_CODE.value: state_code,
+            })
 
 
 def prompt_for_credentials_or_error(**kwargs: object) -> T3Credentials:
@@ -621,11 +683,13 @@ def prompt_for_credentials_or_error(**kwargs: object) -> T3Credentials:
 
     Pre-populated values (typically loaded from the environment) are used
     without prompting. Missing values are requested interactively. OTP and
-    email prompts are shown only when the hostname requires them.
+    email prompts are shown only when the hostname requires them, so a
+    scripted caller that supplies every value is never prompted.
 
     Args:
         **kwargs: Optional pre-populated credential values. Recognized keys
-            are ``hostname``, ``username``, ``password``, and ``email``.
+            are ``hostname``, ``username``, ``password``, ``otp``, and
+            ``email``.
 
     Returns:
         A fully-populated ``T3Credentials`` dictionary.
@@ -637,6 +701,7 @@ def prompt_for_credentials_or_error(**kwargs: object) -> T3Credentials:
     hostname = str(kwargs.get("hostname", "")) if kwargs.get("hostname") else None
     username = str(kwargs.get("username", "")) if kwargs.get("username") else None
     password = str(kwargs.get("password", "")) if kwargs.get("password") else None
+    otp = str(kwargs.get("otp", "")) if kwargs.get("otp") else None
     email = str(kwargs.get("email", "")) if kwargs.get("email") else None
 
     if hostname:
@@ -663,17 +728,19 @@ def prompt_for_credentials_or_error(**kwargs: object) -> T3Credentials:
     }
 
     if hostname in config_manager.get_otp_whitelist():
-        # Try to generate OTP from seed first, otherwise prompt user
-        otp = generate_otp_from_seed()
+        # Use a supplied code, then try to generate one from the seed, otherwise prompt user
         if otp:
-            print_info("Using OTP generated from configured seed")
-            credentials["otp"] = otp
+            print_info("Using supplied 2-factor authentication code")
         else:
-            otp = typer.prompt("Enter 6-digit Metrc 2-factor authentication code")
-            if not otp or len(otp) != 6 or not otp.isdigit():
-                print_error("Invalid 2-factor authentication entered.")
-                raise AuthenticationError(f"Invalid 2-factor authentication: {otp}")
-            credentials["otp"] = otp
+            otp = generate_otp_from_seed()
+            if otp:
+                print_info("Using OTP generated from configured seed")
+            else:
+                otp = typer.prompt("Enter 6-digit Metrc 2-factor authentication code")
+        if not otp or len(otp) != 6 or not otp.isdigit():
+            print_error("Invalid 2-factor authentication entered.")
+            raise AuthenticationError(f"Invalid 2-factor authentication: {otp}")
+        credentials["otp"] = otp
 
     if hostname in config_manager.get_email_whitelist():
         if email:
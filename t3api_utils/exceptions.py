@@ -1,5 +1,25 @@
 """Exception classes for the t3api_utils package."""
 
+from typing import Any, List
+
 
 class AuthenticationError(Exception):
     """Raised when authentication with the T3 API fails."""
+
+
+class PartialResultsError(TimeoutError):
+    """Raised when a paginated load exceeds its overall timeout.
+
+    Pages still in flight are cancelled; the pages that completed before
+    the deadline are kept on :attr:`partial`, in page order.
+    """
+
+    def __init__(self, message: str, *, partial: List[Any]) -> None:
+        """Initialize a PartialResultsError.
+
+        Args:
+            message: Human-readable description of the timeout.
+            partial: Responses of the pages loaded before the deadline.
+        """
+        super().__init__(message)
+        self.partial = partial
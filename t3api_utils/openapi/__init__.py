@@ -1,6 +1,19 @@
 """OpenAPI specification handling for T3 API endpoints."""
 
-from .spec_fetcher import fetch_openapi_spec, CollectionEndpoint, get_collection_endpoints
+from .spec_fetcher import (
+    CollectionEndpoint,
+    afetch_openapi_spec,
+    aget_collection_endpoints,
+    fetch_openapi_spec,
+    get_collection_endpoints,
+)
 from .collection_picker import pick_collection
 
-__all__ = ["fetch_openapi_spec", "CollectionEndpoint", "get_collection_endpoints", "pick_collection"]
\ No newline at end of file
+__all__ = [
+    "fetch_openapi_spec",
+    "afetch_openapi_spec",
+    "CollectionEndpoint",
+    "get_collection_endpoints",
+    "aget_collection_endpoints",
+    "pick_collection",
+]
\ No newline at end of file
@@ -1,13 +1,65 @@
 """OpenAPI specification fetcher and parser for T3 API collections."""
 
+import atexit
+import hashlib
+import json
+import logging
+import os
 import sys
-from typing import Any, Dict, List, TypedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
 
 import httpx
 
+try:  # orjson is optional; it parses the multi-hundred-KB spec noticeably faster
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
 from t3api_utils.cli.utils import config_manager
+from t3api_utils.logging import get_logger
 from t3api_utils.style import console
 
+logger = get_logger(__name__)
+
+
+def _default_cache_dir() -> Path:
+    """Resolve the per-user cache directory for t3api-utils.
+
+    Honours ``XDG_CACHE_HOME`` when set, then ``LOCALAPPDATA`` on Windows,
+    and falls back to ``~/.cache``.
+
+    Returns:
+        The ``t3api-utils`` directory inside the platform cache root.
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base and os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "t3api-utils"
+
+
+#: Directory holding the on-disk copy of the OpenAPI spec and its validators.
+SPEC_CACHE_DIR = _default_cache_dir()
+
+_CLIENT: Optional[httpx.Client] = None
+
+# Connection-level retries (DNS/TCP failures only; HTTP errors are not retried)
+_CONNECT_RETRIES = 2
+_SPEC_LIMITS = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30.0)
+
+# Parsed collection endpoints keyed by the SHA-1 of the raw spec bytes
+_PARSED_ENDPOINTS: Dict[str, List["CollectionEndpoint"]] = {}
+
+_HYPHEN_TO_SPACE = str.maketrans("-", " ")
+
+# Parameters that mark an operation as acting on a single resource
+_ID_PARAMETERS = frozenset({
+    "itemId", "packageId", "transferId", "harvestId", "plantId",
+    "plantBatchId", "salesId", "deliveryId", "labTestResultDocumentFileId",
+})
+
 
 class CollectionEndpoint(TypedDict):
     """Type definition for a collection endpoint.
@@ -26,38 +78,249 @@ class CollectionEndpoint(TypedDict):
     description: str
 
 
-def fetch_openapi_spec() -> Dict[str, Any]:
+def _loads_json(content: bytes) -> Any:
+    """Decode raw JSON bytes, preferring ``orjson`` when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _print_status(message: str) -> None:
+    """Print a progress line unless ``LOG_LEVEL`` is above ``INFO``.
+
+    Errors are always printed; only routine status output is suppressed so
+    scripts running with a quieter log level skip the Rich rendering.
     """
-    Fetch the OpenAPI specification from the live T3 API.
+    if logger.isEnabledFor(logging.INFO):
+        console.print(message)
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared spec client, creating it on first use.
+
+    Reusing one client keeps the connection to the API host alive across
+    calls instead of paying a fresh TCP/TLS handshake for every fetch. The
+    transport retries failed connection attempts so a transient DNS or TCP
+    error does not abort the CLI.
+    """
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.Client(
+            timeout=30.0,
+            transport=httpx.HTTPTransport(retries=_CONNECT_RETRIES, limits=_SPEC_LIMITS),
+        )
+    return _CLIENT
+
+
+@atexit.register
+def _close_client() -> None:
+    """Close the shared spec client at interpreter shutdown."""
+    if _CLIENT is not None:
+        _CLIENT.close()
+
+
+def _spec_cache_paths(spec_url: str) -> Tuple[Path, Path]:
+    """Return the cached spec body path and its sibling metadata path.
+
+    Args:
+        spec_url: Fully qualified URL of the OpenAPI spec.
 
     Returns:
-        The parsed OpenAPI specification as a dictionary.
+        A ``(spec_path, meta_path)`` tuple inside ``SPEC_CACHE_DIR``.
+    """
+    digest = hashlib.sha1(spec_url.encode("utf-8")).hexdigest()
+    return (
+        SPEC_CACHE_DIR / f"openapi-{digest}.json",
+        SPEC_CACHE_DIR / f"openapi-{digest}.meta.json",
+    )
+
+
+def _conditional_headers(spec_path: Path, meta_path: Path) -> Dict[str, str]:
+    """Build ``If-None-Match``/``If-Modified-Since`` headers from the cache.
+
+    Returns an empty dict when there is no usable cached copy, so the
+    request falls back to an unconditional GET.
+    """
+    if not spec_path.exists() or not meta_path.exists():
+        return {}
+
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+    headers: Dict[str, str] = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _write_spec_cache(spec_path: Path, meta_path: Path, response: httpx.Response) -> None:
+    """Persist the spec body and its validators, replacing files atomically.
+
+    Cache failures are logged and otherwise ignored; they never prevent the
+    freshly fetched spec from being used.
+    """
+    meta = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    if not meta["etag"] and not meta["last_modified"]:
+        return
+
+    try:
+        spec_path.parent.mkdir(parents=True, exist_ok=True)
+        for path, data in (
+            (spec_path, response.content),
+            (meta_path, json.dumps(meta).encode("utf-8")),
+        ):
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not write OpenAPI spec cache: {e}")
+
+
+def _spec_url() -> str:
+    """Return the OpenAPI spec URL for the configured API host."""
+    return f"{config_manager.get_api_host()}/v2/spec/openapi.json"
+
+
+def _read_spec_response(response: httpx.Response, spec_path: Path, meta_path: Path) -> bytes:
+    """Turn a (possibly conditional) spec response into raw spec bytes.
+
+    Reuses the cached body on ``304 Not Modified`` and refreshes the cache
+    on ``200``.
 
     Raises:
-        SystemExit: If the API cannot be reached or returns invalid data.
+        httpx.HTTPStatusError: If the response is neither 200 nor 304.
+        OSError: If the cached body cannot be read.
+    """
+    if response.status_code == 304:
+        content = spec_path.read_bytes()
+        _print_status("✓ OpenAPI spec unchanged, using cached copy")
+        return content
+
+    # raise_for_status only does work for non-200 responses; skip the
+    # call entirely on the common path. 3xx still raises, as before.
+    if response.status_code != 200:
+        response.raise_for_status()
+
+    _write_spec_cache(spec_path, meta_path, response)
+    _print_status("✓ OpenAPI spec fetched successfully")
+    return response.content
+
+
+def _fetch_spec_content(client: Optional[httpx.Client] = None) -> bytes:
+    """Return the raw OpenAPI spec bytes from the API or the on-disk cache.
+
+    A copy of the spec is kept in ``SPEC_CACHE_DIR`` together with the
+    server's ``ETag``/``Last-Modified`` validators. Subsequent calls send a
+    conditional request and reuse the cached body on ``304 Not Modified``.
+
+    Args:
+        client: Client to send the request with. Defaults to the shared
+            spec client.
+
+    Raises:
+        SystemExit: If the API cannot be reached or the cache cannot be read.
     """
-    api_host = config_manager.get_api_host()
-    spec_url = f"{api_host}/v2/spec/openapi.json"
+    spec_url = _spec_url()
 
-    console.print(f"Fetching OpenAPI spec from {spec_url}...")
+    _print_status(f"Fetching OpenAPI spec from {spec_url}...")
+
+    spec_path, meta_path = _spec_cache_paths(spec_url)
 
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(spec_url)
-            response.raise_for_status()
+        response = (client or _get_client()).get(
+            spec_url, headers=_conditional_headers(spec_path, meta_path)
+        )
+        return _read_spec_response(response, spec_path, meta_path)
 
-        spec: Dict[str, Any] = response.json()
-        console.print("✓ OpenAPI spec fetched successfully")
-        return spec
+    except (httpx.HTTPError, OSError) as e:
+        console.print(f"✗ Failed to fetch OpenAPI spec: {e}")
+        sys.exit(1)
 
-    except httpx.HTTPError as e:
+
+async def _afetch_spec_content() -> bytes:
+    """Async counterpart of :func:`_fetch_spec_content`.
+
+    Raises:
+        SystemExit: If the API cannot be reached or the cache cannot be read.
+    """
+    spec_url = _spec_url()
+
+    _print_status(f"Fetching OpenAPI spec from {spec_url}...")
+
+    spec_path, meta_path = _spec_cache_paths(spec_url)
+
+    try:
+        async with httpx.AsyncClient(
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(retries=_CONNECT_RETRIES),
+        ) as client:
+            response = await client.get(
+                spec_url, headers=_conditional_headers(spec_path, meta_path)
+            )
+        return _read_spec_response(response, spec_path, meta_path)
+
+    except (httpx.HTTPError, OSError) as e:
         console.print(f"✗ Failed to fetch OpenAPI spec: {e}")
         sys.exit(1)
+
+
+def _decode_spec(content: bytes) -> Dict[str, Any]:
+    """Decode raw spec bytes, exiting with an error message on invalid JSON.
+
+    Raises:
+        SystemExit: If the content is not valid JSON.
+    """
+    try:
+        spec: Dict[str, Any] = _loads_json(content)
+        return spec
     except Exception as e:
         console.print(f"✗ Error parsing OpenAPI spec: {e}")
         sys.exit(1)
 
 
+def fetch_openapi_spec(client: Optional[httpx.Client] = None) -> Dict[str, Any]:
+    """
+    Fetch the OpenAPI specification from the live T3 API.
+
+    The raw spec is cached on disk and revalidated with ``ETag`` /
+    ``If-None-Match``, so an unchanged spec is not downloaded again.
+
+    Args:
+        client: Client to send the request with, e.g. one built on an
+            ``httpx.MockTransport``. Defaults to a shared client that keeps
+            the connection to the API host alive between calls.
+
+    Returns:
+        The parsed OpenAPI specification as a dictionary.
+
+    Raises:
+        SystemExit: If the API cannot be reached or returns invalid data.
+    """
+    return _decode_spec(_fetch_spec_content(client))
+
+
+async def afetch_openapi_spec() -> Dict[str, Any]:
+    """Async variant of :func:`fetch_openapi_spec`.
+
+    Lets callers overlap the spec download with other requests, e.g.
+    ``await asyncio.gather(afetch_openapi_spec(), client.get_data(...))``.
+
+    Returns:
+        The parsed OpenAPI specification as a dictionary.
+
+    Raises:
+        SystemExit: If the API cannot be reached or returns invalid data.
+    """
+    return _decode_spec(await _afetch_spec_content())
+
+
 def parse_collection_endpoints(spec: Dict[str, Any]) -> List[CollectionEndpoint]:
     """
     Parse collection endpoints from OpenAPI spec.
@@ -72,49 +335,67 @@ def parse_collection_endpoints(spec: Dict[str, Any]) -> List[CollectionEndpoint]
         SystemExit: If no collection endpoints are found.
     """
     collection_endpoints: List[CollectionEndpoint] = []
+    append_endpoint = collection_endpoints.append
 
     paths = spec.get("paths", {})
 
     for path, path_item in paths.items():
-        for method, operation in path_item.items():
-            if not isinstance(operation, dict):
-                continue
+        if not isinstance(path_item, dict):
+            continue
 
-            tags = operation.get("tags", [])
-            summary = operation.get("summary", "")
+        # Collections are only served via GET; other methods and path-level
+        # keys such as "parameters" are never inspected
+        operation = path_item.get("get")
+        if not isinstance(operation, dict):
+            continue
 
-            # Look for collection endpoints based on pagination support
-            if not _is_collection_endpoint(operation, path):
-                continue
+        # Look for collection endpoints based on pagination support
+        if not _is_collection_endpoint(operation, path):
+            continue
 
-            # Extract endpoint metadata
-            description = operation.get("description", summary) or summary
+        tags = operation.get("tags", [])
+        summary = operation.get("summary", "")
 
-            # Determine category from path or tags
-            category = _determine_category(path, tags)
+        # Extract endpoint metadata
+        description = operation.get("description", summary) or summary
 
-            # Create display name from summary or path
-            name = _create_display_name(summary, path)
+        # Determine category from path or tags; interned because many
+        # endpoints share a handful of categories
+        category = sys.intern(_determine_category(path, tuple(tags)))
 
-            endpoint = CollectionEndpoint(
-                path=path,
-                method=method.upper(),
-                name=name,
-                category=category,
-                description=description
-            )
+        # Create display name from summary or path
+        name = _create_display_name(summary, path)
+
+        endpoint: CollectionEndpoint = {
+            "path": path,
+            "method": "GET",
+            "name": name,
+            "category": category,
+            "description": description,
+        }
 
-            collection_endpoints.append(endpoint)
+        append_endpoint(endpoint)
 
     if not collection_endpoints:
         console.print("✗ No collection endpoints found in OpenAPI spec")
         sys.exit(1)
 
-    console.print(f"✓ Found {len(collection_endpoints)} collection endpoints")
+    _print_status(f"✓ Found {len(collection_endpoints)} collection endpoints")
     return collection_endpoints
 
 
-def _determine_category(path: str, tags: List[str]) -> str:
+@lru_cache(maxsize=512)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Split an endpoint path into its segments, once per distinct path.
+
+    Shared by the category and display-name fallbacks so a path that needs
+    both is only split once, and paths that need neither are never split.
+    """
+    return tuple(path.strip("/").split("/"))
+
+
+@lru_cache(maxsize=512)
+def _determine_category(path: str, tags: Tuple[str, ...]) -> str:
     """Determine the category for an endpoint based on path and tags.
 
     Uses the first non-"Collection" tag if available, otherwise falls back
@@ -122,24 +403,26 @@ def _determine_category(path: str, tags: List[str]) -> str:
 
     Args:
         path: The endpoint URL path (e.g. ``/v2/packages/active``).
-        tags: OpenAPI tags associated with the operation.
+        tags: OpenAPI tags associated with the operation, as a tuple so
+            results can be memoized across operations sharing a path.
 
     Returns:
         A category string such as ``"Packages"`` or ``"General"``.
     """
-    # Remove Collection tag and use remaining tags
-    other_tags = [tag for tag in tags if tag != "Collection"]
-    if other_tags:
-        return other_tags[0]
+    # Use the first tag other than the generic Collection tag
+    for tag in tags:
+        if tag != "Collection":
+            return tag
 
     # Fallback to path-based categorization
-    path_parts = path.strip("/").split("/")
+    path_parts = _split_path(path)
     if len(path_parts) >= 2:
         return path_parts[1].title()  # e.g., "packages" -> "Packages"
 
     return "General"
 
 
+@lru_cache(maxsize=512)
 def _create_display_name(summary: str, path: str) -> str:
     """Create a user-friendly display name for the endpoint.
 
@@ -157,10 +440,10 @@ def _create_display_name(summary: str, path: str) -> str:
         return summary
 
     # Fallback: create name from path
-    path_parts = path.strip("/").split("/")
+    path_parts = _split_path(path)
     if len(path_parts) >= 2:
         name_parts = path_parts[1:]
-        return " ".join(part.replace("-", " ").title() for part in name_parts)
+        return " ".join(part.translate(_HYPHEN_TO_SPACE).title() for part in name_parts)
 
     return path
 
@@ -186,48 +469,48 @@ def _is_collection_endpoint(operation: Dict[str, Any], path: str) -> bool:
     # Check if the operation has parameters
     parameters = operation.get("parameters", [])
 
-    # Look for a 'page' parameter (inline or $ref to CollectionPage)
+    # Single pass: look for a 'page' parameter (inline or $ref to
+    # CollectionPage) and reject endpoints that require a specific ID
+    # parameter, since those operate on one resource rather than a collection
     has_page_param = False
     for param in parameters:
-        if isinstance(param, dict):
-            if param.get("name") == "page":
-                has_page_param = True
-                break
-            ref = param.get("$ref", "")
-            if ref.endswith("/CollectionPage"):
-                has_page_param = True
-                break
+        if not isinstance(param, dict):
+            continue
+        name = param.get("name")
+        if name in _ID_PARAMETERS:
+            return False
+        if name == "page" or param.get("$ref", "").endswith("/CollectionPage"):
+            has_page_param = True
 
     if not has_page_param:
         return False
 
-    # Check if this requires a specific ID parameter (single-item endpoints)
-    # These endpoints operate on a specific resource rather than collections
-    id_parameters = [
-        "itemId", "packageId", "transferId", "harvestId", "plantId",
-        "plantBatchId", "salesId", "deliveryId", "labTestResultDocumentFileId"
-    ]
-
-    for param in parameters:
-        if isinstance(param, dict) and param.get("name") in id_parameters:
-            return False
-
     # Also exclude report endpoints (they don't return JSON collections)
-    if "/report" in path:
-        return False
-
-    # Exclude create helper endpoints
-    if "/create/" in path:
-        return False
-
-    return True
+    # and create helper endpoints
+    return not ("/report" in path or "/create/" in path)
 
 
 def get_collection_endpoints() -> List[CollectionEndpoint]:
     """Fetch and parse collection endpoints from the live API.
 
     Convenience function that fetches the OpenAPI spec and extracts all
-    paginated collection endpoints in a single call.
+    paginated collection endpoints in a single call. Parsed endpoints are
+    memoized per spec digest, so an unchanged spec is neither decoded nor
+    walked again within the same process.
+
+    Returns:
+        A list of ``CollectionEndpoint`` dicts describing each available
+        collection.
+
+    Raises:
+        SystemExit: If the API spec cannot be fetched or contains no
+            collection endpoints.
+    """
+    return _endpoints_from_content(_fetch_spec_content())
+
+
+async def aget_collection_endpoints() -> List[CollectionEndpoint]:
+    """Async variant of :func:`get_collection_endpoints`.
 
     Returns:
         A list of ``CollectionEndpoint`` dicts describing each available
@@ -237,5 +520,16 @@ def get_collection_endpoints() -> List[CollectionEndpoint]:
         SystemExit: If the API spec cannot be fetched or contains no
             collection endpoints.
     """
-    spec = fetch_openapi_spec()
-    return parse_collection_endpoints(spec)
\ No newline at end of file
+    return _endpoints_from_content(await _afetch_spec_content())
+
+
+def _endpoints_from_content(content: bytes) -> List[CollectionEndpoint]:
+    """Parse collection endpoints from raw spec bytes, memoized per digest."""
+    digest = hashlib.sha1(content).hexdigest()
+
+    endpoints = _PARSED_ENDPOINTS.get(digest)
+    if endpoints is None:
+        endpoints = parse_collection_endpoints(_decode_spec(content))
+        _PARSED_ENDPOINTS[digest] = endpoints
+
+    return list(endpoints)
\ No newline at end of file
@@ -2,6 +2,8 @@
 
 from typing import Any
 
+from rich.text import Text
+
 from t3api_utils.style.console import console
 from t3api_utils.style.styles import (
     ERROR_SYMBOL,
@@ -16,6 +18,18 @@ from t3api_utils.style.styles import (
     WARNING_SYMBOL,
 )
 
+# Symbol prefixes parsed from markup once at import, so each print only has
+# to parse the caller's message rather than the constant decoration as well
+_SUCCESS_PREFIX = Text.from_markup(SUCCESS_SYMBOL)
+_ERROR_PREFIX = Text.from_markup(ERROR_SYMBOL)
+_WARNING_PREFIX = Text.from_markup(WARNING_SYMBOL)
+_INFO_PREFIX = Text.from_markup(INFO_SYMBOL)
+_PROGRESS_PREFIX = Text.from_markup(PROGRESS_SYMBOL)
+_MAIN_HEADER_PREFIX = Text.from_markup(MAIN_HEADER_PREFIX)
+_MAIN_HEADER_SUFFIX = Text.from_markup(MAIN_HEADER_SUFFIX)
+_SUB_HEADER_PREFIX = Text.from_markup(SUB_HEADER_PREFIX)
+_SUB_HEADER_SUFFIX = Text.from_markup(SUB_HEADER_SUFFIX)
+
 
 def print_success(message: str) -> None:
     """Print a success message with green checkmark.
@@ -23,7 +37,7 @@ def print_success(message: str) -> None:
     Args:
         message: Text to display after the green checkmark symbol.
     """
-    console.print(f"{SUCCESS_SYMBOL} {message}")
+    console.print(_SUCCESS_PREFIX, message)
 
 
 def print_error(message: str) -> None:
@@ -32,7 +46,7 @@ def print_error(message: str) -> None:
     Args:
         message: Text to display after the red X mark symbol.
     """
-    console.print(f"{ERROR_SYMBOL} {message}")
+    console.print(_ERROR_PREFIX, message)
 
 
 def print_warning(message: str) -> None:
@@ -41,7 +55,7 @@ def print_warning(message: str) -> None:
     Args:
         message: Text to display after the yellow warning symbol.
     """
-    console.print(f"{WARNING_SYMBOL} {message}")
+    console.print(_WARNING_PREFIX, message)
 
 
 def print_info(message: str) -> None:
@@ -50,7 +64,7 @@ def print_info(message: str) -> None:
     Args:
         message: Text to display after the blue info symbol.
     """
-    console.print(f"{INFO_SYMBOL} {message}")
+    console.print(_INFO_PREFIX, message)
 
 
 def print_progress(message: str) -> None:
@@ -59,7 +73,7 @@ def print_progress(message: str) -> None:
     Args:
         message: Status text to display after the purple dots symbol.
     """
-    console.print(f"{PROGRESS_SYMBOL} {message}")
+    console.print(_PROGRESS_PREFIX, message)
 
 
 def print_header(title: str) -> None:
@@ -68,7 +82,7 @@ def print_header(title: str) -> None:
     Args:
         title: Header text displayed between the decorative border symbols.
     """
-    console.print(f"{MAIN_HEADER_PREFIX} {title} {MAIN_HEADER_SUFFIX}")
+    console.print(_MAIN_HEADER_PREFIX, title, _MAIN_HEADER_SUFFIX)
 
 
 def print_subheader(title: str) -> None:
@@ -77,7 +91,7 @@ def print_subheader(title: str) -> None:
     Args:
         title: Subheader text displayed between the decorative border symbols.
     """
-    console.print(f"{SUB_HEADER_PREFIX} {title} {SUB_HEADER_SUFFIX}")
+    console.print(_SUB_HEADER_PREFIX, title, _SUB_HEADER_SUFFIX)
 
 
 def print_menu_item(number: int, text: str) -> None:
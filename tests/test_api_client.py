@@ -1,206 +1,220 @@
 """Tests for T3APIClient."""
-from unittest.mock import MagicMock, Mock, patch
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from unittest.mock import AsyncMock
 
-import httpx
 import pytest
+import pytest_asyncio
 
+from t3api_utils.api import client as _client_module
 from t3api_utils.api.client import T3APIClient
 from t3api_utils.api.interfaces import AuthResponseData, MetrcCollectionResponse
 from t3api_utils.http.utils import HTTPConfig, RetryPolicy, T3HTTPError
 
 
-class TestT3APIClient:
-    """Test T3APIClient async operations."""
-
-    def test_initialization(self):
-        """Test client initialization."""
-        client = T3APIClient()
-        assert client._config is not None
-        assert client._retry_policy is not None
-        assert not client.is_authenticated
-        assert client.access_token is None
-
-    def test_initialization_with_config(self):
-        """Test client initialization with custom config."""
-        config = HTTPConfig(host="https://custom.api.com")
-        retry_policy = RetryPolicy(max_attempts=5)
-        headers = {"Custom-Header": "value"}
-
-        client = T3APIClient(
-            config=config,
-            retry_policy=retry_policy,
-            headers=headers
-        )
-
-        assert client._config == config
-        assert client._retry_policy == retry_policy
-        assert client._extra_headers == headers
-
-    @pytest.mark.asyncio
-    async def test_context_manager(self):
-        """Test context manager functionality."""
-        with patch.object(httpx.AsyncClient, 'aclose') as mock_close:
-            async with T3APIClient() as client:
-                assert isinstance(client, T3APIClient)
-            mock_close.assert_called_once()
-
-    def test_set_access_token(self):
-        """Test setting access token."""
-        client = T3APIClient()
-        token = "test_access_token"
-
-        client.set_access_token(token)
-
-        assert client.is_authenticated
-        assert client.access_token == token
-        assert client._client.headers["Authorization"] == f"Bearer {token}"
-
-    def test_clear_access_token(self):
-        """Test clearing access token."""
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
-        client.clear_access_token()
-
-        assert not client.is_authenticated
-        assert client.access_token is None
-        assert "Authorization" not in client._client.headers
-
-    @patch('t3api_utils.api.client.arequest_json')
-    @pytest.mark.asyncio
-    async def test_authenticate_with_credentials_success(self, mock_request):
-        """Test successful authentication."""
-        # Mock the API response
-        mock_response = {
-            "accessToken": "test_access_token",
-        }
-        mock_request.return_value = mock_response
-
-        client = T3APIClient()
-        result = await client.authenticate_with_credentials(
-            hostname="test.example.com",
-            username="testuser",
-            password="testpass",
-            otp="123456",
-            email="test@example.com"
-        )
-
-        # Verify the request was made correctly
-        mock_request.assert_called_once()
-        call_args = mock_request.call_args
-        assert call_args[1]["method"] == "POST"
-        assert call_args[1]["url"] == "/v2/auth/credentials"
-        assert call_args[1]["json_body"] == {
+_CUSTOM_CONFIG = HTTPConfig(host="https://custom.api.com")
+_CUSTOM_RETRY = RetryPolicy(max_attempts=5)
+
+_EXPECTED_AUTH = "Bearer test_access_token"
+_EXPECTED_API_KEY_BODY = MappingProxyType({"apiKey": "test-api-key", "stateCode": "CA"})
+
+_CREDENTIALS_RESPONSE = MappingProxyType({"accessToken": "test_access_token"})
+_API_KEY_RESPONSE = MappingProxyType({
+    "accessToken": "test_api_key_token",
+    "refreshToken": "test_refresh_token",
+    "expiresIn": 3600,
+})
+
+
+class RecordingStub:
+    """Async stand-in for ``arequest_json`` that records each call's arguments."""
+
+    def __init__(self) -> None:
+        self.return_value: Any = None
+        self.side_effect: Optional[BaseException] = None
+        self.calls: List[Tuple[Tuple[Any, ...], Dict[str, Any]]] = []
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+    @property
+    def call_args(self) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        return self.calls[-1]
+
+    def assert_called_once(self) -> None:
+        assert len(self.calls) == 1, f"expected 1 call, got {len(self.calls)}"
+
+
+@pytest_asyncio.fixture(scope="module")
+async def shared_client() -> AsyncIterator[T3APIClient]:
+    """One T3APIClient (and httpx pool) for every stateless test in this module."""
+    async with T3APIClient() as client:
+        yield client
+
+
+@pytest.fixture
+def client(shared_client: T3APIClient) -> Iterator[T3APIClient]:
+    """The shared client, reset to an unauthenticated state after each test."""
+    yield shared_client
+    shared_client.clear_access_token()
+
+
+@pytest.fixture
+def mock_request(monkeypatch: pytest.MonkeyPatch) -> RecordingStub:
+    """Replace ``arequest_json`` in the client module with a :class:`RecordingStub`."""
+    stub = RecordingStub()
+    monkeypatch.setattr(_client_module, "arequest_json", stub)
+    return stub
+
+
+def test_initialization(client):
+    """Test client initialization."""
+    assert client._config is not None
+    assert client._retry_policy is not None
+    assert not client.is_authenticated
+    assert client.access_token is None
+
+
+def test_initialization_with_config():
+    """Test client initialization with custom config."""
+    headers = {"Custom-Header": "value"}
+
+    client = T3APIClient(
+        config=_CUSTOM_CONFIG,
+        retry_policy=_CUSTOM_RETRY,
+        headers=headers
+    )
+
+    assert client._config is _CUSTOM_CONFIG
+    assert client._retry_policy is _CUSTOM_RETRY
+    assert client._extra_headers == headers
+
+
+@pytest.mark.asyncio
+async def test_context_manager(monkeypatch):
+    """Test context manager functionality."""
+    client = T3APIClient()
+    mock_close = AsyncMock()
+    monkeypatch.setattr(client._client, "aclose", mock_close)
+
+    async with client as entered:
+        assert entered is client
+    mock_close.assert_awaited_once()
+
+
+def test_set_access_token(client):
+    """Test setting access token."""
+    token = "test_access_token"
+
+    client.set_access_token(token)
+
+    assert client.is_authenticated
+    assert client.access_token == token
+    assert client._client.headers["Authorization"] == _EXPECTED_AUTH
+
+
+def test_clear_access_token(client):
+    """Test clearing access token."""
+    client.set_access_token("test_token")
+
+    client.clear_access_token()
+
+    assert not client.is_authenticated
+    assert client.access_token is None
+    assert "Authorization" not in client._client.headers
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {
             "hostname": "test.example.com",
             "username": "testuser",
             "password": "testpass",
             "otp": "123456",
-            "email": "test@example.com"
-        }
-
-        # Verify the response
-        assert isinstance(result, dict)
-        assert result["accessToken"] == "test_access_token"
-
-        # Verify client state
-        assert client.is_authenticated
-        assert client.access_token == "test_access_token"
-
-    @patch('t3api_utils.api.client.arequest_json')
-    @pytest.mark.asyncio
-    async def test_authenticate_with_credentials_minimal(self, mock_request):
-        """Test authentication with minimal parameters."""
-        mock_response = {
-            "accessToken": "test_access_token"
-        }
-        mock_request.return_value = mock_response
-
-        client = T3APIClient()
-        result = await client.authenticate_with_credentials(
-            hostname="test.example.com",
-            username="testuser",
-            password="testpass"
-        )
-
-        # Verify the request payload
-        call_args = mock_request.call_args
-        assert call_args[1]["json_body"] == {
+            "email": "test@example.com",
+        },
+        {
             "hostname": "test.example.com",
             "username": "testuser",
-            "password": "testpass"
-        }
-
-        # Verify response handling
-        assert result["accessToken"] == "test_access_token"
-
-    @patch('t3api_utils.api.client.arequest_json')
-    @pytest.mark.asyncio
-    async def test_authenticate_with_credentials_failure(self, mock_request):
-        """Test authentication failure."""
-        mock_request.side_effect = T3HTTPError("Authentication failed")
-
-        client = T3APIClient()
-
-        with pytest.raises(T3HTTPError) as exc_info:
-            await client.authenticate_with_credentials(
-                hostname="test.example.com",
-                username="testuser",
-                password="wrongpass"
-            )
-
-        assert "Authentication failed" in str(exc_info.value)
-        assert not client.is_authenticated
-
-    @patch('t3api_utils.api.client.arequest_json')
-    @pytest.mark.asyncio
-    async def test_authenticate_with_api_key_success(self, mock_request):
-        """Test successful API key authentication."""
-        mock_response = {
-            "accessToken": "test_api_key_token",
-            "refreshToken": "test_refresh_token",
-            "expiresIn": 3600
-        }
-        mock_request.return_value = mock_response
-
-        client = T3APIClient()
-
-        result = await client.authenticate_with_api_key(
-            api_key="test-api-key",
-            state_code="CA"
-        )
-
-        # Verify request was made correctly
-        mock_request.assert_called_once()
-        call_args = mock_request.call_args
-        assert call_args[1]["method"] == "POST"
-        assert call_args[1]["url"] == "/v2/auth/apikey"
-        assert call_args[1]["json_body"] == {
-            "apiKey": "test-api-key",
-            "stateCode": "CA"
-        }
-
-        # Verify response handling
-        assert result["accessToken"] == "test_api_key_token"
-        assert client.is_authenticated
-        assert client.access_token == "test_api_key_token"
-
-    @patch('t3api_utils.api.client.arequest_json')
-    @pytest.mark.asyncio
-    async def test_authenticate_with_api_key_failure(self, mock_request):
-        """Test API key authentication failure."""
-        mock_request.side_effect = T3HTTPError("Invalid API key")
-
-        client = T3APIClient()
-
-        with pytest.raises(T3HTTPError) as exc_info:
-            await client.authenticate_with_api_key(
-                api_key="invalid-key",
-                state_code="CA"
-            )
-
-        assert "API key authentication failed: Invalid API key" in str(exc_info.value)
-        assert not client.is_authenticated
-
-
-
-
+            "password": "testpass",
+        },
+    ],
+    ids=["with_otp_and_email", "minimal"],
+)
+@pytest.mark.asyncio
+async def test_authenticate_with_credentials_success(mock_request, client, kwargs):
+    """Test successful authentication sends only the provided credential fields."""
+    mock_request.return_value = _CREDENTIALS_RESPONSE
+
+    result = await client.authenticate_with_credentials(**kwargs)
+
+    # Verify the request was made correctly
+    mock_request.assert_called_once()
+    call_args = mock_request.call_args
+    assert call_args[1]["method"] == "POST"
+    assert call_args[1]["url"] == "/v2/auth/credentials"
+    assert call_args[1]["json_body"] == kwargs
+
+    # Verify the response
+    assert result is _CREDENTIALS_RESPONSE
+    assert result["accessToken"] == "test_access_token"
+
+    # Verify client state
+    assert client.is_authenticated
+    assert client.access_token == "test_access_token"
+
+
+@pytest.mark.asyncio
+async def test_authenticate_with_api_key_success(mock_request, client):
+    """Test successful API key authentication."""
+    mock_request.return_value = _API_KEY_RESPONSE
+
+    result = await client.authenticate_with_api_key(
+        api_key="test-api-key",
+        state_code="CA"
+    )
+
+    # Verify request was made correctly
+    mock_request.assert_called_once()
+    call_args = mock_request.call_args
+    assert call_args[1]["method"] == "POST"
+    assert call_args[1]["url"] == "/v2/auth/apikey"
+    assert call_args[1]["json_body"] == _EXPECTED_API_KEY_BODY
+
+    # Verify response handling
+    assert result["accessToken"] == "test_api_key_token"
+    assert client.is_authenticated
+    assert client.access_token == "test_api_key_token"
+
+
+@pytest.mark.parametrize(
+    ("method", "kwargs", "upstream_error", "expected_message"),
+    [
+        (
+            "authenticate_with_credentials",
+            {"hostname": "test.example.com", "username": "testuser", "password": "wrongpass"},
+            "Invalid credentials",
+            "Authentication failed: Invalid credentials",
+        ),
+        (
+            "authenticate_with_api_key",
+            {"api_key": "invalid-key", "state_code": "CA"},
+            "Invalid API key",
+            "API key authentication failed: Invalid API key",
+        ),
+    ],
+    ids=["credentials", "api_key"],
+)
+@pytest.mark.asyncio
+async def test_authenticate_failure(mock_request, client, method, kwargs, upstream_error, expected_message):
+    """Test authentication failures are re-raised with context and leave the client unauthenticated."""
+    mock_request.side_effect = T3HTTPError(upstream_error)
+
+    with pytest.raises(T3HTTPError, match=expected_message):
+        await getattr(client, method)(**kwargs)
+
+    assert not client.is_authenticated
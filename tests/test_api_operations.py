@@ -1,20 +1,72 @@
 """Tests for T3 API operations."""
+from types import MappingProxyType
+from typing import AsyncIterator, Iterator
 from unittest.mock import patch
 
 import pytest
+import pytest_asyncio
 
 from t3api_utils.api.client import T3APIClient
 from t3api_utils.api.operations import (get_collection, get_collection_async,
                                         send_api_request, send_api_request_async)
+from t3api_utils.http import utils as _http_utils
 from t3api_utils.http.utils import T3HTTPError
 
 
+_EXPECTED_PACKAGES_PARAMS = MappingProxyType({
+    "licenseNumber": "LIC-001",
+    "page": 1,
+    "pageSize": 100,
+    "strictPagination": False,
+    "filterLogic": "and",
+})
+_LICENSES_PARAMS = MappingProxyType({"page": 2, "pageSize": 50, "state": "CA", "active_only": True})
+
+@pytest_asyncio.fixture(scope="module")
+async def shared_client() -> AsyncIterator[T3APIClient]:
+    """One T3APIClient (and httpx pool) for every test in this module."""
+    async with T3APIClient() as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _reset_client(shared_client: T3APIClient) -> Iterator[None]:
+    """Return the shared client to an unauthenticated state after each test."""
+    yield
+    shared_client.clear_access_token()
+
+
+@pytest.fixture
+def client_with_token(shared_client: T3APIClient) -> T3APIClient:
+    """The shared client with a test token set."""
+    shared_client.set_access_token("test_token")
+    return shared_client
+
+
 class TestSyncOperations:
     """Test synchronous API operations."""
 
-    @patch('t3api_utils.http.utils.request_json')
-    def test_get_collection_success(self, mock_request):
-        """Test successful collection retrieval."""
+    @pytest.mark.parametrize(
+        ("operation", "path", "kwargs", "expected_params"),
+        [
+            (
+                get_collection,
+                "/v2/packages/active",
+                {"license_number": "LIC-001"},
+                _EXPECTED_PACKAGES_PARAMS,
+            ),
+            (
+                send_api_request,
+                "/v2/licenses",
+                {"params": dict(_LICENSES_PARAMS)},
+                _LICENSES_PARAMS,
+            ),
+        ],
+        ids=["get_collection", "send_api_request_with_params"],
+    )
+    @patch.object(_http_utils, 'request_json')
+    def test_get_request_success(self, mock_request, operation, path, kwargs, expected_params, client_with_token):
+        """Test GET operations send the expected URL and query parameters."""
         mock_response = {
             "data": [
                 {
@@ -29,71 +81,26 @@ class TestSyncOperations:
         }
         mock_request.return_value = mock_response
 
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
-        result = get_collection(client, "/v2/packages/active", license_number="LIC-001")
+        result = operation(client_with_token, path, **kwargs)
 
         # Verify the request
         mock_request.assert_called_once()
         call_args = mock_request.call_args
         assert call_args[1]["method"] == "GET"
-        assert call_args[1]["url"] == "/v2/packages/active"
-        expected_params = {
-            "licenseNumber": "LIC-001",
-            "page": 1,
-            "pageSize": 100,
-            "strictPagination": False,
-            "filterLogic": "and"
-        }
+        assert call_args[1]["url"] == path
         assert call_args[1]["params"] == expected_params
 
         # Verify the response
-        assert isinstance(result, dict)
-        assert len(result["data"]) == 1
-        assert result["data"][0]["licenseNumber"] == "LIC-001"
-
-    @patch('t3api_utils.http.utils.request_json')
-    def test_get_data_with_params(self, mock_request):
-        """Test get_data with custom parameters."""
-        mock_response = {"data": [], "total": 0, "page": 2, "pageSize": 50}
-        mock_request.return_value = mock_response
-
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
-        result = send_api_request(
-            client,
-            "/v2/licenses",
-            params={
-                "page": 2,
-                "pageSize": 50,
-                "state": "CA",
-                "active_only": True
-            }
-        )
+        assert result == mock_response
 
-        # Verify the request parameters
-        call_args = mock_request.call_args
-        expected_params = {
-            "page": 2,
-            "pageSize": 50,
-            "state": "CA",
-            "active_only": True
-        }
-        assert call_args[1]["params"] == expected_params
-
-    @patch('t3api_utils.http.utils.request_json')
-    def test_send_api_request_with_files(self, mock_request):
+    @patch.object(_http_utils, 'request_json')
+    def test_send_api_request_with_files(self, mock_request, client_with_token):
         """Test send_api_request with multipart file upload."""
         mock_request.return_value = {"uploaded": True}
 
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
         test_files = {"file": ("test.png", b"\x89PNG", "image/png")}
         result = send_api_request(
-            client,
+            client_with_token,
             "/v2/items/images/file",
             method="POST",
             params={"licenseNumber": "LIC-001", "fileType": "ItemProductImage", "submit": True},
@@ -107,131 +114,62 @@ class TestSyncOperations:
         assert call_args[1]["method"] == "POST"
         assert call_args[1]["params"]["licenseNumber"] == "LIC-001"
 
-    def test_send_api_request_files_and_json_body_mutually_exclusive(self):
+    def test_send_api_request_files_and_json_body_mutually_exclusive(self, client_with_token):
         """Test that providing both json_body and files raises ValueError."""
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
         with pytest.raises(ValueError, match="mutually exclusive"):
             send_api_request(
-                client,
+                client_with_token,
                 "/v2/test",
                 method="POST",
                 json_body={"data": "test"},
                 files={"file": ("test.png", b"\x89PNG", "image/png")},
             )
 
-    def test_send_api_request_not_authenticated(self):
-        """Test send_api_request without authentication."""
-        client = T3APIClient()
-
-        with pytest.raises(T3HTTPError) as exc_info:
-            send_api_request(client, "/v2/licenses")
-
-        assert "not authenticated" in str(exc_info.value)
-
-    def test_get_collection_not_authenticated(self):
-        """Test collection retrieval without authentication."""
-        client = T3APIClient()
-
-        with pytest.raises(T3HTTPError) as exc_info:
-            get_collection(client, "/v2/packages/active", license_number="LIC-001")
-
-        assert "not authenticated" in str(exc_info.value)
-
-    @patch('t3api_utils.http.utils.request_json')
-    def test_get_packages_success(self, mock_request):
-        """Test successful packages retrieval."""
-        mock_response = {
-            "data": [
-                {
-                    "id": "pkg-123",
-                    "licenseNumber": "LIC-001",
-                    "tag": "TAG-001"
-                }
-            ],
-            "total": 1,
-            "page": 1,
-            "pageSize": 100
-        }
-        mock_request.return_value = mock_response
-
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
-        result = get_collection(client, "/v2/packages/active", license_number="LIC-001")
-
-        # Verify the request
-        mock_request.assert_called_once()
-        call_args = mock_request.call_args
-        assert call_args[1]["method"] == "GET"
-        assert call_args[1]["url"] == "/v2/packages/active"
-        expected_params = {
-            "licenseNumber": "LIC-001",
-            "page": 1,
-            "pageSize": 100,
-            "strictPagination": False,
-            "filterLogic": "and"
-        }
-        assert call_args[1]["params"] == expected_params
-
-        # Verify the response
-        assert isinstance(result, dict)
-        assert len(result["data"]) == 1
-        assert result["data"][0]["licenseNumber"] == "LIC-001"
-
-    def test_get_packages_not_authenticated(self):
-        """Test packages retrieval without authentication."""
-        client = T3APIClient()
-
-        with pytest.raises(T3HTTPError) as exc_info:
-            get_collection(client, "/v2/packages/active", license_number="LIC-001")
-
-        assert "not authenticated" in str(exc_info.value)
-
-    @patch('t3api_utils.http.utils.request_json')
-    def test_get_packages_api_error(self, mock_request):
+    @pytest.mark.parametrize(
+        ("operation", "path", "kwargs"),
+        [
+            (send_api_request, "/v2/licenses", {}),
+            (get_collection, "/v2/packages/active", {"license_number": "LIC-001"}),
+        ],
+        ids=["send_api_request", "get_collection"],
+    )
+    def test_not_authenticated(self, operation, path, kwargs, shared_client):
+        """Test operations refuse to run without authentication."""
+        with pytest.raises(T3HTTPError, match="not authenticated"):
+            operation(shared_client, path, **kwargs)
+
+    @patch.object(_http_utils, 'request_json')
+    def test_get_packages_api_error(self, mock_request, client_with_token):
         """Test packages retrieval with API error."""
         mock_request.side_effect = T3HTTPError("API Error")
 
-        client = T3APIClient()
-        client.set_access_token("test_token")
+        with pytest.raises(T3HTTPError, match="Failed to get collection"):
+            get_collection(client_with_token, "/v2/packages/active", license_number="LIC-001")
 
-        with pytest.raises(T3HTTPError) as exc_info:
-            get_collection(client, "/v2/packages/active", license_number="LIC-001")
-
-        assert "Failed to get collection" in str(exc_info.value)
-
-    @patch('t3api_utils.http.utils.request_bytes')
-    def test_send_api_request_response_type_bytes(self, mock_request):
+    @patch.object(_http_utils, 'request_bytes')
+    def test_send_api_request_response_type_bytes(self, mock_request, client_with_token):
         """Test send_api_request with response_type='bytes'."""
         mock_request.return_value = b"\x89PNG\r\n\x1a\n"
 
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
-        result = send_api_request(client, "/v2/reports/manifest", response_type="bytes")
+        result = send_api_request(client_with_token, "/v2/reports/manifest", response_type="bytes")
 
         assert result == b"\x89PNG\r\n\x1a\n"
         assert isinstance(result, bytes)
         mock_request.assert_called_once()
 
-    @patch('t3api_utils.http.utils.request_text')
-    def test_send_api_request_response_type_text(self, mock_request):
+    @patch.object(_http_utils, 'request_text')
+    def test_send_api_request_response_type_text(self, mock_request, client_with_token):
         """Test send_api_request with response_type='text'."""
         mock_request.return_value = "col1,col2\na,b\n"
 
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
-        result = send_api_request(client, "/v2/exports/packages.csv", response_type="text")
+        result = send_api_request(client_with_token, "/v2/exports/packages.csv", response_type="text")
 
         assert result == "col1,col2\na,b\n"
         assert isinstance(result, str)
         mock_request.assert_called_once()
 
-    @patch('t3api_utils.http.utils.request_raw')
-    def test_send_api_request_response_type_response(self, mock_request):
+    @patch.object(_http_utils, 'request_raw')
+    def test_send_api_request_response_type_response(self, mock_request, client_with_token):
         """Test send_api_request with response_type='response'."""
         from unittest.mock import MagicMock
         mock_response = MagicMock()
@@ -239,23 +177,17 @@ class TestSyncOperations:
         mock_response.headers = {"content-type": "application/pdf"}
         mock_request.return_value = mock_response
 
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
-        result = send_api_request(client, "/v2/reports/summary", response_type="response")
+        result = send_api_request(client_with_token, "/v2/reports/summary", response_type="response")
 
         assert result is mock_response
         assert result.headers["content-type"] == "application/pdf"
 
-    @patch('t3api_utils.http.utils.request_json')
-    def test_send_api_request_default_response_type(self, mock_request):
+    @patch.object(_http_utils, 'request_json')
+    def test_send_api_request_default_response_type(self, mock_request, client_with_token):
         """Test send_api_request defaults to response_type='json'."""
         mock_request.return_value = {"key": "value"}
 
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
-        result = send_api_request(client, "/v2/licenses")
+        result = send_api_request(client_with_token, "/v2/licenses")
 
         assert result == {"key": "value"}
         mock_request.assert_called_once()
@@ -265,8 +197,8 @@ class TestAsyncOperations:
     """Test asynchronous API operations."""
 
     @pytest.mark.asyncio
-    @patch('t3api_utils.http.utils.arequest_json')
-    async def test_send_api_request_async_success(self, mock_request):
+    @patch.object(_http_utils, 'arequest_json')
+    async def test_send_api_request_async_success(self, mock_request, client_with_token):
         """Test successful async send_api_request."""
         mock_response = {
             "data": [
@@ -282,10 +214,7 @@ class TestAsyncOperations:
         }
         mock_request.return_value = mock_response
 
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
-        result = await send_api_request_async(client, "/v2/licenses")
+        result = await send_api_request_async(client_with_token, "/v2/licenses")
 
         # Verify the request
         mock_request.assert_called_once()
@@ -294,21 +223,17 @@ class TestAsyncOperations:
         assert call_args[1]["url"] == "/v2/licenses"
 
         # Verify the response
-        assert isinstance(result, dict)
         assert len(result["data"]) == 1
 
     @pytest.mark.asyncio
-    @patch('t3api_utils.http.utils.arequest_json')
-    async def test_send_api_request_async_with_files(self, mock_request):
+    @patch.object(_http_utils, 'arequest_json')
+    async def test_send_api_request_async_with_files(self, mock_request, client_with_token):
         """Test async send_api_request with multipart file upload."""
         mock_request.return_value = {"uploaded": True}
 
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
         test_files = {"file": ("test.png", b"\x89PNG", "image/png")}
         result = await send_api_request_async(
-            client,
+            client_with_token,
             "/v2/items/images/file",
             method="POST",
             params={"licenseNumber": "LIC-001"},
@@ -321,14 +246,11 @@ class TestAsyncOperations:
         assert call_args[1]["json_body"] is None
 
     @pytest.mark.asyncio
-    async def test_send_api_request_async_files_and_json_body_mutually_exclusive(self):
+    async def test_send_api_request_async_files_and_json_body_mutually_exclusive(self, client_with_token):
         """Test that providing both json_body and files raises ValueError (async)."""
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
         with pytest.raises(ValueError, match="mutually exclusive"):
             await send_api_request_async(
-                client,
+                client_with_token,
                 "/v2/test",
                 method="POST",
                 json_body={"data": "test"},
@@ -336,28 +258,20 @@ class TestAsyncOperations:
             )
 
     @pytest.mark.asyncio
-    async def test_send_api_request_async_not_authenticated(self):
+    async def test_send_api_request_async_not_authenticated(self, shared_client):
         """Test async send_api_request without authentication."""
-        client = T3APIClient()
-
-        with pytest.raises(T3HTTPError) as exc_info:
-            await send_api_request_async(client, "/v2/licenses")
-
-        assert "not authenticated" in str(exc_info.value)
+        with pytest.raises(T3HTTPError, match="not authenticated"):
+            await send_api_request_async(shared_client, "/v2/licenses")
 
     @pytest.mark.asyncio
-    async def test_get_collection_async_not_authenticated(self):
+    async def test_get_collection_async_not_authenticated(self, shared_client):
         """Test async collection retrieval without authentication."""
-        client = T3APIClient()
-
-        with pytest.raises(T3HTTPError) as exc_info:
-            await get_collection_async(client, "/v2/packages/active", license_number="LIC-001")
-
-        assert "not authenticated" in str(exc_info.value)
+        with pytest.raises(T3HTTPError, match="not authenticated"):
+            await get_collection_async(shared_client, "/v2/packages/active", license_number="LIC-001")
 
     @pytest.mark.asyncio
-    @patch('t3api_utils.http.utils.arequest_json')
-    async def test_get_packages_success(self, mock_request):
+    @patch.object(_http_utils, 'arequest_json')
+    async def test_get_packages_success(self, mock_request, client_with_token):
         """Test successful async packages retrieval."""
         mock_response = {
             "data": [
@@ -373,10 +287,7 @@ class TestAsyncOperations:
         }
         mock_request.return_value = mock_response
 
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
-        result = await get_collection_async(client, "/v2/packages/active", license_number="LIC-001")
+        result = await get_collection_async(client_with_token, "/v2/packages/active", license_number="LIC-001")
 
         # Verify the request
         mock_request.assert_called_once()
@@ -385,53 +296,41 @@ class TestAsyncOperations:
         assert call_args[1]["url"] == "/v2/packages/active"
 
         # Verify the response
-        assert isinstance(result, dict)
         assert len(result["data"]) == 1
 
     @pytest.mark.asyncio
-    async def test_get_packages_not_authenticated(self):
+    async def test_get_packages_not_authenticated(self, shared_client):
         """Test async packages retrieval without authentication."""
-        client = T3APIClient()
-
-        with pytest.raises(T3HTTPError) as exc_info:
-            await get_collection_async(client, "/v2/packages/active", license_number="LIC-001")
-
-        assert "not authenticated" in str(exc_info.value)
-        assert "not authenticated" in str(exc_info.value)
+        with pytest.raises(T3HTTPError, match="not authenticated"):
+            await get_collection_async(shared_client, "/v2/packages/active", license_number="LIC-001")
 
     @pytest.mark.asyncio
-    @patch('t3api_utils.http.utils.arequest_bytes')
-    async def test_send_api_request_async_response_type_bytes(self, mock_request):
+    @patch.object(_http_utils, 'arequest_bytes')
+    async def test_send_api_request_async_response_type_bytes(self, mock_request, client_with_token):
         """Test async send_api_request with response_type='bytes'."""
         mock_request.return_value = b"%PDF-1.4"
 
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
-        result = await send_api_request_async(client, "/v2/reports/manifest", response_type="bytes")
+        result = await send_api_request_async(client_with_token, "/v2/reports/manifest", response_type="bytes")
 
         assert result == b"%PDF-1.4"
         assert isinstance(result, bytes)
         mock_request.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch('t3api_utils.http.utils.arequest_text')
-    async def test_send_api_request_async_response_type_text(self, mock_request):
+    @patch.object(_http_utils, 'arequest_text')
+    async def test_send_api_request_async_response_type_text(self, mock_request, client_with_token):
         """Test async send_api_request with response_type='text'."""
         mock_request.return_value = "<html><body>Report</body></html>"
 
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
-        result = await send_api_request_async(client, "/v2/reports/summary", response_type="text")
+        result = await send_api_request_async(client_with_token, "/v2/reports/summary", response_type="text")
 
         assert result == "<html><body>Report</body></html>"
         assert isinstance(result, str)
         mock_request.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch('t3api_utils.http.utils.arequest_raw')
-    async def test_send_api_request_async_response_type_response(self, mock_request):
+    @patch.object(_http_utils, 'arequest_raw')
+    async def test_send_api_request_async_response_type_response(self, mock_request, client_with_token):
         """Test async send_api_request with response_type='response'."""
         from unittest.mock import MagicMock
         mock_response = MagicMock()
@@ -439,23 +338,17 @@ class TestAsyncOperations:
         mock_response.headers = {"content-type": "text/csv"}
         mock_request.return_value = mock_response
 
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
-        result = await send_api_request_async(client, "/v2/exports/data.csv", response_type="response")
+        result = await send_api_request_async(client_with_token, "/v2/exports/data.csv", response_type="response")
 
         assert result is mock_response
 
     @pytest.mark.asyncio
-    @patch('t3api_utils.http.utils.arequest_json')
-    async def test_send_api_request_async_default_response_type(self, mock_request):
+    @patch.object(_http_utils, 'arequest_json')
+    async def test_send_api_request_async_default_response_type(self, mock_request, client_with_token):
         """Test async send_api_request defaults to response_type='json'."""
         mock_request.return_value = {"licenses": []}
 
-        client = T3APIClient()
-        client.set_access_token("test_token")
-
-        result = await send_api_request_async(client, "/v2/licenses")
+        result = await send_api_request_async(client_with_token, "/v2/licenses")
 
         assert result == {"licenses": []}
         mock_request.assert_called_once()
\ No newline at end of file
@@ -1,112 +1,257 @@
 """Tests for parallel API utilities."""
 import asyncio
+import threading
 import time
-from typing import Any, List
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, Iterator, List
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
-from t3api_utils.api.client import T3APIClient, T3APIClient
+from t3api_utils.api import client as _client_module
+from t3api_utils.api import parallel as parallel_module
+from t3api_utils.api.client import T3APIClient
 from t3api_utils.api.interfaces import MetrcCollectionResponse
 from t3api_utils.api.parallel import (RateLimiter, load_all_data_async,
                                       load_all_data_sync,
                                       parallel_load_collection_enhanced,
                                       parallel_load_paginated_async,
-                                      parallel_load_paginated_sync)
+                                      parallel_load_paginated_sync,
+                                      parallel_stream_paginated_async,
+                                      reset_limiters)
+from t3api_utils.exceptions import PartialResultsError
+from t3api_utils.http.utils import (HTTPConfig, RetryPolicy, T3HTTPError,
+                                    build_async_client)
+
+
+_SINGLE_PAGE_RESPONSE: MetrcCollectionResponse = {
+    "data": [{
+        "id": 1,
+        "hostname": "ca.metrc.com",
+        "licenseNumber": "LIC-001",
+        "dataModel": "LICENSE",
+        "retrievedAt": "2025-09-23T13:19:22.734Z"
+    }],
+    "total": 1,
+    "page": 1,
+    "pageSize": 10
+}
+_ENHANCED_RESPONSE = {
+    "total": 5,
+    "pageSize": 10,
+    "data": [{"id": "1"}] * 5
+}
+_TWO_PAGE_RESPONSES: List[Dict[str, Any]] = [
+    {
+        "data": [
+            {
+                "id": 1,
+                "hostname": "ca.metrc.com",
+                "licenseNumber": "LIC-001",
+                "dataModel": "LICENSE",
+                "retrievedAt": "2025-09-23T13:19:22.734Z"
+            },
+            {"id": "2", "licenseNumber": "LIC-002", "licenseName": "Company 2"},
+        ],
+        "total": 4,
+        "page": 1,
+        "pageSize": 2
+    },
+    {
+        "data": [
+            {"id": "3", "licenseNumber": "LIC-003", "licenseName": "Company 3"},
+            {"id": "4", "licenseNumber": "LIC-004", "licenseName": "Company 4"},
+        ],
+        "total": 4,
+        "page": 2,
+        "pageSize": 2
+    }
+]
+
+
+def _page(page: int, total: int, page_size: int) -> Dict[str, Any]:
+    """Build the paginated response for ``page`` of a ``total``-record collection."""
+    return {
+        "data": [{"id": str(page), "licenseNumber": f"LIC-{page:03d}", "licenseName": f"Company {page}"}],
+        "total": total,
+        "page": page,
+        "pageSize": page_size,
+    }
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    """Drive the rate limiter from a fake clock that sleeping advances instantly."""
+    now = [1000.0]
+
+    def advance(seconds: float) -> None:
+        now[0] += seconds
+
+    async def advance_async(seconds: float) -> None:
+        advance(seconds)
+
+    monkeypatch.setattr(parallel_module, "time", SimpleNamespace(monotonic=lambda: now[0], sleep=advance))
+    # parallel.py calls ``asyncio.sleep`` through the shared module, so this
+    # patches the global function for the duration of the test.
+    monkeypatch.setattr(asyncio, "sleep", advance_async)
+    return now
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limiters() -> Iterator[None]:
+    """Keep shared per-endpoint rate limiters from leaking between tests."""
+    reset_limiters()
+    yield
+    reset_limiters()
+
+
+@pytest.fixture(scope="module")
+def async_client() -> SimpleNamespace:
+    """Authenticated stand-in for ``T3APIClient``; the loaders check ``is_authenticated`` and the host."""
+    return SimpleNamespace(is_authenticated=True, _config=HTTPConfig(host="https://api.example.com"))
+
+
+@pytest.fixture(scope="module")
+def sync_client() -> SimpleNamespace:
+    """Authenticated stand-in carrying the attributes the sync wrappers copy into a new client."""
+    return SimpleNamespace(
+        is_authenticated=True,
+        access_token="test_token",
+        _config=HTTPConfig(),
+        _retry_policy=RetryPolicy(),
+        _logging_hooks=None,
+        _extra_headers={},
+    )
+
+
+class TestClientFakes:
+    """Test the client stand-ins stay in step with ``T3APIClient``."""
+
+    async def test_fakes_match_client_interface(self, sync_client, async_client):
+        """Test every attribute the fakes provide also exists on a real client."""
+        async with T3APIClient() as client:
+            for fake in (sync_client, async_client):
+                for name in vars(fake):
+                    assert hasattr(client, name), name
 
 
 class TestRateLimiter:
     """Test RateLimiter functionality."""
 
-    def test_no_rate_limit(self):
-        """Test rate limiter with no limit (0 or None)."""
-        limiter = RateLimiter(0)
+    @pytest.mark.parametrize("is_async", [False, True], ids=["sync", "async"])
+    @pytest.mark.parametrize(
+        ("requests_per_second", "expected_wait"),
+        [(0, 0.0), (100, 0.02)],  # 100 requests per second = 0.01s interval
+        ids=["no_limit", "rl100"],
+    )
+    async def test_acquire_waits(self, fake_clock, requests_per_second, expected_wait, is_async):
+        """Test three acquisitions wait two intervals, or not at all when unlimited."""
+        limiter = RateLimiter(requests_per_second)
+
+        start_time = fake_clock[0]
+        for _ in range(3):
+            if is_async:
+                await limiter.acquire_async()
+            else:
+                limiter.acquire()
+
+        assert fake_clock[0] - start_time == pytest.approx(expected_wait)
+
+    def test_burst_then_throttle(self, fake_clock):
+        """Test a full bucket allows a burst before spacing requests at the steady rate."""
+        limiter = RateLimiter(100, burst=3)
+
+        start_time = fake_clock[0]
+        for _ in range(3):
+            limiter.acquire()
+        assert fake_clock[0] == start_time
 
-        start_time = time.time()
         limiter.acquire()
         limiter.acquire()
+        assert fake_clock[0] - start_time == pytest.approx(0.02)
+
+    def test_set_rate_keeps_bucket_state(self, fake_clock):
+        """Test retuning the rate keeps the spent token and spaces the next request at the new rate."""
+        limiter = RateLimiter(100)
         limiter.acquire()
-        end_time = time.time()
 
-        # Should complete almost instantly
-        assert end_time - start_time < 0.1
+        limiter.set_rate(50)
+        start_time = fake_clock[0]
+        limiter.acquire()
+        assert fake_clock[0] - start_time == pytest.approx(1 / 50)
 
-    def test_rate_limiting(self):
-        """Test rate limiter with actual rate limiting."""
-        limiter = RateLimiter(100)  # 100 requests per second = 0.01s interval
+    def test_notify_throttled_halves_rate_then_recovers(self, fake_clock):
+        """Test a 429 pauses the bucket, halves the rate, and lets it climb back afterwards."""
+        limiter = RateLimiter(100)
+        limiter.acquire()
 
-        start_time = time.time()
+        limiter.notify_throttled(1.0)
+        start_time = fake_clock[0]
         limiter.acquire()
+        assert fake_clock[0] - start_time == pytest.approx(1.0 + 1 / 50)
+
+        start_time = fake_clock[0]
         limiter.acquire()
+        assert fake_clock[0] - start_time == pytest.approx(1 / 55)
+
+        for _ in range(10):
+            limiter.acquire()
+        assert limiter.effective_rate == 100
+
+    def test_concurrent_throttle_notices_back_off_once(self, fake_clock):
+        """Test a burst of 429s from in-flight pages halves the rate once and waits about retry_after."""
+        limiter = RateLimiter(10)
         limiter.acquire()
-        end_time = time.time()
 
-        # Should take at least 0.02 seconds (2 intervals)
-        assert end_time - start_time >= 0.015
+        for _ in range(10):
+            limiter.notify_throttled(1.0)
+        assert limiter.effective_rate == 5
 
-    @pytest.mark.asyncio
-    async def test_async_no_rate_limit(self):
-        """Test async rate limiter with no limit."""
-        limiter = RateLimiter(0)
+        start_time = fake_clock[0]
+        limiter.acquire()
+        assert fake_clock[0] - start_time == pytest.approx(1.0 + 1 / 5)
+
+    def test_repeated_throttles_stop_at_rate_floor(self, fake_clock):
+        """Test throttles in successive windows keep halving the rate down to its floor."""
+        limiter = RateLimiter(10)
 
-        start_time = time.time()
-        await limiter.acquire_async()
-        await limiter.acquire_async()
-        await limiter.acquire_async()
-        end_time = time.time()
+        for _ in range(10):
+            limiter.notify_throttled(1.0)
+            fake_clock[0] += 1.0
+        assert limiter.effective_rate == pytest.approx(1.0)
 
-        # Should complete almost instantly
-        assert end_time - start_time < 0.1
+    def test_threads_share_the_rate(self):
+        """Test concurrent threads cannot overshoot the rate by reading the same bucket state."""
+        limiter = RateLimiter(1000)
 
-    @pytest.mark.asyncio
-    async def test_async_rate_limiting(self):
-        """Test async rate limiter with actual rate limiting."""
-        limiter = RateLimiter(100)  # 100 requests per second = 0.01s interval
+        def worker() -> None:
+            for _ in range(20):
+                limiter.acquire()
 
-        start_time = time.time()
-        await limiter.acquire_async()
-        await limiter.acquire_async()
-        await limiter.acquire_async()
-        end_time = time.time()
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        start_time = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
 
-        # Should take at least 0.02 seconds (2 intervals)
-        assert end_time - start_time >= 0.015
+        # 200 acquisitions: the first token is free, the other 199 are spaced 1ms apart.
+        assert time.monotonic() - start_time >= 0.199 - 1e-3
 
 
 class TestParallelLoadPaginatedSync:
     """Test parallel_load_paginated_sync functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_client = MagicMock(spec=T3APIClient)
-        self.mock_client.is_authenticated = True
-
-        # Add required attributes for asyncio wrapper
-        from t3api_utils.http.utils import HTTPConfig, RetryPolicy
-        self.mock_client._config = HTTPConfig()
-        self.mock_client._retry_policy = RetryPolicy()
-        self.mock_client._logging_hooks = None
-        self.mock_client._extra_headers = {}
-        self.mock_client._access_token = "test_token"
+    @pytest.fixture(autouse=True)
+    def _bind(self, sync_client):
+        """Bind the shared sync client stand-in."""
+        self.mock_client = sync_client
 
     @patch('t3api_utils.api.parallel.get_collection_async')
     def test_single_page_response(self, mock_get_collection_async):
         """Test loading when there's only one page."""
-        # Mock response with single page
-        mock_response: MetrcCollectionResponse = {
-            "data": [{
-                "id": 1,
-                "hostname": "ca.metrc.com",
-                "licenseNumber": "LIC-001",
-                "dataModel": "LICENSE",
-                "retrievedAt": "2025-09-23T13:19:22.734Z"
-            }],
-            "total": 1,
-            "page": 1,
-            "pageSize": 10
-        }
-
-        mock_get_collection_async.return_value = mock_response
+        mock_get_collection_async.return_value = _SINGLE_PAGE_RESPONSE
 
         result: List[Any] = parallel_load_paginated_sync(
             client=self.mock_client,
@@ -114,81 +259,25 @@ class TestParallelLoadPaginatedSync:
         )
 
         assert len(result) == 1
-        assert result[0] == mock_response
+        assert result[0] == _SINGLE_PAGE_RESPONSE
         # Verify the async function was called (client will be different due to wrapper)
         mock_get_collection_async.assert_called_once()
         call_args = mock_get_collection_async.call_args
         assert call_args[0][1] == "/v2/licenses"  # endpoint
         assert call_args[1]["page"] == 1  # page parameter
 
-    @patch('t3api_utils.api.parallel.get_collection_async')
-    def test_multiple_pages_response(self, mock_get_collection_async):
-        """Test loading when there are multiple pages."""
-        def mock_method_side_effect(client, path, page=1, **kwargs):
-            if page == 1:
-                return {
-                    "data": [{
-                "id": 1,
-                "hostname": "ca.metrc.com",
-                "licenseNumber": "LIC-001",
-                "dataModel": "LICENSE",
-                "retrievedAt": "2025-09-23T13:19:22.734Z"
-            }],
-                    "total": 25,
-                    "page": 1,
-                    "pageSize": 10
-                }
-            elif page == 2:
-                return {
-                    "data": [{"id": "2", "licenseNumber": "LIC-002", "licenseName": "Company 2"}],
-                    "total": 25,
-                    "page": 2,
-                    "pageSize": 10
-                }
-            elif page == 3:
-                return {
-                    "data": [{"id": "3", "licenseNumber": "LIC-003", "licenseName": "Company 3"}],
-                    "total": 25,
-                    "page": 3,
-                    "pageSize": 10
-                }
-
-        mock_get_collection_async.side_effect = mock_method_side_effect
-
-        result: List[Any] = parallel_load_paginated_sync(
-            client=self.mock_client,
-            path="/v2/licenses"
-        )
-
-        # Should return 3 pages total (25 items / 10 per page = 3 pages)
-        assert len(result) == 3
-        assert mock_get_collection_async.call_count == 3
-
     @patch('t3api_utils.api.parallel.get_collection_async')
     def test_rate_limiting_applied(self, mock_get_collection_async):
         """Test that rate limiting is properly applied."""
-        mock_response: MetrcCollectionResponse = {
-            "data": [{
-                "id": 1,
-                "hostname": "ca.metrc.com",
-                "licenseNumber": "LIC-001",
-                "dataModel": "LICENSE",
-                "retrievedAt": "2025-09-23T13:19:22.734Z"
-            }],
-            "total": 1,
-            "page": 1,
-            "pageSize": 10
-        }
-
-        mock_get_collection_async.return_value = mock_response
+        mock_get_collection_async.return_value = _SINGLE_PAGE_RESPONSE
 
-        start_time = time.time()
+        start_time = time.monotonic()
         result: List[Any] = parallel_load_paginated_sync(
             client=self.mock_client,
             path="/v2/licenses",
             rate_limit=1000  # Very high rate limit should still add minimal delay
         )
-        end_time = time.time()
+        end_time = time.monotonic()
 
         assert len(result) == 1
         # Should complete quickly but not instantaneously due to rate limiting setup
@@ -199,33 +288,56 @@ class TestParallelLoadPaginatedSync:
         assert call_args[0][1] == "/v2/licenses"  # endpoint
         assert call_args[1]["page"] == 1  # page parameter
 
+    @patch('t3api_utils.api.parallel.get_collection_async')
+    def test_runs_on_calling_thread_without_a_loop(self, mock_get_collection_async):
+        """Test no helper thread is started when no event loop is running."""
+        threads = []
+
+        async def record_thread(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return _SINGLE_PAGE_RESPONSE
+
+        mock_get_collection_async.side_effect = record_thread
+
+        parallel_load_paginated_sync(client=self.mock_client, path="/v2/licenses")
+
+        assert threads == [threading.current_thread()]
+
+    @patch('t3api_utils.api.parallel.get_collection_async')
+    def test_runs_on_configured_loop_factory(self, mock_get_collection_async):
+        """Test owned event loops come from the module's loop factory (uvloop when installed)."""
+        mock_get_collection_async.return_value = _SINGLE_PAGE_RESPONSE
+        factory = MagicMock(side_effect=asyncio.new_event_loop)
+
+        with patch.object(parallel_module, "_LOOP_FACTORY", factory):
+            parallel_load_paginated_sync(client=self.mock_client, path="/v2/licenses")
+
+        factory.assert_called_once_with()
+
+    @patch('t3api_utils.api.parallel.get_collection_async')
+    def test_pages_share_one_connection_pool(self, mock_get_collection_async, fake_clock):
+        """Test every page of a parallel load goes through a single httpx pool."""
+        mock_get_collection_async.side_effect = [_page(page, 50, 10) for page in range(1, 6)]
+
+        with patch.object(_client_module, "build_async_client", wraps=build_async_client) as build:
+            result: List[Any] = parallel_load_paginated_sync(client=self.mock_client, path="/v2/licenses", max_workers=8)
+
+        assert len(result) == 5
+        build.assert_called_once()
+
 
 class TestParallelLoadPaginatedAsync:
     """Test parallel_load_paginated_async functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_client = MagicMock(spec=T3APIClient)
-        self.mock_client.is_authenticated = True
+    @pytest.fixture(autouse=True)
+    def _bind(self, async_client):
+        """Bind the shared async client stand-in."""
+        self.mock_client = async_client
 
-    @pytest.mark.asyncio
     @patch('t3api_utils.api.parallel.get_collection_async')
     async def test_single_page_response(self, mock_get_collection_async):
         """Test async loading when there's only one page."""
-        mock_response: MetrcCollectionResponse = {
-            "data": [{
-                "id": 1,
-                "hostname": "ca.metrc.com",
-                "licenseNumber": "LIC-001",
-                "dataModel": "LICENSE",
-                "retrievedAt": "2025-09-23T13:19:22.734Z"
-            }],
-            "total": 1,
-            "page": 1,
-            "pageSize": 10
-        }
-
-        mock_get_collection_async.return_value = mock_response
+        mock_get_collection_async.return_value = _SINGLE_PAGE_RESPONSE
 
         result: List[Any] = await parallel_load_paginated_async(
             client=self.mock_client,
@@ -233,124 +345,108 @@ class TestParallelLoadPaginatedAsync:
         )
 
         assert len(result) == 1
-        assert result[0] == mock_response
+        assert result[0] == _SINGLE_PAGE_RESPONSE
         mock_get_collection_async.assert_called_once_with(self.mock_client, "/v2/licenses", page=1)
 
-    @pytest.mark.asyncio
+
     @patch('t3api_utils.api.parallel.get_collection_async')
-    async def test_multiple_pages_response(self, mock_get_collection_async):
-        """Test async loading when there are multiple pages."""
-        def mock_method_side_effect(client, path, page=1, **kwargs):
-            if page == 1:
-                return {
-                    "data": [{
-                "id": 1,
-                "hostname": "ca.metrc.com",
-                "licenseNumber": "LIC-001",
-                "dataModel": "LICENSE",
-                "retrievedAt": "2025-09-23T13:19:22.734Z"
-            }],
-                    "total": 25,
-                    "page": 1,
-                    "pageSize": 10
-                }
-            elif page == 2:
-                return {
-                    "data": [{"id": "2", "licenseNumber": "LIC-002", "licenseName": "Company 2"}],
-                    "total": 25,
-                    "page": 2,
-                    "pageSize": 10
-                }
-            elif page == 3:
-                return {
-                    "data": [{"id": "3", "licenseNumber": "LIC-003", "licenseName": "Company 3"}],
-                    "total": 25,
-                    "page": 3,
-                    "pageSize": 10
-                }
-
-        mock_get_collection_async.side_effect = mock_method_side_effect
+    async def test_rate_limiter_shared_across_calls(self, mock_get_collection_async, fake_clock):
+        """Test back-to-back loads of one endpoint share a bucket while other endpoints get their own."""
+        mock_get_collection_async.return_value = _SINGLE_PAGE_RESPONSE
 
-        result: List[Any] = await parallel_load_paginated_async(
-            client=self.mock_client,
-            path="/v2/licenses"
-        )
+        start_time = fake_clock[0]
+        await parallel_load_paginated_async(client=self.mock_client, path="/v2/licenses", rate_limit=100)
+        assert fake_clock[0] == start_time
 
-        # Should return 3 pages total (25 items / 10 per page = 3 pages)
-        assert len(result) == 3
-        assert mock_get_collection_async.call_count == 3
+        await parallel_load_paginated_async(client=self.mock_client, path="/v2/licenses", rate_limit=100)
+        assert fake_clock[0] - start_time == pytest.approx(0.01)
+
+        await parallel_load_paginated_async(client=self.mock_client, path="/v2/packages/active", rate_limit=100)
+        assert fake_clock[0] - start_time == pytest.approx(0.01)
 
-    @pytest.mark.asyncio
     @patch('t3api_utils.api.parallel.get_collection_async')
-    async def test_batched_processing(self, mock_get_collection_async):
-        """Test batched processing functionality."""
-        def mock_method_side_effect(client, path, page=1, **kwargs):
-            return {
-                "data": [{"id": str(page), "licenseNumber": f"LIC-{page:03d}", "licenseName": f"Company {page}"}],
-                "total": 50,  # 5 pages total
-                "page": page,
-                "pageSize": 10
-            }
-
-        mock_get_collection_async.side_effect = mock_method_side_effect
+    async def test_zero_total(self, mock_get_collection_async):
+        """Test an empty collection stops after the first page."""
+        mock_get_collection_async.return_value = {"data": [], "total": 0, "page": 1, "pageSize": 10}
 
-        result: List[Any] = await parallel_load_paginated_async(
-            client=self.mock_client,
-            path="/v2/licenses",
-            batch_size=2  # Process in batches of 2
-        )
+        result: List[Any] = await parallel_load_paginated_async(client=self.mock_client, path="/v2/licenses")
 
-        # Should return 5 pages total
-        assert len(result) == 5
-        assert mock_get_collection_async.call_count == 5
+        assert [page["data"] for page in result] == [[]]
+        mock_get_collection_async.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("retry_after", "expected_wait"),
+        [("2", 2.0), (None, 1.0)],
+        ids=["retry_after_header", "default_backoff"],
+    )
+    @patch('t3api_utils.api.parallel.get_collection_async')
+    async def test_throttled_page_is_retried(
+        self, mock_get_collection_async, fake_clock, retry_after, expected_wait
+    ):
+        """Test a 429 backs the rate limiter off and retries the page."""
+        headers = {"Retry-After": retry_after} if retry_after else {}
+        throttled = T3HTTPError("Too Many Requests", response=httpx.Response(429, headers=headers))
+        mock_get_collection_async.side_effect = [throttled, _SINGLE_PAGE_RESPONSE]
+
+        start_time = fake_clock[0]
+        result: List[Any] = await parallel_load_paginated_async(client=self.mock_client, path="/v2/licenses")
+
+        assert result == [_SINGLE_PAGE_RESPONSE]
+        assert mock_get_collection_async.call_count == 2
+        assert fake_clock[0] - start_time >= expected_wait
+
+    @patch('t3api_utils.api.parallel.get_collection_async')
+    async def test_throttle_without_rate_limit_propagates(self, mock_get_collection_async):
+        """Test a 429 is not retried at page level when rate limiting is disabled."""
+        mock_get_collection_async.side_effect = T3HTTPError("Too Many Requests", response=httpx.Response(429))
+
+        with pytest.raises(T3HTTPError):
+            await parallel_load_paginated_async(client=self.mock_client, path="/v2/licenses", rate_limit=None)
+
+        mock_get_collection_async.assert_called_once()
+
+
+class TestParallelLoadPaginatedMultiplePages:
+    """Test multi-page loading through the sync and async paginated loaders."""
+
+    @pytest.mark.parametrize(
+        ("is_async", "total", "page_size", "batch_size"),
+        [(False, 25, 10, None), (True, 25, 10, None), (True, 50, 10, 2)],
+        ids=["sync", "async", "async_batched"],
+    )
+    @patch('t3api_utils.api.parallel.get_collection_async')
+    async def test_multiple_pages_response(
+        self, mock_get_collection_async, sync_client, fake_clock, is_async, total, page_size, batch_size
+    ):
+        """Test every page is fetched when the total spans multiple pages."""
+        num_pages = -(-total // page_size)
+        mock_get_collection_async.side_effect = [_page(page, total, page_size) for page in range(1, num_pages + 1)]
+        kwargs = {"batch_size": batch_size} if batch_size else {}
+
+        if is_async:
+            result: List[Any] = await parallel_load_paginated_async(
+                client=sync_client, path="/v2/licenses", **kwargs
+            )
+        else:
+            result = parallel_load_paginated_sync(client=sync_client, path="/v2/licenses")
+
+        assert len(result) == num_pages
+        requested = sorted(call.kwargs["page"] for call in mock_get_collection_async.call_args_list)
+        assert requested == list(range(1, num_pages + 1))
+        assert mock_get_collection_async.call_count == num_pages
 
 
 class TestLoadAllDataSync:
     """Test load_all_data_sync functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_client = MagicMock(spec=T3APIClient)
-        self.mock_client.is_authenticated = True
-
-        # Add required attributes for asyncio wrapper
-        from t3api_utils.http.utils import HTTPConfig, RetryPolicy
-        self.mock_client._config = HTTPConfig()
-        self.mock_client._retry_policy = RetryPolicy()
-        self.mock_client._logging_hooks = None
-        self.mock_client._extra_headers = {}
-        self.mock_client._access_token = "test_token"
+    @pytest.fixture(autouse=True)
+    def _bind(self, sync_client):
+        """Bind the shared sync client stand-in."""
+        self.mock_client = sync_client
 
     def test_data_extraction(self):
         """Test that data is properly extracted from paginated responses."""
-        mock_responses = [
-            {
-                "data": [
-                    {
-                "id": 1,
-                "hostname": "ca.metrc.com",
-                "licenseNumber": "LIC-001",
-                "dataModel": "LICENSE",
-                "retrievedAt": "2025-09-23T13:19:22.734Z"
-            },
-                    {"id": "2", "licenseNumber": "LIC-002", "licenseName": "Company 2"},
-                ],
-                "total": 4,
-                "page": 1,
-                "pageSize": 2
-            },
-            {
-                "data": [
-                    {"id": "3", "licenseNumber": "LIC-003", "licenseName": "Company 3"},
-                    {"id": "4", "licenseNumber": "LIC-004", "licenseName": "Company 4"},
-                ],
-                "total": 4,
-                "page": 2,
-                "pageSize": 2
-            }
-        ]
-
-        with patch('t3api_utils.api.parallel.parallel_load_paginated_async', return_value=mock_responses):
+        with patch('t3api_utils.api.parallel.parallel_load_paginated_async', return_value=_TWO_PAGE_RESPONSES):
             result: List[Any] = load_all_data_sync(
                 client=self.mock_client,
                 path="/v2/licenses"
@@ -358,49 +454,21 @@ class TestLoadAllDataSync:
 
         # Should return flattened data from both pages
         assert len(result) == 4
-        assert all("id" in item for item in result)
-        assert all("licenseNumber" in item for item in result)
+        required = {"id", "licenseNumber"}
+        assert all(required <= item.keys() for item in result)
 
 
 class TestLoadAllDataAsync:
     """Test load_all_data_async functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_client = MagicMock(spec=T3APIClient)
-        self.mock_client.is_authenticated = True
+    @pytest.fixture(autouse=True)
+    def _bind(self, async_client):
+        """Bind the shared async client stand-in."""
+        self.mock_client = async_client
 
-    @pytest.mark.asyncio
     async def test_data_extraction(self):
         """Test that data is properly extracted from paginated responses."""
-        mock_responses = [
-            {
-                "data": [
-                    {
-                "id": 1,
-                "hostname": "ca.metrc.com",
-                "licenseNumber": "LIC-001",
-                "dataModel": "LICENSE",
-                "retrievedAt": "2025-09-23T13:19:22.734Z"
-            },
-                    {"id": "2", "licenseNumber": "LIC-002", "licenseName": "Company 2"},
-                ],
-                "total": 4,
-                "page": 1,
-                "pageSize": 2
-            },
-            {
-                "data": [
-                    {"id": "3", "licenseNumber": "LIC-003", "licenseName": "Company 3"},
-                    {"id": "4", "licenseNumber": "LIC-004", "licenseName": "Company 4"},
-                ],
-                "total": 4,
-                "page": 2,
-                "pageSize": 2
-            }
-        ]
-
-        with patch('t3api_utils.api.parallel.parallel_load_paginated_async', return_value=mock_responses):
+        with patch('t3api_utils.api.parallel.parallel_load_paginated_async', return_value=_TWO_PAGE_RESPONSES):
             result: List[Any] = await load_all_data_async(
                 client=self.mock_client,
                 path="/v2/licenses"
@@ -408,8 +476,60 @@ class TestLoadAllDataAsync:
 
         # Should return flattened data from both pages
         assert len(result) == 4
-        assert all("id" in item for item in result)
-        assert all("licenseNumber" in item for item in result)
+        required = {"id", "licenseNumber"}
+        assert all(required <= item.keys() for item in result)
+
+    @patch('t3api_utils.api.parallel.get_collection_async')
+    async def test_load_all_data_async_timeout(self, mock_get_collection_async):
+        """Test a stuck page is cancelled at the deadline and finished pages are kept."""
+        cancelled = []
+
+        async def fetch(client, path, page, **kwargs):
+            if page == 2:
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    cancelled.append(page)
+                    raise
+            return _page(page, 30, 10)
+
+        mock_get_collection_async.side_effect = fetch
+
+        with pytest.raises(PartialResultsError) as exc_info:
+            await load_all_data_async(
+                client=self.mock_client, path="/v2/licenses", rate_limit=None, overall_timeout=0.05
+            )
+
+        assert isinstance(exc_info.value, TimeoutError)
+        assert [response["page"] for response in exc_info.value.partial] == [1, 3]
+        assert cancelled == [2]
+
+
+class TestParallelStreamPaginatedAsync:
+    """Test parallel_stream_paginated_async functionality."""
+
+    @patch('t3api_utils.api.parallel.get_collection_async')
+    async def test_items_stream_before_slowest_page(self, mock_get_collection_async, async_client):
+        """Test items from finished pages are yielded while a slower page is still in flight."""
+        release_page_2 = asyncio.Event()
+
+        async def fetch(client, path, page, **kwargs):
+            if page == 2:
+                await release_page_2.wait()
+            return _page(page, 30, 10)
+
+        mock_get_collection_async.side_effect = fetch
+
+        seen = []
+        stream: AsyncIterator[Dict[str, Any]] = parallel_stream_paginated_async(
+            client=async_client, path="/v2/licenses", rate_limit=None
+        )
+        async for item in stream:
+            seen.append(item["licenseNumber"])
+            if item["licenseNumber"] == "LIC-003":
+                release_page_2.set()
+
+        assert seen == ["LIC-001", "LIC-003", "LIC-002"]
 
 
 class TestParallelLoadCollectionEnhanced:
@@ -417,13 +537,7 @@ class TestParallelLoadCollectionEnhanced:
 
     def test_enhanced_collection_loading(self):
         """Test enhanced collection loading with rate limiting."""
-        mock_response = {
-            "total": 5,
-            "pageSize": 10,
-            "data": [{"id": "1"}] * 5
-        }
-
-        mock_method = MagicMock(return_value=mock_response)
+        mock_method = MagicMock(return_value=_ENHANCED_RESPONSE)
 
         result: List[Any] = parallel_load_collection_enhanced(
             method=mock_method,
@@ -432,18 +546,12 @@ class TestParallelLoadCollectionEnhanced:
         )
 
         assert len(result) == 1  # Single page
-        assert result[0] == mock_response
+        assert result[0] == _ENHANCED_RESPONSE
         mock_method.assert_called_once_with(page=1)
 
     def test_no_rate_limiting(self):
         """Test enhanced function works without rate limiting."""
-        mock_response = {
-            "total": 5,
-            "pageSize": 10,
-            "data": [{"id": "1"}] * 5
-        }
-
-        mock_method = MagicMock(return_value=mock_response)
+        mock_method = MagicMock(return_value=_ENHANCED_RESPONSE)
 
         result: List[Any] = parallel_load_collection_enhanced(
             method=mock_method,
@@ -451,5 +559,20 @@ class TestParallelLoadCollectionEnhanced:
         )
 
         assert len(result) == 1
-        assert result[0] == mock_response
-        mock_method.assert_called_once_with(page=1)
\ No newline at end of file
+        assert result[0] == _ENHANCED_RESPONSE
+        mock_method.assert_called_once_with(page=1)
+
+    def test_failed_page_cancels_queued_pages(self):
+        """Test a failing page stops the pages still waiting for a worker."""
+        def method(page, **kwargs):
+            if page == 2:
+                raise RuntimeError("page 2 failed")
+            time.sleep(0.01)
+            return {"total": 500, "pageSize": 10, "data": [{"id": str(page)}] * 10}
+
+        mock_method = MagicMock(side_effect=method)
+
+        with pytest.raises(RuntimeError, match="page 2 failed"):
+            parallel_load_collection_enhanced(method=mock_method, max_workers=1)
+
+        assert mock_method.call_count < 10
@@ -1,20 +1,38 @@
 import os
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
+from dotenv import dotenv_values, load_dotenv
 
 from t3api_utils.auth.interfaces import T3Credentials
 from t3api_utils.cli import utils as cli
 from t3api_utils.cli.consts import EnvKeys
 from t3api_utils.exceptions import AuthenticationError
 
+# Prompt answers (hostname, username, password[, otp]) shared across tests
+_OTP_ANSWERS = ("mi.metrc.com", "user", "pass", "123456")
+_SEEDED_OTP_ANSWERS = ("mi.metrc.com", "user", "pass")
 
-@patch.dict(os.environ, {
-    EnvKeys.METRC_HOSTNAME.value: "mo.metrc.com",
-    EnvKeys.METRC_USERNAME.value: "user",
-    EnvKeys.METRC_PASSWORD.value: "pass",
-})
-def test_load_credentials_from_env():
+
+@pytest.fixture
+def save_prompt(monkeypatch):
+    """Stub the confirm prompt and .t3.env writer behind the offer_to_save_* helpers.
+
+    The helpers load .t3.env into the environment, so it is restored afterwards.
+    """
+    confirm = MagicMock(return_value=True)
+    set_keys = MagicMock()
+    monkeypatch.setattr("typer.confirm", confirm)
+    monkeypatch.setattr(cli, "_set_keys", set_keys)
+    with patch.dict(os.environ):
+        yield SimpleNamespace(confirm=confirm, set_keys=set_keys)
+
+
+def test_load_credentials_from_env(monkeypatch):
+    monkeypatch.setenv(EnvKeys.METRC_HOSTNAME.value, "mo.metrc.com")
+    monkeypatch.setenv(EnvKeys.METRC_USERNAME.value, "user")
+    monkeypatch.setenv(EnvKeys.METRC_PASSWORD.value, "pass")
     credentials = cli.load_credentials_from_env()
     assert credentials == {
         "hostname": "mo.metrc.com",
@@ -23,13 +41,11 @@ def test_load_credentials_from_env():
     }
 
 
-@patch.dict(os.environ, {
-    EnvKeys.METRC_HOSTNAME.value: "co.metrc.com",
-    EnvKeys.METRC_USERNAME.value: "user",
-    EnvKeys.METRC_PASSWORD.value: "pass",
-    EnvKeys.METRC_EMAIL.value: "test@example.com",
-})
-def test_load_credentials_from_env_with_email():
+def test_load_credentials_from_env_with_email(monkeypatch):
+    monkeypatch.setenv(EnvKeys.METRC_HOSTNAME.value, "co.metrc.com")
+    monkeypatch.setenv(EnvKeys.METRC_USERNAME.value, "user")
+    monkeypatch.setenv(EnvKeys.METRC_PASSWORD.value, "pass")
+    monkeypatch.setenv(EnvKeys.METRC_EMAIL.value, "test@example.com")
     credentials = cli.load_credentials_from_env()
     assert credentials == {
         "hostname": "co.metrc.com",
@@ -39,45 +55,78 @@ def test_load_credentials_from_env_with_email():
     }
 
 
+@patch.dict(os.environ, {EnvKeys.METRC_USERNAME.value: "env-user"}, clear=True)
+@patch("os.path.exists", return_value=True)
+@patch("t3api_utils.cli.utils.dotenv_values", return_value={
+    EnvKeys.METRC_HOSTNAME.value: "mo.metrc.com",
+    EnvKeys.METRC_USERNAME.value: "file-user",
+})
+def test_load_credentials_from_env_file_does_not_touch_environ(mock_values, mock_exists):
+    credentials = cli.load_credentials_from_env()
+    assert credentials == {"hostname": "mo.metrc.com", "username": "env-user"}
+    assert os.environ == {EnvKeys.METRC_USERNAME.value: "env-user"}
+
+
+@pytest.mark.parametrize("prompts,kwargs,expected", [
+    pytest.param(
+        _OTP_ANSWERS, {},
+        {"hostname": "mi.metrc.com", "username": "user", "password": "pass", "otp": "123456", "email": None},
+        id="otp",
+    ),
+    pytest.param(
+        ("somewhere.com", "user", "pass"), {},
+        {"hostname": "somewhere.com", "username": "user", "password": "pass", "otp": None, "email": None},
+        id="no-otp",
+    ),
+    pytest.param(
+        ("co.metrc.com", "user", "pass", "test@example.com"), {},
+        {"hostname": "co.metrc.com", "username": "user", "password": "pass", "otp": None, "email": "test@example.com"},
+        id="email",
+    ),
+    pytest.param(
+        ("co.metrc.com", "user", "pass"), {"email": "stored@example.com"},
+        {"hostname": "co.metrc.com", "username": "user", "password": "pass", "otp": None, "email": "stored@example.com"},
+        id="stored-email",
+    ),
+    pytest.param(
+        ("mo.metrc.com", "user", "pass"), {},
+        {"hostname": "mo.metrc.com", "username": "user", "password": "pass", "otp": None, "email": None},
+        id="no-email-for-non-whitelisted-hostname",
+    ),
+])
 @patch("typer.prompt")
 @patch("t3api_utils.cli.utils.offer_to_save_credentials")
-def test_prompt_for_credentials_with_otp(mock_offer, mock_prompt):
-    mock_prompt.side_effect = ["mi.metrc.com", "user", "pass", "123456"]
-    result = cli.prompt_for_credentials_or_error()
-    assert result == {
-        "hostname": "mi.metrc.com",
-        "username": "user",
-        "password": "pass",
-        "otp": "123456",
-        "email": None,
-    }
+def test_prompt_for_credentials(mock_offer, mock_prompt, prompts, kwargs, expected):
+    mock_prompt.side_effect = prompts
+    result = cli.prompt_for_credentials_or_error(**kwargs)
+    assert result == expected
+    mock_offer.assert_not_called()
 
 
+@pytest.mark.parametrize("prompts,match", [
+    pytest.param(("mi.metrc.com", "user", "pass", "abc"), "Invalid 2-factor authentication", id="otp"),
+    pytest.param(("co.metrc.com", "user", "pass", "invalid-email"), "Invalid email address", id="email"),
+])
 @patch("typer.prompt")
 @patch("t3api_utils.cli.utils.offer_to_save_credentials")
-def test_prompt_for_credentials_without_otp(mock_offer, mock_prompt):
-    mock_prompt.side_effect = ["somewhere.com", "user", "pass"]
-    result = cli.prompt_for_credentials_or_error()
-    assert result == {
-        "hostname": "somewhere.com",
-        "username": "user",
-        "password": "pass",
-        "otp": None,
-        "email": None,
-    }
+def test_prompt_for_credentials_invalid_input_raises(mock_offer, mock_prompt, prompts, match):
+    mock_prompt.side_effect = prompts
+    with pytest.raises(AuthenticationError, match=match):
+        cli.prompt_for_credentials_or_error()
+    mock_offer.assert_not_called()
 
 
 @patch("typer.prompt")
 @patch("t3api_utils.cli.utils.offer_to_save_credentials")
-def test_prompt_for_credentials_invalid_otp_raises(mock_offer, mock_prompt):
-    mock_prompt.side_effect = ["mi.metrc.com", "user", "pass", "abc"]
-    with pytest.raises(AuthenticationError, match="Invalid 2-factor authentication"):
-        cli.prompt_for_credentials_or_error()
+def test_prompt_for_credentials_fully_supplied_never_prompts(mock_offer, mock_prompt):
+    result = cli.prompt_for_credentials_or_error(
+        hostname="mi.metrc.com", username="user", password="pass", otp="123456"
+    )
+    assert result["otp"] == "123456"
+    mock_prompt.assert_not_called()
 
 
-@patch("typer.confirm", return_value=True)
-@patch("t3api_utils.cli.utils.set_key")
-def test_offer_to_save_credentials(mock_set_key, mock_confirm):
+def test_offer_to_save_credentials(save_prompt):
     credentials: T3Credentials = {
         "hostname": "mo.metrc.com",
         "username": "user",
@@ -86,15 +135,14 @@ def test_offer_to_save_credentials(mock_set_key, mock_confirm):
         "email": None,
     }
     cli.offer_to_save_credentials(credentials=credentials)
-    assert mock_set_key.call_count == 3
-    mock_set_key.assert_any_call(cli.DEFAULT_ENV_PATH, EnvKeys.METRC_HOSTNAME, "mo.metrc.com")
-    mock_set_key.assert_any_call(cli.DEFAULT_ENV_PATH, EnvKeys.METRC_USERNAME, "user")
-    mock_set_key.assert_any_call(cli.DEFAULT_ENV_PATH, EnvKeys.METRC_PASSWORD, "pass")
+    save_prompt.set_keys.assert_called_once_with(cli.DEFAULT_ENV_PATH, {
+        EnvKeys.METRC_HOSTNAME.value: "mo.metrc.com",
+        EnvKeys.METRC_USERNAME.value: "user",
+        EnvKeys.METRC_PASSWORD.value: "pass",
+    })
 
 
-@patch("typer.confirm", return_value=True)
-@patch("t3api_utils.cli.utils.set_key")
-def test_offer_to_save_credentials_with_email(mock_set_key, mock_confirm):
+def test_offer_to_save_credentials_with_email(save_prompt):
     credentials: T3Credentials = {
         "hostname": "co.metrc.com",
         "username": "user",
@@ -103,76 +151,20 @@ def test_offer_to_save_credentials_with_email(mock_set_key, mock_confirm):
         "email": "test@example.com",
     }
     cli.offer_to_save_credentials(credentials=credentials)
-    assert mock_set_key.call_count == 4
-    mock_set_key.assert_any_call(cli.DEFAULT_ENV_PATH, EnvKeys.METRC_HOSTNAME, "co.metrc.com")
-    mock_set_key.assert_any_call(cli.DEFAULT_ENV_PATH, EnvKeys.METRC_USERNAME, "user")
-    mock_set_key.assert_any_call(cli.DEFAULT_ENV_PATH, EnvKeys.METRC_PASSWORD, "pass")
-    mock_set_key.assert_any_call(cli.DEFAULT_ENV_PATH, EnvKeys.METRC_EMAIL, "test@example.com")
-
-
-@patch("typer.prompt")
-@patch("t3api_utils.cli.utils.offer_to_save_credentials")
-def test_prompt_for_credentials_with_email(mock_offer, mock_prompt):
-    mock_prompt.side_effect = ["co.metrc.com", "user", "pass", "test@example.com"]
-    result = cli.prompt_for_credentials_or_error()
-    assert result == {
-        "hostname": "co.metrc.com",
-        "username": "user",
-        "password": "pass",
-        "otp": None,
-        "email": "test@example.com",
-    }
-    mock_offer.assert_not_called()
-
-
-@patch("typer.prompt")
-@patch("t3api_utils.cli.utils.offer_to_save_credentials")
-def test_prompt_for_credentials_with_stored_email(mock_offer, mock_prompt):
-    mock_prompt.side_effect = ["co.metrc.com", "user", "pass"]
-    result = cli.prompt_for_credentials_or_error(email="stored@example.com")
-    assert result == {
-        "hostname": "co.metrc.com",
-        "username": "user",
-        "password": "pass",
-        "otp": None,
-        "email": "stored@example.com",
-    }
-    mock_offer.assert_not_called()
-
-
-@patch("typer.prompt")
-@patch("t3api_utils.cli.utils.offer_to_save_credentials")
-def test_prompt_for_credentials_invalid_email_raises(mock_offer, mock_prompt):
-    mock_prompt.side_effect = ["co.metrc.com", "user", "pass", "invalid-email"]
-    with pytest.raises(AuthenticationError, match="Invalid email address"):
-        cli.prompt_for_credentials_or_error()
-    mock_offer.assert_not_called()
-
-
-@patch("typer.prompt")
-@patch("t3api_utils.cli.utils.offer_to_save_credentials")
-def test_prompt_for_credentials_no_email_for_non_whitelisted_hostname(mock_offer, mock_prompt):
-    mock_prompt.side_effect = ["mo.metrc.com", "user", "pass"]
-    result = cli.prompt_for_credentials_or_error()
-    assert result == {
-        "hostname": "mo.metrc.com",
-        "username": "user",
-        "password": "pass",
-        "otp": None,
-        "email": None,
-    }
-    mock_offer.assert_not_called()
+    save_prompt.set_keys.assert_called_once_with(cli.DEFAULT_ENV_PATH, {
+        EnvKeys.METRC_HOSTNAME.value: "co.metrc.com",
+        EnvKeys.METRC_USERNAME.value: "user",
+        EnvKeys.METRC_PASSWORD.value: "pass",
+        EnvKeys.METRC_EMAIL.value: "test@example.com",
+    })
 
 
-@patch.dict(os.environ, {
-    EnvKeys.METRC_HOSTNAME.value: "mo.metrc.com",
-    EnvKeys.METRC_USERNAME.value: "user",
-    EnvKeys.METRC_PASSWORD.value: "pass",
-})
-@patch("typer.confirm", return_value=False)
-@patch("t3api_utils.cli.utils.set_key")
-def test_offer_to_save_credentials_email_differs_only_for_whitelisted_hostname(mock_set_key, mock_confirm):
+def test_offer_to_save_credentials_email_differs_only_for_whitelisted_hostname(save_prompt, monkeypatch):
     """Test that email differences are only checked for whitelisted hostnames."""
+    monkeypatch.setenv(EnvKeys.METRC_HOSTNAME.value, "mo.metrc.com")
+    monkeypatch.setenv(EnvKeys.METRC_USERNAME.value, "user")
+    monkeypatch.setenv(EnvKeys.METRC_PASSWORD.value, "pass")
+    save_prompt.confirm.return_value = False
     # For non-whitelisted hostname, email differences should be ignored
     credentials: T3Credentials = {
         "hostname": "mo.metrc.com",  # Not in CREDENTIAL_EMAIL_WHITELIST
@@ -183,18 +175,15 @@ def test_offer_to_save_credentials_email_differs_only_for_whitelisted_hostname(m
     }
     cli.offer_to_save_credentials(credentials=credentials)
     # Should not prompt for update since email differences are ignored for non-whitelisted hostnames
-    mock_confirm.assert_not_called()
+    save_prompt.confirm.assert_not_called()
 
 
-@patch.dict(os.environ, {
-    EnvKeys.METRC_HOSTNAME.value: "co.metrc.com",
-    EnvKeys.METRC_USERNAME.value: "user",
-    EnvKeys.METRC_PASSWORD.value: "pass",
-})
-@patch("typer.confirm", return_value=False)
-@patch("t3api_utils.cli.utils.set_key")
-def test_offer_to_save_credentials_email_differs_detected_for_whitelisted_hostname(mock_set_key, mock_confirm):
+def test_offer_to_save_credentials_email_differs_detected_for_whitelisted_hostname(save_prompt, monkeypatch):
     """Test that email differences are detected for whitelisted hostnames."""
+    monkeypatch.setenv(EnvKeys.METRC_HOSTNAME.value, "co.metrc.com")
+    monkeypatch.setenv(EnvKeys.METRC_USERNAME.value, "user")
+    monkeypatch.setenv(EnvKeys.METRC_PASSWORD.value, "pass")
+    save_prompt.confirm.return_value = False
     # For whitelisted hostname, email differences should trigger update prompt
     credentials: T3Credentials = {
         "hostname": "co.metrc.com",  # In CREDENTIAL_EMAIL_WHITELIST
@@ -205,7 +194,7 @@ def test_offer_to_save_credentials_email_differs_detected_for_whitelisted_hostna
     }
     cli.offer_to_save_credentials(credentials=credentials)
     # Should prompt for update since email differs and hostname requires email
-    mock_confirm.assert_called_once()
+    save_prompt.confirm.assert_called_once()
 
 
 @patch("t3api_utils.cli.utils.prompt_for_credentials_or_error")
@@ -226,42 +215,59 @@ def test_resolve_auth_inputs_from_prompt(mock_save_credentials, mock_prompt):
 # TOTP/OTP Seed Tests
 
 
-@patch.dict(os.environ, {EnvKeys.OTP_SEED.value: "JBSWY3DPEHPK3PXP"})
-def test_generate_otp_from_seed_with_valid_seed():
+def test_generate_otp_from_seed_with_valid_seed(monkeypatch):
     """Test OTP generation with a valid seed."""
+    monkeypatch.setenv(EnvKeys.OTP_SEED.value, "JBSWY3DPEHPK3PXP")
     otp = cli.generate_otp_from_seed()
     assert otp is not None
     assert len(otp) == 6
     assert otp.isdigit()
 
 
-@patch.dict(os.environ, {}, clear=True)
-def test_generate_otp_from_seed_no_seed():
+def test_generate_otp_from_seed_no_seed(monkeypatch):
     """Test OTP generation when no seed is configured."""
+    monkeypatch.delenv(EnvKeys.OTP_SEED.value, raising=False)
     otp = cli.generate_otp_from_seed()
     assert otp is None
 
 
-@patch.dict(os.environ, {EnvKeys.OTP_SEED.value: "INVALID_SEED"})
-def test_generate_otp_from_seed_invalid_seed():
+def test_generate_otp_from_seed_invalid_seed(monkeypatch):
     """Test OTP generation with an invalid seed raises AuthenticationError."""
+    monkeypatch.setenv(EnvKeys.OTP_SEED.value, "INVALID_SEED")
     with pytest.raises(AuthenticationError, match="Failed to generate OTP from seed"):
         cli.generate_otp_from_seed()
 
 
-@patch.dict(os.environ, {EnvKeys.OTP_SEED.value: "   "})
-def test_generate_otp_from_seed_empty_seed():
+def test_generate_otp_from_seed_empty_seed(monkeypatch):
     """Test OTP generation with empty/whitespace seed."""
+    monkeypatch.setenv(EnvKeys.OTP_SEED.value, "   ")
     otp = cli.generate_otp_from_seed()
     assert otp is None
 
 
+@patch.dict(os.environ, {}, clear=True)
+def test_config_value_reparses_only_when_file_changes(tmp_path):
+    """Test ConfigManager re-reads its file only after the file changes."""
+    config_path = tmp_path / ".t3.env"
+    config_path.write_text(f"{EnvKeys.RATE_LIMIT_RPS.value}=5\n")
+    manager = cli.ConfigManager(str(config_path))
+
+    with patch("t3api_utils.cli.utils.load_dotenv", wraps=load_dotenv) as mock_load:
+        assert manager.get_config_value(EnvKeys.RATE_LIMIT_RPS) == 5
+        assert manager.get_config_value(EnvKeys.RATE_LIMIT_RPS) == 5
+        assert mock_load.call_count == 1
+
+        config_path.write_text(f"{EnvKeys.RATE_LIMIT_RPS.value}=25\n")
+        manager.get_config_value(EnvKeys.RATE_LIMIT_RPS)
+        assert mock_load.call_count == 2
+
+
 @patch.dict(os.environ, {EnvKeys.OTP_SEED.value: "JBSWY3DPEHPK3PXP"})
 @patch("t3api_utils.cli.utils.offer_to_save_credentials")
 def test_prompt_for_credentials_with_otp_seed(mock_offer):
     """Test that OTP is auto-generated when seed is configured."""
     with patch("typer.prompt") as mock_prompt:
-        mock_prompt.side_effect = ["mi.metrc.com", "user", "pass"]
+        mock_prompt.side_effect = _SEEDED_OTP_ANSWERS
         result = cli.prompt_for_credentials_or_error()
 
         # Should not prompt for OTP since it was generated from seed
@@ -279,7 +285,7 @@ def test_prompt_for_credentials_with_otp_seed(mock_offer):
 @patch("t3api_utils.cli.utils.offer_to_save_credentials")
 def test_prompt_for_credentials_without_otp_seed_fallback(mock_offer, mock_prompt):
     """Test that OTP is prompted when no seed is configured."""
-    mock_prompt.side_effect = ["mi.metrc.com", "user", "pass", "123456"]
+    mock_prompt.side_effect = _OTP_ANSWERS
     result = cli.prompt_for_credentials_or_error()
 
     # Should prompt for all fields including OTP
@@ -295,7 +301,7 @@ def test_prompt_for_credentials_without_otp_seed_fallback(mock_offer, mock_promp
 @patch("t3api_utils.cli.utils.offer_to_save_credentials")
 def test_prompt_for_credentials_invalid_seed_raises(mock_offer, mock_prompt):
     """Test that invalid OTP seed raises AuthenticationError during prompt."""
-    mock_prompt.side_effect = ["mi.metrc.com", "user", "pass"]
+    mock_prompt.side_effect = _SEEDED_OTP_ANSWERS
 
     with pytest.raises(AuthenticationError, match="Failed to generate OTP from seed"):
         cli.prompt_for_credentials_or_error()
@@ -304,127 +310,127 @@ def test_prompt_for_credentials_invalid_seed_raises(mock_offer, mock_prompt):
 # JWT Token Persistence Tests
 
 
-@patch.dict(os.environ, {EnvKeys.JWT_TOKEN.value: "existing-jwt-token"})
-def test_load_credentials_from_env_with_jwt():
+def test_load_credentials_from_env_with_jwt(monkeypatch):
     """Test that JWT token is loaded from environment."""
+    monkeypatch.setenv(EnvKeys.JWT_TOKEN.value, "existing-jwt-token")
     credentials = cli.load_credentials_from_env()
     assert credentials["jwt_token"] == "existing-jwt-token"
 
 
-@patch.dict(os.environ, {
-    EnvKeys.API_KEY.value: "my-api-key",
-    EnvKeys.API_STATE_CODE.value: "CA",
-})
-def test_load_credentials_from_env_with_api_key():
+def test_load_credentials_from_env_with_api_key(monkeypatch):
     """Test that API key and state code are loaded from environment."""
+    monkeypatch.setenv(EnvKeys.API_KEY.value, "my-api-key")
+    monkeypatch.setenv(EnvKeys.API_STATE_CODE.value, "CA")
     credentials = cli.load_credentials_from_env()
     assert credentials["api_key"] == "my-api-key"
     assert credentials["api_state_code"] == "CA"
 
 
-@patch("typer.confirm", return_value=True)
-@patch("t3api_utils.cli.utils.set_key")
-def test_offer_to_save_jwt_token_new_file(mock_set_key, mock_confirm):
+def test_offer_to_save_jwt_token_new_file(save_prompt):
     """Test saving JWT token when no .t3.env file exists."""
     with patch("os.path.exists", return_value=False):
         cli.offer_to_save_jwt_token(jwt_token="my-jwt-token")
-    mock_confirm.assert_called_once()
-    mock_set_key.assert_called_once_with(
-        cli.DEFAULT_ENV_PATH, EnvKeys.JWT_TOKEN.value, "my-jwt-token"
+    save_prompt.confirm.assert_called_once()
+    save_prompt.set_keys.assert_called_once_with(
+        cli.DEFAULT_ENV_PATH, {EnvKeys.JWT_TOKEN.value: "my-jwt-token"}
     )
 
 
-@patch.dict(os.environ, {EnvKeys.JWT_TOKEN.value: "old-token"})
-@patch("typer.confirm", return_value=True)
-@patch("t3api_utils.cli.utils.set_key")
-def test_offer_to_save_jwt_token_differs(mock_set_key, mock_confirm):
+def test_offer_to_save_jwt_token_differs(save_prompt, monkeypatch):
     """Test updating JWT token when it differs from stored value."""
+    monkeypatch.setenv(EnvKeys.JWT_TOKEN.value, "old-token")
     cli.offer_to_save_jwt_token(jwt_token="new-token")
-    mock_confirm.assert_called_once()
-    mock_set_key.assert_called_once_with(
-        cli.DEFAULT_ENV_PATH, EnvKeys.JWT_TOKEN.value, "new-token"
+    save_prompt.confirm.assert_called_once()
+    save_prompt.set_keys.assert_called_once_with(
+        cli.DEFAULT_ENV_PATH, {EnvKeys.JWT_TOKEN.value: "new-token"}
     )
 
 
-@patch.dict(os.environ, {EnvKeys.JWT_TOKEN.value: "same-token"})
-@patch("typer.confirm")
-@patch("t3api_utils.cli.utils.set_key")
-def test_offer_to_save_jwt_token_same(mock_set_key, mock_confirm):
+def test_offer_to_save_jwt_token_same(save_prompt, monkeypatch):
     """Test no prompt when JWT token matches stored value."""
+    monkeypatch.setenv(EnvKeys.JWT_TOKEN.value, "same-token")
     cli.offer_to_save_jwt_token(jwt_token="same-token")
-    mock_confirm.assert_not_called()
-    mock_set_key.assert_not_called()
+    save_prompt.confirm.assert_not_called()
+    save_prompt.set_keys.assert_not_called()
 
 
-@patch.dict(os.environ, {EnvKeys.JWT_TOKEN.value: "old-token"})
-@patch("typer.confirm", return_value=False)
-@patch("t3api_utils.cli.utils.set_key")
-def test_offer_to_save_jwt_token_declined(mock_set_key, mock_confirm):
+def test_offer_to_save_jwt_token_declined(save_prompt, monkeypatch):
     """Test no save when user declines JWT token update."""
+    monkeypatch.setenv(EnvKeys.JWT_TOKEN.value, "old-token")
+    save_prompt.confirm.return_value = False
     cli.offer_to_save_jwt_token(jwt_token="new-token")
-    mock_confirm.assert_called_once()
-    mock_set_key.assert_not_called()
+    save_prompt.confirm.assert_called_once()
+    save_prompt.set_keys.assert_not_called()
 
 
 # API Key Persistence Tests
 
 
-@patch("typer.confirm", return_value=True)
-@patch("t3api_utils.cli.utils.set_key")
-def test_offer_to_save_api_key_new_file(mock_set_key, mock_confirm):
+def test_offer_to_save_api_key_new_file(save_prompt):
     """Test saving API key when no .t3.env file exists."""
     with patch("os.path.exists", return_value=False):
         cli.offer_to_save_api_key(api_key="my-api-key", state_code="CA")
-    mock_confirm.assert_called_once()
-    assert mock_set_key.call_count == 2
-    mock_set_key.assert_any_call(
-        cli.DEFAULT_ENV_PATH, EnvKeys.API_KEY.value, "my-api-key"
-    )
-    mock_set_key.assert_any_call(
-        cli.DEFAULT_ENV_PATH, EnvKeys.API_STATE_CODE.value, "CA"
-    )
+    save_prompt.confirm.assert_called_once()
+    save_prompt.set_keys.assert_called_once_with(cli.DEFAULT_ENV_PATH, {
+        EnvKeys.API_KEY.value: "my-api-key",
+        EnvKeys.API_STATE_CODE.value: "CA",
+    })
 
 
-@patch.dict(os.environ, {
-    EnvKeys.API_KEY.value: "old-key",
-    EnvKeys.API_STATE_CODE.value: "MO",
-})
-@patch("typer.confirm", return_value=True)
-@patch("t3api_utils.cli.utils.set_key")
-def test_offer_to_save_api_key_differs(mock_set_key, mock_confirm):
+def test_offer_to_save_api_key_differs(save_prompt, monkeypatch):
     """Test updating API key when it differs from stored value."""
+    monkeypatch.setenv(EnvKeys.API_KEY.value, "old-key")
+    monkeypatch.setenv(EnvKeys.API_STATE_CODE.value, "MO")
     cli.offer_to_save_api_key(api_key="new-key", state_code="CA")
-    mock_confirm.assert_called_once()
-    assert mock_set_key.call_count == 2
-    mock_set_key.assert_any_call(
-        cli.DEFAULT_ENV_PATH, EnvKeys.API_KEY.value, "new-key"
-    )
-    mock_set_key.assert_any_call(
-        cli.DEFAULT_ENV_PATH, EnvKeys.API_STATE_CODE.value, "CA"
-    )
+    save_prompt.confirm.assert_called_once()
+    save_prompt.set_keys.assert_called_once_with(cli.DEFAULT_ENV_PATH, {
+        EnvKeys.API_KEY.value: "new-key",
+        EnvKeys.API_STATE_CODE.value: "CA",
+    })
 
 
-@patch.dict(os.environ, {
-    EnvKeys.API_KEY.value: "same-key",
-    EnvKeys.API_STATE_CODE.value: "CA",
-})
-@patch("typer.confirm")
-@patch("t3api_utils.cli.utils.set_key")
-def test_offer_to_save_api_key_same(mock_set_key, mock_confirm):
+def test_offer_to_save_api_key_same(save_prompt, monkeypatch):
     """Test no prompt when API key and state code match stored values."""
+    monkeypatch.setenv(EnvKeys.API_KEY.value, "same-key")
+    monkeypatch.setenv(EnvKeys.API_STATE_CODE.value, "CA")
     cli.offer_to_save_api_key(api_key="same-key", state_code="CA")
-    mock_confirm.assert_not_called()
-    mock_set_key.assert_not_called()
+    save_prompt.confirm.assert_not_called()
+    save_prompt.set_keys.assert_not_called()
 
 
-@patch.dict(os.environ, {
-    EnvKeys.API_KEY.value: "old-key",
-    EnvKeys.API_STATE_CODE.value: "MO",
-})
-@patch("typer.confirm", return_value=False)
-@patch("t3api_utils.cli.utils.set_key")
-def test_offer_to_save_api_key_declined(mock_set_key, mock_confirm):
+def test_offer_to_save_api_key_declined(save_prompt, monkeypatch):
     """Test no save when user declines API key update."""
+    monkeypatch.setenv(EnvKeys.API_KEY.value, "old-key")
+    monkeypatch.setenv(EnvKeys.API_STATE_CODE.value, "MO")
+    save_prompt.confirm.return_value = False
     cli.offer_to_save_api_key(api_key="new-key", state_code="CA")
-    mock_confirm.assert_called_once()
-    mock_set_key.assert_not_called()
+    save_prompt.confirm.assert_called_once()
+    save_prompt.set_keys.assert_not_called()
+
+
+def test_set_keys_updates_in_place_and_appends(tmp_path):
+    """Test _set_keys rewrites matching lines, keeps the rest, and appends new keys."""
+    path = tmp_path / "creds.env"
+    path.write_text("# comment\nKEEP=1\nMETRC_USERNAME='old'\nNO_NEWLINE=x")
+    values = {EnvKeys.METRC_USERNAME.value: "new", EnvKeys.METRC_PASSWORD.value: "it's \\ secret"}
+
+    cli._set_keys(str(path), values)
+
+    assert path.read_text().splitlines() == [
+        "# comment",
+        "KEEP=1",
+        "METRC_USERNAME='new'",
+        "NO_NEWLINE=x",
+        "METRC_PASSWORD='it\\'s \\\\ secret'",
+    ]
+    assert dotenv_values(path) == {"KEEP": "1", "NO_NEWLINE": "x", **values}
+
+
+def test_set_keys_creates_missing_file(tmp_path):
+    """Test _set_keys creates the dotenv file when it does not exist yet."""
+    path = tmp_path / "new.env"
+
+    cli._set_keys(str(path), {EnvKeys.JWT_TOKEN.value: "token"})
+
+    assert dotenv_values(path) == {EnvKeys.JWT_TOKEN.value: "token"}
+    assert list(tmp_path.iterdir()) == [path]
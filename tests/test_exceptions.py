@@ -2,7 +2,7 @@
 
 import pytest
 
-from t3api_utils.exceptions import AuthenticationError
+from t3api_utils.exceptions import AuthenticationError, PartialResultsError
 
 
 class TestAuthenticationError:
@@ -131,6 +131,22 @@ class TestAuthenticationError:
         assert caught_exception is None
 
 
+class TestPartialResultsError:
+    """Test PartialResultsError exception."""
+
+    def test_partial_results_error_carries_partial(self):
+        """Test the completed results are kept on the error."""
+        error = PartialResultsError("Timed out", partial=[{"page": 1}])
+
+        assert str(error) == "Timed out"
+        assert error.partial == [{"page": 1}]
+
+    def test_partial_results_error_is_timeout(self):
+        """Test PartialResultsError can be caught as a TimeoutError."""
+        with pytest.raises(TimeoutError):
+            raise PartialResultsError("Timed out", partial=[])
+
+
 class TestExceptionsModule:
     """Test exceptions module structure."""
 
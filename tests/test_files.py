@@ -1,6 +1,4 @@
-import csv
 import json
-import tempfile
 from datetime import datetime
 from typing import Any
 
@@ -16,6 +14,10 @@ from t3api_utils.file.utils import (
 )
 
 
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """One output directory for the module; tests keep file names distinct."""
+    return tmp_path_factory.mktemp("files")
 
 
 def test_flatten_dict():
@@ -49,33 +51,24 @@ def test_generate_output_path():
     assert "TestModel__ABC123" in path.name
 
 
-def test_save_dicts_to_json():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        data = [{"a": 1}, {"b": 2}]
-        path = save_dicts_to_json(dicts=data, model_name="TestModel", license_number="ABC", output_dir=tmpdir)
-        with open(path, "r", encoding="utf-8") as f:
-            loaded = json.load(f)
-        assert loaded == data
-
-
-def test_save_dicts_to_csv():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        data = [{"x": 1}, {"x": 2}]
-        path = save_dicts_to_csv(dicts=data, model_name="TestModel", license_number="XYZ", output_dir=tmpdir)
-        with open(path, newline="", encoding="utf-8") as f:
-            reader = list(csv.DictReader(f))
-        assert reader[0]["x"] == "1"
-        assert reader[1]["x"] == "2"
-
-
-def test_save_dicts_to_csv_strip_empty_columns():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        data: list[dict[str, Any]] = [{"x": 1, "empty": None}, {"x": 2, "empty": ""}]
-        path = save_dicts_to_csv(
-            dicts=data, model_name="TestModel", license_number="XYZ", output_dir=tmpdir, strip_empty_columns=True
-        )
-        with open(path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            assert reader.fieldnames is not None
-            assert "x" in reader.fieldnames
-            assert "empty" not in reader.fieldnames
+def test_save_dicts_to_json(shared_tmp):
+    data = [{"a": 1}, {"b": 2}]
+    path = save_dicts_to_json(dicts=data, model_name="TestModel", license_number="ABC", output_dir=str(shared_tmp))
+    assert json.loads(path.read_bytes()) == data
+
+
+def test_save_dicts_to_csv(shared_tmp):
+    data = [{"x": 1}, {"x": 2}]
+    path = save_dicts_to_csv(dicts=data, model_name="TestModel", license_number="XYZ", output_dir=str(shared_tmp))
+    assert path.read_text(encoding="utf-8").splitlines() == ["x", "1", "2"]
+
+
+def test_save_dicts_to_csv_strip_empty_columns(shared_tmp):
+    data: list[dict[str, Any]] = [{"x": 1, "empty": None}, {"x": 2, "empty": ""}]
+    path = save_dicts_to_csv(
+        dicts=data, model_name="TestModel", license_number="STRIP", output_dir=str(shared_tmp), strip_empty_columns=True
+    )
+    with path.open(encoding="utf-8") as f:
+        header = f.readline().rstrip("\r\n").split(",")
+    assert "x" in header
+    assert "empty" not in header
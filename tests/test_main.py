@@ -1,11 +1,16 @@
+import json
+import re
+from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Dict, List
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock
 
 import pytest
 from typer import Exit
 
 from t3api_utils.exceptions import AuthenticationError
+from t3api_utils.http.utils import T3HTTPError
 from t3api_utils.main.utils import (
     _discover_data_files, _format_file_size, _format_file_time,
     _load_file_content, _pick_authentication_method,
@@ -15,14 +20,32 @@ from t3api_utils.main.utils import (
     match_collection_from_csv, pick_file, pick_license, save_collection_to_csv,
     save_collection_to_json)
 
+_EMPTY_COLLECTION_RE = re.compile("Cannot serialize an empty list of objects")
 
-@patch("t3api_utils.main.utils._authenticate_with_credentials")
-@patch("t3api_utils.main.utils._pick_authentication_method")
-def test_get_authenticated_client_or_error(mock_pick, mock_auth_creds):
+
+@pytest.fixture
+def jwt_mocks(monkeypatch):
+    """Stub JWT client creation, the whoami request and the asyncio.run that closes a rejected client."""
+    client = MagicMock(name="jwt_authenticated_client")
+    mocks = SimpleNamespace(
+        client=client,
+        create_client=MagicMock(return_value=client),
+        get_data=MagicMock(),
+        asyncio_run=MagicMock(),
+    )
+    monkeypatch.setattr("t3api_utils.main.utils.create_jwt_authenticated_client", mocks.create_client)
+    monkeypatch.setattr("t3api_utils.main.utils.send_api_request", mocks.get_data)
+    monkeypatch.setattr("asyncio.run", mocks.asyncio_run)
+    return mocks
+
+
+def test_get_authenticated_client_or_error(monkeypatch):
     """Test get_authenticated_client_or_error with credentials selection."""
-    mock_pick.return_value = "credentials"
-    mock_client = MagicMock(name="authenticated_client")
-    mock_auth_creds.return_value = mock_client
+    mock_client = Mock(name="authenticated_client")
+    mock_pick = Mock(return_value="credentials")
+    mock_auth_creds = Mock(return_value=mock_client)
+    monkeypatch.setattr("t3api_utils.main.utils._pick_authentication_method", mock_pick)
+    monkeypatch.setattr("t3api_utils.main.utils._authenticate_with_credentials", mock_auth_creds)
 
     result = get_authenticated_client_or_error()
 
@@ -31,155 +54,127 @@ def test_get_authenticated_client_or_error(mock_pick, mock_auth_creds):
     mock_auth_creds.assert_called_once()
 
 
-@patch("t3api_utils.main.utils.create_jwt_authenticated_client")
-def test_get_jwt_authenticated_client_or_error_success(mock_create_jwt_client):
+def test_get_jwt_authenticated_client_or_error_success(jwt_mocks):
     """Test successful JWT authentication."""
     test_token = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test.signature"
-    mock_client = MagicMock(name="jwt_authenticated_client")
-    mock_create_jwt_client.return_value = mock_client
 
     result = get_jwt_authenticated_client_or_error(jwt_token=test_token)
 
-    mock_create_jwt_client.assert_called_once_with(jwt_token=test_token)
-    assert result == mock_client
+    jwt_mocks.create_client.assert_called_once_with(jwt_token=test_token)
+    assert result == jwt_mocks.client
 
 
-@patch("t3api_utils.main.utils.create_jwt_authenticated_client")
-def test_get_jwt_authenticated_client_or_error_invalid_token(mock_create_jwt_client):
+def test_get_jwt_authenticated_client_or_error_invalid_token(jwt_mocks):
     """Test JWT authentication with invalid token."""
     test_token = ""
-    mock_create_jwt_client.side_effect = ValueError("JWT token cannot be empty or None")
+    jwt_mocks.create_client.side_effect = ValueError("JWT token cannot be empty or None")
 
     with pytest.raises(AuthenticationError, match="Invalid JWT token"):
         get_jwt_authenticated_client_or_error(jwt_token=test_token)
 
-    mock_create_jwt_client.assert_called_once_with(jwt_token=test_token)
+    jwt_mocks.create_client.assert_called_once_with(jwt_token=test_token)
 
 
-@patch("t3api_utils.main.utils.create_jwt_authenticated_client")
-def test_get_jwt_authenticated_client_or_error_unexpected_error(mock_create_jwt_client):
+def test_get_jwt_authenticated_client_or_error_unexpected_error(jwt_mocks):
     """Test JWT authentication with unexpected error."""
     test_token = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test.signature"
-    mock_create_jwt_client.side_effect = RuntimeError("Unexpected error")
+    jwt_mocks.create_client.side_effect = RuntimeError("Unexpected error")
 
     with pytest.raises(RuntimeError, match="Unexpected error"):
         get_jwt_authenticated_client_or_error(jwt_token=test_token)
 
-    mock_create_jwt_client.assert_called_once_with(jwt_token=test_token)
+    jwt_mocks.create_client.assert_called_once_with(jwt_token=test_token)
 
 
-@patch("t3api_utils.main.utils.send_api_request")
-@patch("t3api_utils.main.utils.create_jwt_authenticated_client")
-def test_get_jwt_authenticated_client_or_error_with_validation_success(mock_create_jwt_client, mock_get_data):
+def test_get_jwt_authenticated_client_or_error_with_validation_success(jwt_mocks):
     """Test successful JWT authentication with validation."""
     test_token = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test.signature"
-    mock_client = MagicMock(name="jwt_authenticated_client")
-    mock_create_jwt_client.return_value = mock_client
-    mock_get_data.return_value = {"username": "testuser", "id": "123"}
+    jwt_mocks.get_data.return_value = {"username": "testuser", "id": "123"}
 
     result = get_jwt_authenticated_client_or_error_with_validation(jwt_token=test_token)
 
-    mock_create_jwt_client.assert_called_once_with(jwt_token=test_token)
-    mock_get_data.assert_called_once_with(mock_client, "/v2/auth/whoami")
-    assert result == mock_client
+    jwt_mocks.create_client.assert_called_once_with(jwt_token=test_token)
+    jwt_mocks.get_data.assert_called_once_with(jwt_mocks.client, "/v2/auth/whoami")
+    assert result == jwt_mocks.client
 
 
-@patch("t3api_utils.main.utils.send_api_request")
-@patch("t3api_utils.main.utils.create_jwt_authenticated_client")
-def test_get_jwt_authenticated_client_or_error_with_validation_invalid_token(mock_create_jwt_client, mock_get_data):
+def test_get_jwt_authenticated_client_or_error_with_validation_invalid_token(jwt_mocks):
     """Test JWT authentication with validation when token is invalid."""
     test_token = ""
-    mock_create_jwt_client.side_effect = ValueError("JWT token cannot be empty or None")
+    jwt_mocks.create_client.side_effect = ValueError("JWT token cannot be empty or None")
 
     with pytest.raises(AuthenticationError, match="Invalid JWT token"):
         get_jwt_authenticated_client_or_error_with_validation(jwt_token=test_token)
 
-    mock_create_jwt_client.assert_called_once_with(jwt_token=test_token)
-    mock_get_data.assert_not_called()
+    jwt_mocks.create_client.assert_called_once_with(jwt_token=test_token)
+    jwt_mocks.get_data.assert_not_called()
 
 
-@patch("asyncio.run")
-@patch("t3api_utils.main.utils.send_api_request")
-@patch("t3api_utils.main.utils.create_jwt_authenticated_client")
-def test_get_jwt_authenticated_client_or_error_with_validation_unauthorized(mock_create_jwt_client, mock_get_data, mock_asyncio_run):
+def test_get_jwt_authenticated_client_or_error_with_validation_unauthorized(jwt_mocks):
     """Test JWT authentication with validation when token is unauthorized."""
     test_token = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.expired.signature"
-    mock_client = MagicMock(name="jwt_authenticated_client")
-    mock_create_jwt_client.return_value = mock_client
 
     # Simulate 401 Unauthorized response
-    from t3api_utils.http.utils import T3HTTPError
-    mock_get_data.side_effect = T3HTTPError("401 Unauthorized")
+    jwt_mocks.get_data.side_effect = T3HTTPError("401 Unauthorized")
 
     with pytest.raises(AuthenticationError, match="JWT token is invalid or expired"):
         get_jwt_authenticated_client_or_error_with_validation(jwt_token=test_token)
 
-    mock_create_jwt_client.assert_called_once_with(jwt_token=test_token)
-    mock_get_data.assert_called_once_with(mock_client, "/v2/auth/whoami")
+    jwt_mocks.create_client.assert_called_once_with(jwt_token=test_token)
+    jwt_mocks.get_data.assert_called_once_with(jwt_mocks.client, "/v2/auth/whoami")
     # Verify client was closed on validation failure
-    mock_asyncio_run.assert_called_once()
+    jwt_mocks.asyncio_run.assert_called_once()
 
 
-@patch("asyncio.run")
-@patch("t3api_utils.main.utils.send_api_request")
-@patch("t3api_utils.main.utils.create_jwt_authenticated_client")
-def test_get_jwt_authenticated_client_or_error_with_validation_forbidden(mock_create_jwt_client, mock_get_data, mock_asyncio_run):
+def test_get_jwt_authenticated_client_or_error_with_validation_forbidden(jwt_mocks):
     """Test JWT authentication with validation when token has insufficient permissions."""
     test_token = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.limited.signature"
-    mock_client = MagicMock(name="jwt_authenticated_client")
-    mock_create_jwt_client.return_value = mock_client
 
     # Simulate 403 Forbidden response
-    from t3api_utils.http.utils import T3HTTPError
-    mock_get_data.side_effect = T3HTTPError("403 Forbidden")
+    jwt_mocks.get_data.side_effect = T3HTTPError("403 Forbidden")
 
     with pytest.raises(AuthenticationError, match="JWT token does not have sufficient permissions"):
         get_jwt_authenticated_client_or_error_with_validation(jwt_token=test_token)
 
-    mock_create_jwt_client.assert_called_once_with(jwt_token=test_token)
-    mock_get_data.assert_called_once_with(mock_client, "/v2/auth/whoami")
+    jwt_mocks.create_client.assert_called_once_with(jwt_token=test_token)
+    jwt_mocks.get_data.assert_called_once_with(jwt_mocks.client, "/v2/auth/whoami")
     # Verify client was closed on validation failure
-    mock_asyncio_run.assert_called_once()
+    jwt_mocks.asyncio_run.assert_called_once()
 
 
-@patch("asyncio.run")
-@patch("t3api_utils.main.utils.send_api_request")
-@patch("t3api_utils.main.utils.create_jwt_authenticated_client")
-def test_get_jwt_authenticated_client_or_error_with_validation_generic_error(mock_create_jwt_client, mock_get_data, mock_asyncio_run):
+def test_get_jwt_authenticated_client_or_error_with_validation_generic_error(jwt_mocks):
     """Test JWT authentication with validation for generic validation errors."""
     test_token = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test.signature"
-    mock_client = MagicMock(name="jwt_authenticated_client")
-    mock_create_jwt_client.return_value = mock_client
 
     # Simulate generic network error
-    mock_get_data.side_effect = RuntimeError("Network connection failed")
+    jwt_mocks.get_data.side_effect = RuntimeError("Network connection failed")
 
     with pytest.raises(AuthenticationError, match="JWT token validation failed: Network connection failed"):
         get_jwt_authenticated_client_or_error_with_validation(jwt_token=test_token)
 
-    mock_create_jwt_client.assert_called_once_with(jwt_token=test_token)
-    mock_get_data.assert_called_once_with(mock_client, "/v2/auth/whoami")
+    jwt_mocks.create_client.assert_called_once_with(jwt_token=test_token)
+    jwt_mocks.get_data.assert_called_once_with(jwt_mocks.client, "/v2/auth/whoami")
     # Verify client was closed on validation failure
-    mock_asyncio_run.assert_called_once()
+    jwt_mocks.asyncio_run.assert_called_once()
 
 
-@patch("t3api_utils.main.utils.send_api_request")
-@patch("t3api_utils.main.utils.create_jwt_authenticated_client")
-def test_get_jwt_authenticated_client_or_error_with_validation_unexpected_error(mock_create_jwt_client, mock_get_data):
+def test_get_jwt_authenticated_client_or_error_with_validation_unexpected_error(jwt_mocks):
     """Test JWT authentication with validation when unexpected error occurs."""
     test_token = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.test.signature"
-    mock_create_jwt_client.side_effect = RuntimeError("Unexpected system error")
+    jwt_mocks.create_client.side_effect = RuntimeError("Unexpected system error")
 
     with pytest.raises(AuthenticationError, match="Unexpected authentication error: Unexpected system error"):
         get_jwt_authenticated_client_or_error_with_validation(jwt_token=test_token)
 
-    mock_create_jwt_client.assert_called_once_with(jwt_token=test_token)
-    mock_get_data.assert_not_called()
+    jwt_mocks.create_client.assert_called_once_with(jwt_token=test_token)
+    jwt_mocks.get_data.assert_not_called()
 
 
-@patch("t3api_utils.main.utils.create_api_key_authenticated_client_or_error")
-def test_get_api_key_authenticated_client_or_error_success(mock_create_api_key_client):
+def test_get_api_key_authenticated_client_or_error_success(monkeypatch):
     """Test successful API key authentication."""
+    mock_create_api_key_client = MagicMock()
+    monkeypatch.setattr("t3api_utils.main.utils.create_api_key_authenticated_client_or_error", mock_create_api_key_client)
+
     test_api_key = "test-api-key-123"
     test_state_code = "CA"
     mock_client = MagicMock(name="api_key_authenticated_client")
@@ -197,12 +192,13 @@ def test_get_api_key_authenticated_client_or_error_success(mock_create_api_key_c
     )
 
 
-@patch("t3api_utils.main.utils.create_api_key_authenticated_client_or_error")
-def test_get_api_key_authenticated_client_or_error_invalid_key(mock_create_api_key_client):
+def test_get_api_key_authenticated_client_or_error_invalid_key(monkeypatch):
     """Test API key authentication with invalid key."""
+    mock_create_api_key_client = MagicMock(side_effect=ValueError("API key cannot be empty or None"))
+    monkeypatch.setattr("t3api_utils.main.utils.create_api_key_authenticated_client_or_error", mock_create_api_key_client)
+
     test_api_key = ""
     test_state_code = "CA"
-    mock_create_api_key_client.side_effect = ValueError("API key cannot be empty or None")
 
     with pytest.raises(AuthenticationError, match="Invalid API key or state code"):
         get_api_key_authenticated_client_or_error(
@@ -216,67 +212,76 @@ def test_get_api_key_authenticated_client_or_error_invalid_key(mock_create_api_k
     )
 
 
-@patch("typer.prompt")
-@patch("t3api_utils.main.utils.print_error")
-@patch("t3api_utils.main.utils.console.print")
-def test_pick_authentication_method_credentials(mock_console, mock_print_error, mock_prompt):
+def test_pick_authentication_method_credentials(monkeypatch):
     """Test authentication picker returns credentials."""
-    mock_prompt.return_value = 1
+    mock_prompt = MagicMock(return_value=1)
+    monkeypatch.setattr("typer.prompt", mock_prompt)
+    monkeypatch.setattr("t3api_utils.main.utils.print_error", MagicMock())
+    monkeypatch.setattr("t3api_utils.main.utils.console.print", MagicMock())
+
     result = _pick_authentication_method()
     assert result == "credentials"
     mock_prompt.assert_called_once()
 
 
-@patch("typer.prompt")
-@patch("t3api_utils.main.utils.print_error")
-@patch("t3api_utils.main.utils.console.print")
-def test_pick_authentication_method_jwt(mock_console, mock_print_error, mock_prompt):
+def test_pick_authentication_method_jwt(monkeypatch):
     """Test authentication picker returns jwt."""
-    mock_prompt.return_value = 2
+    mock_prompt = MagicMock(return_value=2)
+    monkeypatch.setattr("typer.prompt", mock_prompt)
+    monkeypatch.setattr("t3api_utils.main.utils.print_error", MagicMock())
+    monkeypatch.setattr("t3api_utils.main.utils.console.print", MagicMock())
+
     result = _pick_authentication_method()
     assert result == "jwt"
     mock_prompt.assert_called_once()
 
 
-@patch("typer.prompt")
-@patch("t3api_utils.main.utils.print_error")
-@patch("t3api_utils.main.utils.console.print")
-def test_pick_authentication_method_api_key(mock_console, mock_print_error, mock_prompt):
+def test_pick_authentication_method_api_key(monkeypatch):
     """Test authentication picker returns api_key."""
-    mock_prompt.return_value = 3
+    mock_prompt = MagicMock(return_value=3)
+    monkeypatch.setattr("typer.prompt", mock_prompt)
+    monkeypatch.setattr("t3api_utils.main.utils.print_error", MagicMock())
+    monkeypatch.setattr("t3api_utils.main.utils.console.print", MagicMock())
+
     result = _pick_authentication_method()
     assert result == "api_key"
     mock_prompt.assert_called_once()
 
 
-@patch("typer.prompt")
-@patch("t3api_utils.main.utils.print_error")
-@patch("t3api_utils.main.utils.console.print")
-def test_pick_authentication_method_invalid_choice(mock_console, mock_print_error, mock_prompt):
+def test_pick_authentication_method_invalid_choice(monkeypatch):
     """Test authentication picker handles invalid choice."""
-    mock_prompt.side_effect = [4, 1]  # Invalid choice first, then valid
+    mock_prompt = MagicMock(side_effect=[4, 1])  # Invalid choice first, then valid
+    mock_print_error = MagicMock()
+    monkeypatch.setattr("typer.prompt", mock_prompt)
+    monkeypatch.setattr("t3api_utils.main.utils.print_error", mock_print_error)
+    monkeypatch.setattr("t3api_utils.main.utils.console.print", MagicMock())
+
     result = _pick_authentication_method()
     assert result == "credentials"
     assert mock_prompt.call_count == 2
     mock_print_error.assert_called_once_with("Invalid selection. Please choose 1-3.")
 
 
-@patch("typer.prompt")
-@patch("t3api_utils.main.utils.print_error")
-@patch("t3api_utils.main.utils.console.print")
-def test_pick_authentication_method_keyboard_interrupt(mock_console, mock_print_error, mock_prompt):
+def test_pick_authentication_method_keyboard_interrupt(monkeypatch):
     """Test authentication picker handles keyboard interrupt."""
-    mock_prompt.side_effect = KeyboardInterrupt()
+    mock_prompt = MagicMock(side_effect=KeyboardInterrupt())
+    mock_print_error = MagicMock()
+    monkeypatch.setattr("typer.prompt", mock_prompt)
+    monkeypatch.setattr("t3api_utils.main.utils.print_error", mock_print_error)
+    monkeypatch.setattr("t3api_utils.main.utils.console.print", MagicMock())
+
     with pytest.raises(Exit):
         _pick_authentication_method()
     mock_print_error.assert_called_once_with("Invalid input or operation cancelled.")
 
 
-@patch("t3api_utils.main.utils._authenticate_with_credentials")
-@patch("t3api_utils.main.utils._pick_authentication_method")
-def test_get_authenticated_client_or_error_routes_to_credentials(mock_pick, mock_auth_creds):
+def test_get_authenticated_client_or_error_routes_to_credentials(monkeypatch):
     """Test main auth function routes to credentials authentication."""
-    mock_pick.return_value = "credentials"
+    mock_auth_creds = MagicMock()
+    mock_pick = MagicMock(return_value="credentials")
+    monkeypatch.setattr("t3api_utils.main.utils._authenticate_with_credentials", mock_auth_creds)
+    monkeypatch.setattr("t3api_utils.main.utils._pick_authentication_method", mock_pick)
+
     mock_client = MagicMock()
     mock_auth_creds.return_value = mock_client
 
@@ -287,11 +292,13 @@ def test_get_authenticated_client_or_error_routes_to_credentials(mock_pick, mock
     mock_auth_creds.assert_called_once()
 
 
-@patch("t3api_utils.main.utils._authenticate_with_jwt")
-@patch("t3api_utils.main.utils._pick_authentication_method")
-def test_get_authenticated_client_or_error_routes_to_jwt(mock_pick, mock_auth_jwt):
+def test_get_authenticated_client_or_error_routes_to_jwt(monkeypatch):
     """Test main auth function routes to JWT authentication."""
-    mock_pick.return_value = "jwt"
+    mock_auth_jwt = MagicMock()
+    mock_pick = MagicMock(return_value="jwt")
+    monkeypatch.setattr("t3api_utils.main.utils._authenticate_with_jwt", mock_auth_jwt)
+    monkeypatch.setattr("t3api_utils.main.utils._pick_authentication_method", mock_pick)
+
     mock_client = MagicMock()
     mock_auth_jwt.return_value = mock_client
 
@@ -302,11 +309,13 @@ def test_get_authenticated_client_or_error_routes_to_jwt(mock_pick, mock_auth_jw
     mock_auth_jwt.assert_called_once()
 
 
-@patch("t3api_utils.main.utils._authenticate_with_api_key")
-@patch("t3api_utils.main.utils._pick_authentication_method")
-def test_get_authenticated_client_or_error_routes_to_api_key(mock_pick, mock_auth_api_key):
+def test_get_authenticated_client_or_error_routes_to_api_key(monkeypatch):
     """Test main auth function routes to API key authentication."""
-    mock_pick.return_value = "api_key"
+    mock_auth_api_key = MagicMock()
+    mock_pick = MagicMock(return_value="api_key")
+    monkeypatch.setattr("t3api_utils.main.utils._authenticate_with_api_key", mock_auth_api_key)
+    monkeypatch.setattr("t3api_utils.main.utils._pick_authentication_method", mock_pick)
+
     mock_client = MagicMock()
     mock_auth_api_key.return_value = mock_client
 
@@ -317,10 +326,10 @@ def test_get_authenticated_client_or_error_routes_to_api_key(mock_pick, mock_aut
     mock_auth_api_key.assert_called_once()
 
 
-@patch("t3api_utils.main.utils._pick_authentication_method")
-def test_get_authenticated_client_or_error_unknown_method(mock_pick):
+def test_get_authenticated_client_or_error_unknown_method(monkeypatch):
     """Test main auth function handles unknown authentication method."""
-    mock_pick.return_value = "unknown"
+    mock_pick = MagicMock(return_value="unknown")
+    monkeypatch.setattr("t3api_utils.main.utils._pick_authentication_method", mock_pick)
 
     with pytest.raises(AuthenticationError, match="Unknown authentication method: unknown"):
         get_authenticated_client_or_error()
@@ -328,27 +337,27 @@ def test_get_authenticated_client_or_error_unknown_method(mock_pick):
     mock_pick.assert_called_once()
 
 
-@patch("t3api_utils.main.utils.console.print")
-@patch("t3api_utils.main.utils.typer.prompt")
-@patch("t3api_utils.main.utils.send_api_request")
-def test_pick_license_valid_choice(mock_get_data, mock_prompt, mock_console):
-    mock_client = MagicMock()
+def _stub_licenses(monkeypatch, licenses: List[Dict[str, Any]]) -> Mock:
+    """Make the licenses request return ``licenses`` and return a client to pass to pick_license."""
+    monkeypatch.setattr("t3api_utils.main.utils.send_api_request", Mock(return_value=licenses))
+    return Mock()
+
+
+def test_pick_license_valid_choice(monkeypatch):
     license1 = {"id": "1", "licenseNumber": "123", "licenseName": "Alpha"}
     license2 = {"id": "2", "licenseNumber": "456", "licenseName": "Beta"}
-    mock_licenses: List[Dict[str, Any]] = [license1, license2]
-    mock_get_data.return_value = mock_licenses
-    mock_prompt.return_value = 2
+    mock_client = _stub_licenses(monkeypatch, [license1, license2])
+    monkeypatch.setattr("t3api_utils.main.utils.typer.prompt", Mock(return_value=2))
+    monkeypatch.setattr("t3api_utils.main.utils.console.print", Mock())
 
     result = pick_license(api_client=mock_client)
     assert result == license2
 
 
-@patch("t3api_utils.main.utils.print_error")
-@patch("t3api_utils.main.utils.send_api_request")
-def test_pick_license_empty_list(mock_get_data, mock_print_error):
-    mock_client = MagicMock()
-    mock_licenses: List[Dict[str, Any]] = []
-    mock_get_data.return_value = mock_licenses
+def test_pick_license_empty_list(monkeypatch):
+    mock_client = _stub_licenses(monkeypatch, [])
+    mock_print_error = Mock()
+    monkeypatch.setattr("t3api_utils.main.utils.print_error", mock_print_error)
 
     with pytest.raises(Exit):
         pick_license(api_client=mock_client)
@@ -356,15 +365,15 @@ def test_pick_license_empty_list(mock_get_data, mock_print_error):
     mock_print_error.assert_called_once_with("No licenses found.")
 
 
-@patch("t3api_utils.main.utils.extract_data")
-@patch("t3api_utils.main.utils.parallel_load_collection")
-def test_load_collection_flattens_data(mock_parallel, mock_extract):
-    mock_response = [MagicMock()]
-    mock_parallel.return_value = mock_response
-    mock_extract.return_value = [
+def test_load_collection_flattens_data(monkeypatch):
+    mock_response = [object()]
+    mock_parallel = Mock(return_value=mock_response)
+    mock_extract = Mock(return_value=[
         {"id": 1, "hostname": "test.com", "licenseNumber": "LIC-1", "dataModel": "TEST", "retrievedAt": "2023-01-01T00:00:00Z"},
         {"id": 2, "hostname": "test.com", "licenseNumber": "LIC-2", "dataModel": "TEST", "retrievedAt": "2023-01-01T00:00:00Z"}
-    ]
+    ])
+    monkeypatch.setattr("t3api_utils.main.utils.parallel_load_collection", mock_parallel)
+    monkeypatch.setattr("t3api_utils.main.utils.extract_data", mock_extract)
 
     def fake_method(*args, **kwargs):
         pass
@@ -377,11 +386,11 @@ def test_load_collection_flattens_data(mock_parallel, mock_extract):
     mock_extract.assert_called_once_with(responses=mock_response)
 
 
-@patch("t3api_utils.main.utils.open_file")
-@patch("t3api_utils.main.utils.save_dicts_to_json")
-def test_save_collection_to_json_success(mock_save, mock_open):
+def test_save_collection_to_json_success(monkeypatch):
     fake_obj = {"index": "my_model", "licenseNumber": "XYZ", "other": "data"}
-    mock_save.return_value = Path("/tmp/output.json")
+    mock_open = Mock()
+    monkeypatch.setattr("t3api_utils.main.utils.save_dicts_to_json", Mock(return_value=Path("/tmp/output.json")))
+    monkeypatch.setattr("t3api_utils.main.utils.open_file", mock_open)
 
     result = save_collection_to_json(objects=[fake_obj], output_dir=".", open_after=True)
 
@@ -389,11 +398,11 @@ def test_save_collection_to_json_success(mock_save, mock_open):
     mock_open.assert_called_once_with(path=Path("/tmp/output.json"))
 
 
-@patch("t3api_utils.main.utils.open_file")
-@patch("t3api_utils.main.utils.save_dicts_to_csv")
-def test_save_collection_to_csv_success(mock_save, mock_open):
+def test_save_collection_to_csv_success(monkeypatch):
     fake_obj = {"index": "test", "licenseNumber": "LIC123", "other": "data"}
-    mock_save.return_value = Path("/tmp/output.csv")
+    mock_open = Mock()
+    monkeypatch.setattr("t3api_utils.main.utils.save_dicts_to_csv", Mock(return_value=Path("/tmp/output.csv")))
+    monkeypatch.setattr("t3api_utils.main.utils.open_file", mock_open)
 
     result = save_collection_to_csv(objects=[fake_obj], output_dir=".", open_after=True, strip_empty_columns=True)
 
@@ -402,12 +411,12 @@ def test_save_collection_to_csv_success(mock_save, mock_open):
 
 
 def test_save_collection_to_json_raises_on_empty():
-    with pytest.raises(ValueError, match="Cannot serialize an empty list of objects"):
+    with pytest.raises(ValueError, match=_EMPTY_COLLECTION_RE):
         save_collection_to_json(objects=[], output_dir=".")
 
 
 def test_save_collection_to_csv_raises_on_empty():
-    with pytest.raises(ValueError, match="Cannot serialize an empty list of objects"):
+    with pytest.raises(ValueError, match=_EMPTY_COLLECTION_RE):
         save_collection_to_csv(objects=[], output_dir=".")
 
 
@@ -437,10 +446,11 @@ class TestFilePickerUtilities:
         assert _format_file_size(1073741824) == "1.0 GB"
         assert _format_file_size(2147483648) == "2.0 GB"
 
-    @patch('t3api_utils.main.utils.datetime')
-    def test_format_file_time_today(self, mock_datetime):
+    def test_format_file_time_today(self, monkeypatch):
         """Test file time formatting for today's files."""
-        from datetime import datetime
+        mock_datetime = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.datetime", mock_datetime)
+
         now = datetime(2023, 12, 15, 14, 30, 0)
         mock_datetime.now.return_value = now
         mock_datetime.fromtimestamp.return_value = datetime(2023, 12, 15, 10, 15, 0)
@@ -448,10 +458,11 @@ class TestFilePickerUtilities:
         result = _format_file_time(1702638900.0)  # Mock timestamp
         assert result == "10:15"
 
-    @patch('t3api_utils.main.utils.datetime')
-    def test_format_file_time_this_year(self, mock_datetime):
+    def test_format_file_time_this_year(self, monkeypatch):
         """Test file time formatting for files from this year."""
-        from datetime import datetime
+        mock_datetime = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.datetime", mock_datetime)
+
         now = datetime(2023, 12, 15, 14, 30, 0)
         mock_datetime.now.return_value = now
         mock_datetime.fromtimestamp.return_value = datetime(2023, 11, 10, 10, 15, 0)
@@ -459,10 +470,11 @@ class TestFilePickerUtilities:
         result = _format_file_time(1699610100.0)  # Mock timestamp
         assert result == "11-10"
 
-    @patch('t3api_utils.main.utils.datetime')
-    def test_format_file_time_previous_year(self, mock_datetime):
+    def test_format_file_time_previous_year(self, monkeypatch):
         """Test file time formatting for files from previous years."""
-        from datetime import datetime
+        mock_datetime = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.datetime", mock_datetime)
+
         now = datetime(2023, 12, 15, 14, 30, 0)
         mock_datetime.now.return_value = now
         mock_datetime.fromtimestamp.return_value = datetime(2022, 11, 10, 10, 15, 0)
@@ -470,16 +482,20 @@ class TestFilePickerUtilities:
         result = _format_file_time(1668074100.0)  # Mock timestamp
         assert result == "2022"
 
-    @patch('t3api_utils.main.utils.datetime')
-    def test_format_file_time_invalid_timestamp(self, mock_datetime):
+    def test_format_file_time_invalid_timestamp(self, monkeypatch):
         """Test file time formatting with invalid timestamp."""
+        mock_datetime = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.datetime", mock_datetime)
+
         mock_datetime.fromtimestamp.side_effect = OSError("Invalid timestamp")
         result = _format_file_time(1234567890.0)
         assert result == "Unknown"
 
-    @patch('t3api_utils.main.utils.Path')
-    def test_discover_data_files_directory_not_exists(self, mock_path):
+    def test_discover_data_files_directory_not_exists(self, monkeypatch):
         """Test file discovery when directory doesn't exist."""
+        mock_path = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.Path", mock_path)
+
         mock_search_path = MagicMock()
         mock_search_path.exists.return_value = False
         mock_path.return_value.resolve.return_value = mock_search_path
@@ -491,9 +507,11 @@ class TestFilePickerUtilities:
 
         assert result == []
 
-    @patch('t3api_utils.main.utils.Path')
-    def test_discover_data_files_with_files(self, mock_path):
+    def test_discover_data_files_with_files(self, monkeypatch):
         """Test file discovery with existing files."""
+        mock_path = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.Path", mock_path)
+
         # Setup mock files
         mock_file1 = MagicMock()
         mock_file1.parts = ("data", "file1.csv")
@@ -522,9 +540,11 @@ class TestFilePickerUtilities:
         assert result[0] == mock_file2  # Newer file first
         assert result[1] == mock_file1
 
-    @patch('t3api_utils.main.utils.Path')
-    def test_discover_data_files_filters_hidden(self, mock_path):
+    def test_discover_data_files_filters_hidden(self, monkeypatch):
         """Test that hidden files are filtered out."""
+        mock_path = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.Path", mock_path)
+
         mock_visible_file = MagicMock()
         mock_visible_file.parts = ("data", "file.csv")
         mock_visible_file.stat.return_value.st_mtime = 1609459200.0
@@ -548,17 +568,16 @@ class TestFilePickerUtilities:
 
     def test_load_file_content_file_not_found(self):
         """Test loading content from non-existent file."""
-        from pathlib import Path
         non_existent_path = Path("/nonexistent/file.csv")
 
         with pytest.raises(FileNotFoundError, match="File not found"):
             _load_file_content(non_existent_path)
 
-    @patch('builtins.open')
-    @patch('t3api_utils.main.utils.json.load')
-    def test_load_file_content_json(self, mock_json_load, mock_open):
+    def test_load_file_content_json(self, monkeypatch):
         """Test loading JSON file content."""
-        from pathlib import Path
+        mock_json_load = MagicMock()
+        monkeypatch.setattr("builtins.open", MagicMock())
+        monkeypatch.setattr("t3api_utils.main.utils.json.load", mock_json_load)
 
         mock_data = {"key": "value", "numbers": [1, 2, 3]}
         mock_json_load.return_value = mock_data
@@ -577,11 +596,11 @@ class TestFilePickerUtilities:
         assert result["size"] == 100
         assert result["path"] == mock_path
 
-    @patch('builtins.open')
-    @patch('t3api_utils.main.utils.csv.DictReader')
-    def test_load_file_content_csv(self, mock_csv_reader, mock_open):
+    def test_load_file_content_csv(self, monkeypatch):
         """Test loading CSV file content."""
-        from pathlib import Path
+        mock_csv_reader = MagicMock()
+        monkeypatch.setattr("builtins.open", MagicMock())
+        monkeypatch.setattr("t3api_utils.main.utils.csv.DictReader", mock_csv_reader)
 
         mock_data = [{"name": "Alice", "age": "30"}, {"name": "Bob", "age": "25"}]
         mock_csv_reader.return_value = iter(mock_data)
@@ -599,10 +618,10 @@ class TestFilePickerUtilities:
         assert result["format"] == "csv"
         assert result["size"] == 50
 
-    @patch('builtins.open')
-    def test_load_file_content_txt(self, mock_open):
+    def test_load_file_content_txt(self, monkeypatch):
         """Test loading plain text file content."""
-        from pathlib import Path
+        mock_open = MagicMock()
+        monkeypatch.setattr("builtins.open", mock_open)
 
         mock_file = MagicMock()
         mock_file.read.return_value = "This is plain text content"
@@ -620,19 +639,18 @@ class TestFilePickerUtilities:
         assert result["content"] == "This is plain text content"
         assert result["format"] == "txt"
 
-    @patch('builtins.open')
-    @patch('t3api_utils.main.utils.json.loads')
-    def test_load_file_content_jsonl(self, mock_json_loads, mock_open):
+    def test_load_file_content_jsonl(self, monkeypatch):
         """Test loading JSONL file content."""
-        from pathlib import Path
+        mock_open = MagicMock()
+        mock_json_loads = MagicMock(side_effect=[{"id": 1}, {"id": 2}])
+        monkeypatch.setattr("builtins.open", mock_open)
+        monkeypatch.setattr("t3api_utils.main.utils.json.loads", mock_json_loads)
 
         # Mock file content with JSON lines
         mock_file = MagicMock()
         mock_file.__iter__.return_value = ['{"id": 1}\n', '{"id": 2}\n', '\n']
         mock_open.return_value.__enter__.return_value = mock_file
 
-        mock_json_loads.side_effect = [{"id": 1}, {"id": 2}]
-
         # Mock Path methods
         mock_path = MagicMock(spec=Path)
         mock_path.exists.return_value = True
@@ -645,14 +663,11 @@ class TestFilePickerUtilities:
         assert result["content"] == [{"id": 1}, {"id": 2}]
         assert result["format"] == "jsonl"
 
-    @patch('builtins.open')
-    @patch('t3api_utils.main.utils.json.load')
-    def test_load_file_content_invalid_json(self, mock_json_load, mock_open):
+    def test_load_file_content_invalid_json(self, monkeypatch):
         """Test loading invalid JSON file."""
-        import json
-        from pathlib import Path
-
-        mock_json_load.side_effect = json.JSONDecodeError("Invalid JSON", "doc", 0)
+        mock_json_load = MagicMock(side_effect=json.JSONDecodeError("Invalid JSON", "doc", 0))
+        monkeypatch.setattr("builtins.open", MagicMock())
+        monkeypatch.setattr("t3api_utils.main.utils.json.load", mock_json_load)
 
         # Mock Path methods
         mock_path = MagicMock(spec=Path)
@@ -667,12 +682,13 @@ class TestFilePickerUtilities:
 class TestPickFile:
     """Test the main pick_file function."""
 
-    @patch('t3api_utils.main.utils.typer.prompt')
-    @patch('t3api_utils.main.utils.console.print')
-    @patch('t3api_utils.main.utils._discover_data_files')
-    def test_pick_file_single_file_selection(self, mock_discover, mock_console, mock_prompt):
+    def test_pick_file_single_file_selection(self, monkeypatch):
         """Test selecting a single file from the picker."""
-        from pathlib import Path
+        mock_prompt = MagicMock(return_value=1)
+        mock_discover = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.typer.prompt", mock_prompt)
+        monkeypatch.setattr("t3api_utils.main.utils.console.print", MagicMock())
+        monkeypatch.setattr("t3api_utils.main.utils._discover_data_files", mock_discover)
 
         # Mock discovered file
         mock_file = MagicMock(spec=Path)
@@ -683,7 +699,6 @@ class TestPickFile:
         mock_file.relative_to.return_value = Path("test.csv")
 
         mock_discover.return_value = [mock_file]
-        mock_prompt.return_value = 1
 
         result = pick_file(load_content=False)
 
@@ -691,13 +706,15 @@ class TestPickFile:
         mock_discover.assert_called_once()
         mock_prompt.assert_called_once_with("Select file (number)", type=int)
 
-    @patch('t3api_utils.main.utils.typer.prompt')
-    @patch('t3api_utils.main.utils.console.print')
-    @patch('t3api_utils.main.utils._discover_data_files')
-    @patch('t3api_utils.main.utils._load_file_content')
-    def test_pick_file_with_content_loading(self, mock_load_content, mock_discover, mock_console, mock_prompt):
+    def test_pick_file_with_content_loading(self, monkeypatch):
         """Test selecting a file and loading its content."""
-        from pathlib import Path
+        mock_prompt = MagicMock(return_value=1)
+        mock_discover = MagicMock()
+        mock_load_content = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.typer.prompt", mock_prompt)
+        monkeypatch.setattr("t3api_utils.main.utils.console.print", MagicMock())
+        monkeypatch.setattr("t3api_utils.main.utils._discover_data_files", mock_discover)
+        monkeypatch.setattr("t3api_utils.main.utils._load_file_content", mock_load_content)
 
         # Mock discovered file
         mock_file = MagicMock(spec=Path)
@@ -708,7 +725,6 @@ class TestPickFile:
         mock_file.relative_to.return_value = Path("test.json")
 
         mock_discover.return_value = [mock_file]
-        mock_prompt.return_value = 1
 
         mock_file_data = {
             "path": mock_file,
@@ -723,13 +739,15 @@ class TestPickFile:
         assert result == mock_file_data
         mock_load_content.assert_called_once_with(mock_file)
 
-    @patch('t3api_utils.main.utils._handle_custom_path_input')
-    @patch('t3api_utils.main.utils.typer.prompt')
-    @patch('t3api_utils.main.utils.console.print')
-    @patch('t3api_utils.main.utils._discover_data_files')
-    def test_pick_file_custom_path_selection(self, mock_discover, mock_console, mock_prompt, mock_custom_path):
+    def test_pick_file_custom_path_selection(self, monkeypatch):
         """Test selecting the custom path option."""
-        from pathlib import Path
+        mock_custom_path = MagicMock()
+        mock_prompt = MagicMock(return_value=2)  # Select custom path option
+        mock_discover = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils._handle_custom_path_input", mock_custom_path)
+        monkeypatch.setattr("t3api_utils.main.utils.typer.prompt", mock_prompt)
+        monkeypatch.setattr("t3api_utils.main.utils.console.print", MagicMock())
+        monkeypatch.setattr("t3api_utils.main.utils._discover_data_files", mock_discover)
 
         # Mock one regular file plus custom option
         mock_file = MagicMock(spec=Path)
@@ -740,7 +758,6 @@ class TestPickFile:
         mock_file.relative_to.return_value = Path("test.csv")
 
         mock_discover.return_value = [mock_file]
-        mock_prompt.return_value = 2  # Select custom path option
 
         mock_custom_file = Path("/custom/path/file.json")
         mock_custom_path.return_value = mock_custom_file
@@ -750,41 +767,43 @@ class TestPickFile:
         assert result == mock_custom_file
         mock_custom_path.assert_called_once_with(load_content=False)
 
-    @patch('t3api_utils.main.utils.print_error')
-    @patch('t3api_utils.main.utils._discover_data_files')
-    def test_pick_file_no_files_no_custom_path(self, mock_discover, mock_print_error):
+    def test_pick_file_no_files_no_custom_path(self, monkeypatch):
         """Test behavior when no files found and custom path disabled."""
-        mock_discover.return_value = []
+        mock_print_error = MagicMock()
+        mock_discover = MagicMock(return_value=[])
+        monkeypatch.setattr("t3api_utils.main.utils.print_error", mock_print_error)
+        monkeypatch.setattr("t3api_utils.main.utils._discover_data_files", mock_discover)
 
         with pytest.raises(Exit):
             pick_file(allow_custom_path=False)
 
         mock_print_error.assert_called_once_with("No data files found in the specified directory.")
 
-    @patch('t3api_utils.main.utils.typer.prompt')
-    @patch('t3api_utils.main.utils._handle_custom_path_input')
-    @patch('t3api_utils.main.utils.console.print')
-    @patch('t3api_utils.main.utils._discover_data_files')
-    def test_pick_file_no_files_with_custom_path(self, mock_discover, mock_console, mock_custom_path, mock_prompt):
+    def test_pick_file_no_files_with_custom_path(self, monkeypatch):
         """Test behavior when no files found but custom path enabled."""
-        from pathlib import Path
+        mock_prompt = MagicMock(return_value=1)  # Select the only option (custom path)
+        mock_custom_path = MagicMock()
+        mock_discover = MagicMock(return_value=[])
+        monkeypatch.setattr("t3api_utils.main.utils.typer.prompt", mock_prompt)
+        monkeypatch.setattr("t3api_utils.main.utils._handle_custom_path_input", mock_custom_path)
+        monkeypatch.setattr("t3api_utils.main.utils.console.print", MagicMock())
+        monkeypatch.setattr("t3api_utils.main.utils._discover_data_files", mock_discover)
 
-        mock_discover.return_value = []
         mock_custom_file = Path("/custom/file.csv")
         mock_custom_path.return_value = mock_custom_file
-        mock_prompt.return_value = 1  # Select the only option (custom path)
 
         result = pick_file(allow_custom_path=True)
 
         assert result == mock_custom_file
         mock_custom_path.assert_called_once_with(load_content=False)
 
-    @patch('t3api_utils.main.utils.typer.prompt')
-    @patch('t3api_utils.main.utils.console.print')
-    @patch('t3api_utils.main.utils._discover_data_files')
-    def test_pick_file_invalid_selection(self, mock_discover, mock_console, mock_prompt):
+    def test_pick_file_invalid_selection(self, monkeypatch):
         """Test handling invalid file selection."""
-        from pathlib import Path
+        mock_prompt = MagicMock(side_effect=[99, 1])  # Invalid selection first, then valid
+        mock_discover = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.typer.prompt", mock_prompt)
+        monkeypatch.setattr("t3api_utils.main.utils.console.print", MagicMock())
+        monkeypatch.setattr("t3api_utils.main.utils._discover_data_files", mock_discover)
 
         mock_file = MagicMock(spec=Path)
         mock_file.name = "test.csv"
@@ -794,18 +813,18 @@ class TestPickFile:
         mock_file.relative_to.return_value = Path("test.csv")
 
         mock_discover.return_value = [mock_file]
-        mock_prompt.side_effect = [99, 1]  # Invalid selection first, then valid
 
         result = pick_file(load_content=False)
 
         assert result == mock_file
         assert mock_prompt.call_count == 2
 
-    @patch('t3api_utils.main.utils.typer.prompt')
-    @patch('t3api_utils.main.utils._discover_data_files')
-    def test_pick_file_keyboard_interrupt(self, mock_discover, mock_prompt):
+    def test_pick_file_keyboard_interrupt(self, monkeypatch):
         """Test handling keyboard interrupt."""
-        from pathlib import Path
+        mock_prompt = MagicMock(side_effect=KeyboardInterrupt())
+        mock_discover = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.typer.prompt", mock_prompt)
+        monkeypatch.setattr("t3api_utils.main.utils._discover_data_files", mock_discover)
 
         # Mock file with proper string returns for rendering
         mock_file = MagicMock(spec=Path)
@@ -816,46 +835,45 @@ class TestPickFile:
         mock_file.relative_to.return_value = Path("test.csv")
 
         mock_discover.return_value = [mock_file]
-        mock_prompt.side_effect = KeyboardInterrupt()
 
         with pytest.raises(Exit):
             pick_file()
 
-    def test_pick_file_with_custom_extensions(self):
+    def test_pick_file_with_custom_extensions(self, monkeypatch):
         """Test pick_file with custom file extensions."""
-        with patch('t3api_utils.main.utils._discover_data_files') as mock_discover:
-            mock_discover.return_value = []
-
-            with pytest.raises(Exit):
-                pick_file(
-                    file_extensions=[".xml", ".yaml"],
-                    allow_custom_path=False
-                )
+        mock_discover = MagicMock(return_value=[])
+        monkeypatch.setattr("t3api_utils.main.utils._discover_data_files", mock_discover)
 
-            mock_discover.assert_called_once_with(
-                search_directory=".",
+        with pytest.raises(Exit):
+            pick_file(
                 file_extensions=[".xml", ".yaml"],
-                include_subdirectories=False
+                allow_custom_path=False
             )
 
-    def test_pick_file_include_subdirectories(self):
-        """Test pick_file with subdirectory search enabled."""
-        with patch('t3api_utils.main.utils._discover_data_files') as mock_discover:
-            mock_discover.return_value = []
+        mock_discover.assert_called_once_with(
+            search_directory=".",
+            file_extensions=[".xml", ".yaml"],
+            include_subdirectories=False
+        )
 
-            with pytest.raises(Exit):
-                pick_file(
-                    search_directory="/data",
-                    include_subdirectories=True,
-                    allow_custom_path=False
-                )
+    def test_pick_file_include_subdirectories(self, monkeypatch):
+        """Test pick_file with subdirectory search enabled."""
+        mock_discover = MagicMock(return_value=[])
+        monkeypatch.setattr("t3api_utils.main.utils._discover_data_files", mock_discover)
 
-            mock_discover.assert_called_once_with(
+        with pytest.raises(Exit):
+            pick_file(
                 search_directory="/data",
-                file_extensions=[".csv", ".json", ".txt", ".tsv", ".jsonl"],
-                include_subdirectories=True
+                include_subdirectories=True,
+                allow_custom_path=False
             )
 
+        mock_discover.assert_called_once_with(
+            search_directory="/data",
+            file_extensions=[".csv", ".json", ".txt", ".tsv", ".jsonl"],
+            include_subdirectories=True
+        )
+
 
 class TestMatchCollectionFromCSV:
     """Test the collection matching functionality."""
@@ -882,9 +900,11 @@ class TestMatchCollectionFromCSV:
             {"unknown_field": "123", "status": "Active"}
         ]
 
-    @patch('t3api_utils.main.utils.pick_file')
-    def test_successful_matching(self, mock_pick_file):
+    def test_successful_matching(self, monkeypatch):
         """Test successful CSV matching with valid data."""
+        mock_pick_file = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.pick_file", mock_pick_file)
+
         mock_pick_file.return_value = {
             "content": self.valid_csv_content,
             "format": "csv",
@@ -901,9 +921,11 @@ class TestMatchCollectionFromCSV:
         assert result[1]["id"] == 789
         mock_pick_file.assert_called_once()
 
-    @patch('t3api_utils.main.utils.pick_file')
-    def test_column_validation_error(self, mock_pick_file):
+    def test_column_validation_error(self, monkeypatch):
         """Test error when CSV columns don't match collection fields."""
+        mock_pick_file = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.pick_file", mock_pick_file)
+
         mock_pick_file.return_value = {
             "content": self.invalid_csv_content,
             "format": "csv",
@@ -915,9 +937,11 @@ class TestMatchCollectionFromCSV:
                 data=self.sample_collection
             )
 
-    @patch('t3api_utils.main.utils.pick_file')
-    def test_no_matches_warn_behavior(self, mock_pick_file):
+    def test_no_matches_warn_behavior(self, monkeypatch):
         """Test behavior when no matches found with warn setting."""
+        mock_pick_file = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.pick_file", mock_pick_file)
+
         no_match_csv = [{"id": "999", "status": "Unknown"}]
         mock_pick_file.return_value = {
             "content": no_match_csv,
@@ -933,9 +957,11 @@ class TestMatchCollectionFromCSV:
         # Should return empty list
         assert result == []
 
-    @patch('t3api_utils.main.utils.pick_file')
-    def test_no_matches_error_behavior(self, mock_pick_file):
+    def test_no_matches_error_behavior(self, monkeypatch):
         """Test error behavior when no matches found with error setting."""
+        mock_pick_file = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.pick_file", mock_pick_file)
+
         no_match_csv = [{"id": "999", "status": "Unknown"}]
         mock_pick_file.return_value = {
             "content": no_match_csv,
@@ -949,9 +975,11 @@ class TestMatchCollectionFromCSV:
                 on_no_match="error"
             )
 
-    @patch('t3api_utils.main.utils.pick_file')
-    def test_no_matches_skip_behavior(self, mock_pick_file):
+    def test_no_matches_skip_behavior(self, monkeypatch):
         """Test skip behavior when no matches found."""
+        mock_pick_file = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.pick_file", mock_pick_file)
+
         mixed_csv = [
             {"id": "123", "status": "Active"},  # This will match
             {"id": "999", "status": "Unknown"}  # This won't match
@@ -971,9 +999,11 @@ class TestMatchCollectionFromCSV:
         assert len(result) == 1
         assert result[0]["id"] == 123
 
-    @patch('t3api_utils.main.utils.pick_file')
-    def test_multiple_field_matching(self, mock_pick_file):
+    def test_multiple_field_matching(self, monkeypatch):
         """Test matching on multiple CSV fields."""
+        mock_pick_file = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.pick_file", mock_pick_file)
+
         multi_field_csv = [
             {"id": "123", "name": "ProductA", "status": "Active"},
             {"id": "456", "name": "ProductB", "status": "Active"}  # Wrong status, won't match
@@ -992,9 +1022,11 @@ class TestMatchCollectionFromCSV:
         assert len(result) == 1
         assert result[0]["id"] == 123
 
-    @patch('t3api_utils.main.utils.pick_file')
-    def test_duplicate_removal(self, mock_pick_file):
+    def test_duplicate_removal(self, monkeypatch):
         """Test that duplicate matches are removed."""
+        mock_pick_file = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.pick_file", mock_pick_file)
+
         duplicate_csv = [
             {"status": "Active"},  # This will match multiple items
             {"category": "Electronics"}  # This will also match multiple items
@@ -1020,9 +1052,11 @@ class TestMatchCollectionFromCSV:
                 data=[]
             )
 
-    @patch('t3api_utils.main.utils.pick_file')
-    def test_empty_csv_error(self, mock_pick_file):
+    def test_empty_csv_error(self, monkeypatch):
         """Test error when CSV is empty."""
+        mock_pick_file = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.pick_file", mock_pick_file)
+
         mock_pick_file.return_value = {
             "content": [],
             "format": "csv",
@@ -1034,9 +1068,11 @@ class TestMatchCollectionFromCSV:
                 data=self.sample_collection
             )
 
-    @patch('t3api_utils.main.utils.pick_file')
-    def test_invalid_csv_format_error(self, mock_pick_file):
+    def test_invalid_csv_format_error(self, monkeypatch):
         """Test error when CSV format is invalid."""
+        mock_pick_file = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.pick_file", mock_pick_file)
+
         mock_pick_file.return_value = {
             "content": "invalid_format",
             "format": "csv",
@@ -1048,19 +1084,21 @@ class TestMatchCollectionFromCSV:
                 data=self.sample_collection
             )
 
-    @patch('t3api_utils.main.utils.pick_file')
-    def test_file_selection_cancelled(self, mock_pick_file):
+    def test_file_selection_cancelled(self, monkeypatch):
         """Test behavior when file selection is cancelled."""
-        mock_pick_file.side_effect = Exit(code=1)
+        mock_pick_file = MagicMock(side_effect=Exit(code=1))
+        monkeypatch.setattr("t3api_utils.main.utils.pick_file", mock_pick_file)
 
         with pytest.raises(Exit):
             match_collection_from_csv(
                 data=self.sample_collection
             )
 
-    @patch('t3api_utils.main.utils.pick_file')
-    def test_string_conversion_matching(self, mock_pick_file):
+    def test_string_conversion_matching(self, monkeypatch):
         """Test that values are converted to strings for comparison."""
+        mock_pick_file = MagicMock()
+        monkeypatch.setattr("t3api_utils.main.utils.pick_file", mock_pick_file)
+
         # Collection with mixed types
         mixed_collection = [
             {"id": 123, "name": "Product", "active": True,
@@ -1,71 +1,171 @@
 """Unit and integration tests for OpenAPI functionality."""
 
 import json
-from typing import Any, Dict
-from unittest.mock import Mock, patch
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+from unittest.mock import AsyncMock, Mock, patch
 import pytest
 import httpx
 
+from t3api_utils.openapi import spec_fetcher
 from t3api_utils.openapi.spec_fetcher import (
+    afetch_openapi_spec,
+    aget_collection_endpoints,
     fetch_openapi_spec,
     parse_collection_endpoints,
     get_collection_endpoints,
     _determine_category,
     _create_display_name,
+    _default_cache_dir,
     _is_collection_endpoint,
+    _loads_json,
+    _spec_cache_paths,
 )
 
+SPEC_URL = "https://api.trackandtrace.tools/v2/spec/openapi.json"
+
+
+def _mock_client(handler: Callable[[httpx.Request], httpx.Response]) -> httpx.Client:
+    """Build a spec client whose requests are answered in-process by ``handler``."""
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def _spec_response(content: bytes) -> SimpleNamespace:
+    """Stand-in for a 200 spec response; only the fields the fetcher reads on success."""
+    return SimpleNamespace(status_code=200, content=content, headers={})
+
+
+@pytest.fixture(autouse=True)
+def isolated_spec_cache(tmp_path):
+    """Point the on-disk spec cache at a per-test temporary directory and use a fresh spec client."""
+    with patch("t3api_utils.openapi.spec_fetcher.SPEC_CACHE_DIR", tmp_path), \
+            patch("t3api_utils.openapi.spec_fetcher._CLIENT", None), \
+            patch.dict("t3api_utils.openapi.spec_fetcher._PARSED_ENDPOINTS", clear=True):
+        yield tmp_path
+        # Close any pooled client the test created before _CLIENT is restored
+        spec_fetcher._close_client()
+
 
 class TestOpenAPISpecFetcher:
     """Unit tests for OpenAPI spec fetching."""
 
-    @patch("t3api_utils.openapi.spec_fetcher.httpx.Client")
-    def test_fetch_openapi_spec_success(self, mock_client_class):
+    def test_fetch_openapi_spec_success(self):
         """Test successful OpenAPI spec fetch."""
-        # Mock response
-        mock_response = Mock()
-        mock_response.json.return_value = {"openapi": "3.0.0", "paths": {}}
-        mock_response.raise_for_status.return_value = None
+        requests: List[httpx.Request] = []
 
-        # Mock client
-        mock_client = Mock()
-        mock_client.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=b'{"openapi": "3.0.0", "paths": {}}')
 
-        result = fetch_openapi_spec()
+        with _mock_client(handler) as client:
+            result = fetch_openapi_spec(client=client)
 
         assert result == {"openapi": "3.0.0", "paths": {}}
-        mock_client.get.assert_called_once_with("https://api.trackandtrace.tools/v2/spec/openapi.json")
+        assert [str(request.url) for request in requests] == [SPEC_URL]
+        assert "If-None-Match" not in requests[0].headers
 
-    @patch("t3api_utils.openapi.spec_fetcher.httpx.Client")
-    @patch("t3api_utils.openapi.spec_fetcher.sys.exit")
-    def test_fetch_openapi_spec_http_error(self, mock_exit, mock_client_class):
+    def test_fetch_openapi_spec_writes_cache(self):
+        """Test a fetched spec is cached together with its ETag."""
+        content = b'{"openapi": "3.0.0", "paths": {}}'
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=content, headers={"ETag": '"abc123"'})
+
+        with _mock_client(handler) as client:
+            fetch_openapi_spec(client=client)
+
+        spec_path, meta_path = _spec_cache_paths(SPEC_URL)
+        assert spec_path.read_bytes() == content
+        assert json.loads(meta_path.read_text()) == {"etag": '"abc123"', "last_modified": None}
+
+    def test_fetch_openapi_spec_not_modified_uses_cache(self):
+        """Test a 304 response reuses the cached spec body."""
+        spec_path, meta_path = _spec_cache_paths(SPEC_URL)
+        spec_path.write_bytes(b'{"openapi": "3.1.0", "paths": {}}')
+        meta_path.write_text(json.dumps({"etag": '"abc123"', "last_modified": "Tue, 01 Oct 2024 00:00:00 GMT"}))
+        requests: List[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(304)
+
+        with _mock_client(handler) as client:
+            result = fetch_openapi_spec(client=client)
+
+        assert result == {"openapi": "3.1.0", "paths": {}}
+        assert len(requests) == 1
+        assert requests[0].headers["If-None-Match"] == '"abc123"'
+        assert requests[0].headers["If-Modified-Since"] == "Tue, 01 Oct 2024 00:00:00 GMT"
+
+    def test_fetch_openapi_spec_http_error(self):
         """Test OpenAPI spec fetch with HTTP error."""
-        # Mock client that raises HTTP error
-        mock_client = Mock()
-        mock_client.get.side_effect = httpx.HTTPError("Connection failed")
-        mock_client_class.return_value.__enter__.return_value = mock_client
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection failed", request=request)
 
-        fetch_openapi_spec()
+        with _mock_client(handler) as client, pytest.raises(SystemExit) as exc_info:
+            fetch_openapi_spec(client=client)
 
-        mock_exit.assert_called_once_with(1)
+        assert exc_info.value.code == 1
+
+    def test_fetch_openapi_spec_error_status(self):
+        """Test a non-success status raises through raise_for_status and exits."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(503)
+
+        with _mock_client(handler) as client, pytest.raises(SystemExit) as exc_info:
+            fetch_openapi_spec(client=client)
+
+        assert exc_info.value.code == 1
 
-    @patch("t3api_utils.openapi.spec_fetcher.httpx.Client")
     @patch("t3api_utils.openapi.spec_fetcher.sys.exit")
-    def test_fetch_openapi_spec_json_error(self, mock_exit, mock_client_class):
+    def test_fetch_openapi_spec_json_error(self, mock_exit):
         """Test OpenAPI spec fetch with JSON parsing error."""
-        # Mock response with invalid JSON
-        mock_response = Mock()
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-        mock_response.raise_for_status.return_value = None
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"{not valid json")
+
+        with _mock_client(handler) as client:
+            fetch_openapi_spec(client=client)
+
+        mock_exit.assert_called_once_with(1)
+
+    @patch("t3api_utils.openapi.spec_fetcher.orjson", None)
+    def test_loads_json_falls_back_to_stdlib(self):
+        """Test JSON decoding falls back to the stdlib when orjson is missing."""
+        assert _loads_json(b'{"paths": {}}') == {"paths": {}}
+
+        with pytest.raises(json.JSONDecodeError):
+            _loads_json(b"{not valid json")
 
+
+    @patch("t3api_utils.openapi.spec_fetcher.console")
+    def test_fetch_openapi_spec_quiet_below_info(self, mock_console):
+        """Test status output is suppressed when INFO logging is disabled."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b'{"openapi": "3.0.0", "paths": {}}')
+
+        with _mock_client(handler) as client, \
+                patch.object(spec_fetcher.logger, "isEnabledFor", return_value=False) as mock_enabled:
+            fetch_openapi_spec(client=client)
+
+        mock_enabled.assert_called_with(logging.INFO)
+        mock_console.print.assert_not_called()
+
+    @patch("t3api_utils.openapi.spec_fetcher.httpx.Client")
+    def test_fetch_openapi_spec_reuses_client(self, mock_client_class):
+        """Test repeated fetches share one pooled client."""
         mock_client = Mock()
-        mock_client.get.return_value = mock_response
-        mock_client_class.return_value.__enter__.return_value = mock_client
+        mock_client.is_closed = False
+        mock_client.get.return_value = _spec_response(b'{"openapi": "3.0.0", "paths": {}}')
+        mock_client_class.return_value = mock_client
 
+        fetch_openapi_spec()
         fetch_openapi_spec()
 
-        mock_exit.assert_called_once_with(1)
+        mock_client_class.assert_called_once()
+        assert mock_client.get.call_count == 2
+        assert isinstance(mock_client_class.call_args.kwargs["transport"], httpx.HTTPTransport)
 
 
 class TestCollectionEndpointParser:
@@ -126,6 +226,41 @@ class TestCollectionEndpointParser:
         assert licenses_endpoint["name"] == "Get Licenses"
         assert licenses_endpoint["category"] == "Licenses"
 
+    def test_parse_collection_endpoints_skips_non_get_operations(self):
+        """Test only GET operations are considered collection endpoints."""
+        paged = {"parameters": [{"name": "page", "type": "integer"}]}
+        spec = {
+            "paths": {
+                "/v2/packages/active": {
+                    "parameters": [{"name": "licenseNumber", "type": "string"}],
+                    "get": {"summary": "Get Active Packages", **paged},
+                    "post": {"summary": "Create Packages", **paged},
+                },
+                "/v2/packages/notes": {
+                    "put": {"summary": "Update Notes", **paged},
+                },
+            }
+        }
+
+        endpoints = parse_collection_endpoints(spec)
+
+        assert [(e["method"], e["name"]) for e in endpoints] == [("GET", "Get Active Packages")]
+
+    def test_parse_collection_endpoints_shares_category_strings(self):
+        """Test endpoints in the same category reference one interned string."""
+        paged = {"parameters": [{"name": "page", "type": "integer"}]}
+        spec = json.loads(json.dumps({
+            "paths": {
+                "/v2/packages/active": {"get": {"tags": ["Packages"], **paged}},
+                "/v2/packages/inactive": {"get": {"tags": ["Packages"], **paged}},
+            }
+        }))
+
+        first, second = parse_collection_endpoints(spec)
+
+        assert first["category"] is second["category"]
+        assert first["method"] is second["method"]
+
     @patch("t3api_utils.openapi.spec_fetcher.sys.exit")
     def test_parse_collection_endpoints_none_found(self, mock_exit):
         """Test parsing when no collection endpoints are found."""
@@ -187,6 +322,17 @@ class TestIsCollectionEndpoint:
         }
         assert _is_collection_endpoint(operation, "/v2/packages/history") is False
 
+    def test_is_collection_endpoint_with_id_param_after_page(self):
+        """Test ID parameters are honoured regardless of parameter order."""
+        operation = {
+            "parameters": [
+                {"name": "page", "type": "integer"},
+                {"name": "licenseNumber", "type": "string"},
+                {"name": "transferId", "type": "string"},
+            ]
+        }
+        assert _is_collection_endpoint(operation, "/v2/transfers/deliveries") is False
+
     def test_is_collection_endpoint_report_excluded(self):
         """Test report endpoints are excluded."""
         operation = {
@@ -237,59 +383,121 @@ class TestIsCollectionEndpoint:
 class TestHelperFunctions:
     """Unit tests for helper functions."""
 
-    def test_determine_category_from_tags(self):
-        """Test category determination from tags."""
-        assert _determine_category("/v2/packages", ["Packages"]) == "Packages"
-        assert _determine_category("/v2/licenses", ["Licenses"]) == "Licenses"
-
-    def test_determine_category_from_path(self):
-        """Test category determination from path when no other tags."""
-        assert _determine_category("/v2/packages/active", []) == "Packages"
-        assert _determine_category("/v2/licenses", []) == "Licenses"
-
-    def test_determine_category_fallback(self):
-        """Test category determination fallback."""
-        assert _determine_category("/", []) == "General"
-        assert _determine_category("/v2", []) == "General"
-
-    def test_create_display_name_from_summary(self):
-        """Test display name creation from summary."""
-        assert _create_display_name("Get Active Packages", "/v2/packages/active") == "Get Active Packages"
-
-    def test_create_display_name_from_path(self):
-        """Test display name creation from path."""
-        assert _create_display_name("", "/v2/packages/active") == "Packages Active"
-        assert _create_display_name("", "/v2/lab-tests") == "Lab Tests"
-
-    def test_create_display_name_fallback(self):
-        """Test display name fallback to path."""
-        assert _create_display_name("", "/") == "/"
-        assert _create_display_name("", "/v2") == "/v2"
+    @pytest.mark.parametrize(
+        ("path", "tags", "expected"),
+        [
+            ("/v2/packages", ("Packages",), "Packages"),
+            ("/v2/licenses", ("Licenses",), "Licenses"),
+            ("/v2/packages", ("Collection", "Packages"), "Packages"),
+            ("/v2/packages/active", (), "Packages"),
+            ("/v2/licenses", (), "Licenses"),
+            ("/", (), "General"),
+            ("/v2", (), "General"),
+        ],
+        ids=["tag", "tag_licenses", "tag_after_collection", "path", "path_licenses", "fallback_root", "fallback_version"],
+    )
+    def test_determine_category(self, path, tags, expected):
+        """Test category comes from tags, then the path, then falls back to General."""
+        assert _determine_category(path, tags) == expected
+
+    @pytest.mark.parametrize(
+        ("summary", "path", "expected"),
+        [
+            ("Get Active Packages", "/v2/packages/active", "Get Active Packages"),
+            ("", "/v2/packages/active", "Packages Active"),
+            ("", "/v2/lab-tests", "Lab Tests"),
+            ("", "/", "/"),
+            ("", "/v2", "/v2"),
+        ],
+        ids=["summary", "path", "path_hyphenated", "fallback_root", "fallback_version"],
+    )
+    def test_create_display_name(self, summary, path, expected):
+        """Test display name comes from the summary, then the path, then the raw path."""
+        assert _create_display_name(summary, path) == expected
+
+    @pytest.mark.parametrize(
+        ("os_name", "env", "expected_root"),
+        [
+            ("posix", {"XDG_CACHE_HOME": "/xdg"}, "/xdg"),
+            ("nt", {"XDG_CACHE_HOME": "/xdg", "LOCALAPPDATA": "/local"}, "/xdg"),
+            ("nt", {"LOCALAPPDATA": "/local"}, "/local"),
+            ("posix", {"LOCALAPPDATA": "/local"}, None),
+            ("posix", {}, None),
+        ],
+        ids=["xdg", "xdg_over_localappdata", "localappdata", "localappdata_ignored_off_windows", "home_fallback"],
+    )
+    def test_default_cache_dir(self, monkeypatch, tmp_path, os_name, env, expected_root):
+        """Test the cache root honours XDG_CACHE_HOME, then LOCALAPPDATA on Windows, then ~/.cache."""
+        monkeypatch.setattr(spec_fetcher, "os", SimpleNamespace(name=os_name, environ=env))
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        root = Path(expected_root) if expected_root else tmp_path / ".cache"
+        assert _default_cache_dir() == root / "t3api-utils"
 
 
 class TestIntegrationGetCollectionEndpoints:
     """Integration tests for the main function."""
 
-    @patch("t3api_utils.openapi.spec_fetcher.fetch_openapi_spec")
-    def test_get_collection_endpoints_integration(self, mock_fetch):
-        """Test the full integration of fetching and parsing."""
-        mock_fetch.return_value = {
-            "paths": {
-                "/v2/packages/active": {
-                    "get": {
-                        "tags": ["Packages"],
-                        "summary": "Get Active Packages",
-                        "parameters": [
-                            {"name": "licenseNumber", "type": "string"},
-                            {"name": "page", "type": "integer"}
-                        ]
-                    }
+    SPEC_CONTENT = json.dumps({
+        "paths": {
+            "/v2/packages/active": {
+                "get": {
+                    "tags": ["Packages"],
+                    "summary": "Get Active Packages",
+                    "parameters": [
+                        {"name": "licenseNumber", "type": "string"},
+                        {"name": "page", "type": "integer"}
+                    ]
                 }
             }
         }
+    }).encode()
+
+    def test_get_collection_endpoints_integration(self, monkeypatch):
+        """Test the full integration of fetching and parsing."""
+        monkeypatch.setattr(spec_fetcher, "_fetch_spec_content", lambda: self.SPEC_CONTENT)
 
         endpoints = get_collection_endpoints()
 
         assert len(endpoints) == 1
         assert endpoints[0]["path"] == "/v2/packages/active"
-        assert endpoints[0]["name"] == "Get Active Packages"
\ No newline at end of file
+        assert endpoints[0]["name"] == "Get Active Packages"
+
+    @patch("t3api_utils.openapi.spec_fetcher.parse_collection_endpoints",
+           wraps=parse_collection_endpoints)
+    @patch("t3api_utils.openapi.spec_fetcher._fetch_spec_content")
+    def test_get_collection_endpoints_reuses_parse_for_same_spec(self, mock_fetch, mock_parse):
+        """Test an unchanged spec is parsed only once per process."""
+        mock_fetch.return_value = self.SPEC_CONTENT
+
+        first = get_collection_endpoints()
+        second = get_collection_endpoints()
+
+        assert first == second
+        assert first is not second
+        mock_parse.assert_called_once()
+
+    @patch("t3api_utils.openapi.spec_fetcher.httpx.AsyncClient")
+    @pytest.mark.asyncio
+    async def test_aget_collection_endpoints(self, mock_async_client_class):
+        """Test the async variant fetches via AsyncClient and parses endpoints."""
+        mock_client = SimpleNamespace(get=AsyncMock(return_value=_spec_response(self.SPEC_CONTENT)))
+        mock_async_client_class.return_value.__aenter__.return_value = mock_client
+
+        endpoints = await aget_collection_endpoints()
+
+        assert [e["path"] for e in endpoints] == ["/v2/packages/active"]
+        mock_client.get.assert_awaited_once_with(SPEC_URL, headers={})
+
+    @patch("t3api_utils.openapi.spec_fetcher.httpx.AsyncClient")
+    @pytest.mark.asyncio
+    async def test_afetch_openapi_spec_http_error(self, mock_async_client_class):
+        """Test the async fetch exits on HTTP errors like the sync one."""
+        mock_client = Mock()
+        mock_client.get = AsyncMock(side_effect=httpx.HTTPError("Connection failed"))
+        mock_async_client_class.return_value.__aenter__.return_value = mock_client
+
+        with pytest.raises(SystemExit) as exc_info:
+            await afetch_openapi_spec()
+
+        assert exc_info.value.code == 1
@@ -1,9 +1,11 @@
 """Integration tests for OpenAPI functionality against live API."""
 
 from typing import Dict, List
+from unittest.mock import patch
 import pytest
 import httpx
 
+from t3api_utils.openapi import spec_fetcher
 from t3api_utils.openapi.spec_fetcher import (
     fetch_openapi_spec,
     get_collection_endpoints,
@@ -11,6 +13,17 @@ from t3api_utils.openapi.spec_fetcher import (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_spec_cache(tmp_path):
+    """Point the on-disk spec cache at a per-test temporary directory and use a fresh spec client."""
+    with patch("t3api_utils.openapi.spec_fetcher.SPEC_CACHE_DIR", tmp_path), \
+            patch("t3api_utils.openapi.spec_fetcher._CLIENT", None), \
+            patch.dict("t3api_utils.openapi.spec_fetcher._PARSED_ENDPOINTS", clear=True):
+        yield tmp_path
+        # Close any pooled client the test created before _CLIENT is restored
+        spec_fetcher._close_client()
+
+
 class TestLiveAPIIntegration:
     """Integration tests against the live T3 API."""
 
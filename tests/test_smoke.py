@@ -1,33 +1,16 @@
-import pytest
-
-
-def test_import_t3api_utils():
-    import t3api_utils  # Ensure the top-level package is importable
-
-
-def test_import_main_module():
-    from t3api_utils.main import utils
-
-
-def test_import_cli_module():
-    from t3api_utils.cli import utils
+import importlib
 
-
-def test_import_auth_module():
-    from t3api_utils.auth import utils
-
-
-def test_import_file_module():
-    from t3api_utils.file import utils
-
-
-def test_import_collection_module():
-    from t3api_utils.collection import utils
+import pytest
 
 
-class DummyPrompt:
-    def __init__(self, value: str):
-        self.value = value
+@pytest.mark.parametrize("module", [
+    "t3api_utils",
+    "t3api_utils.main.utils",
+    "t3api_utils.cli.utils",
+    "t3api_utils.auth.utils",
+    "t3api_utils.file.utils",
+    "t3api_utils.collection.utils",
+])
+def test_import(module):
+    importlib.import_module(module)
 
-    def ask(self):
-        return self.value
@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock, patch
 import pytest
+from rich.console import Console
+from rich.text import Text
 
 from t3api_utils.style.messages import (
     print_success, print_error, print_warning, print_info, print_progress,
@@ -22,45 +24,62 @@ class TestStyleMessages:
     def test_print_success(self, mock_console):
         """Test success message printing."""
         print_success("Operation completed")
-        mock_console.print.assert_called_once_with(f"{SUCCESS_SYMBOL} Operation completed")
+        mock_console.print.assert_called_once_with(Text.from_markup(SUCCESS_SYMBOL), "Operation completed")
 
     @patch('t3api_utils.style.messages.console')
     def test_print_error(self, mock_console):
         """Test error message printing."""
         print_error("Something went wrong")
-        mock_console.print.assert_called_once_with(f"{ERROR_SYMBOL} Something went wrong")
+        mock_console.print.assert_called_once_with(Text.from_markup(ERROR_SYMBOL), "Something went wrong")
 
     @patch('t3api_utils.style.messages.console')
     def test_print_warning(self, mock_console):
         """Test warning message printing."""
         print_warning("This is a warning")
-        mock_console.print.assert_called_once_with(f"{WARNING_SYMBOL} This is a warning")
+        mock_console.print.assert_called_once_with(Text.from_markup(WARNING_SYMBOL), "This is a warning")
 
     @patch('t3api_utils.style.messages.console')
     def test_print_info(self, mock_console):
         """Test info message printing."""
         print_info("Here's some info")
-        mock_console.print.assert_called_once_with(f"{INFO_SYMBOL} Here's some info")
+        mock_console.print.assert_called_once_with(Text.from_markup(INFO_SYMBOL), "Here's some info")
 
     @patch('t3api_utils.style.messages.console')
     def test_print_progress(self, mock_console):
         """Test progress message printing."""
         print_progress("Processing...")
-        mock_console.print.assert_called_once_with(f"{PROGRESS_SYMBOL} Processing...")
+        mock_console.print.assert_called_once_with(Text.from_markup(PROGRESS_SYMBOL), "Processing...")
 
     @patch('t3api_utils.style.messages.console')
     def test_print_header(self, mock_console):
         """Test main header printing."""
         print_header("Main Title")
-        expected = f"{MAIN_HEADER_PREFIX} Main Title {MAIN_HEADER_SUFFIX}"
-        mock_console.print.assert_called_once_with(expected)
+        mock_console.print.assert_called_once_with(
+            Text.from_markup(MAIN_HEADER_PREFIX), "Main Title", Text.from_markup(MAIN_HEADER_SUFFIX)
+        )
 
     @patch('t3api_utils.style.messages.console')
     def test_print_subheader(self, mock_console):
         """Test subheader printing."""
         print_subheader("Section Title")
-        expected = f"{SUB_HEADER_PREFIX} Section Title {SUB_HEADER_SUFFIX}"
-        mock_console.print.assert_called_once_with(expected)
+        mock_console.print.assert_called_once_with(
+            Text.from_markup(SUB_HEADER_PREFIX), "Section Title", Text.from_markup(SUB_HEADER_SUFFIX)
+        )
+
+    def test_prefixed_output_matches_inline_markup(self):
+        """Test pre-parsed prefixes render exactly like the inline markup did."""
+        test_console = Console(force_terminal=True, width=80)
+
+        with patch('t3api_utils.style.messages.console', test_console):
+            with test_console.capture() as captured:
+                print_success("Saved [cyan]file.csv[/cyan]")
+                print_header("Title")
+
+        with test_console.capture() as expected:
+            test_console.print(f"{SUCCESS_SYMBOL} Saved [cyan]file.csv[/cyan]")
+            test_console.print(f"{MAIN_HEADER_PREFIX} Title {MAIN_HEADER_SUFFIX}")
+
+        assert captured.get() == expected.get()
 
     @patch('t3api_utils.style.messages.console')
     def test_print_menu_item(self, mock_console):